@@ -93,6 +93,14 @@ class Settings(BaseSettings):
     # ad-hoc bookings back on the original Selenium flow.
     walden_fast_booking_immediate: bool = True
 
+    # Book a batch on several browser sessions at once (up to the driver pool
+    # size, each taking a contiguous run of the time-sorted requests) instead
+    # of one after another on a single session. Off by default: parallel sessions cannot
+    # see each other's bookings, so a fallback slot is kept off every other
+    # session's targets but not off the fallbacks they end up taking, and the
+    # club's handling of simultaneous reservations by one member is untested.
+    walden_parallel_batch_booking: bool = False
+
     user_phone_number: str = ""
 
     database_url: str = "sqlite+aiosqlite:///./teetime.db"
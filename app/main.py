@@ -89,9 +89,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             "Set SCHEDULER_API_KEY environment variable for production use."
         )
 
+    warm_pool_task: asyncio.Task[None] | None = None
     if settings.walden_member_number and settings.walden_password:
         logger.info("Walden Golf credentials configured - using real WaldenGolfProvider")
-        provider: ReservationProvider = WaldenGolfProvider()
+        walden_provider = WaldenGolfProvider()
+        # Start the pooled browsers in the background so the first booking finds
+        # a running Chrome, without holding up startup for Chrome's launch.
+        warm_pool_task = asyncio.create_task(
+            walden_provider.warm_driver_pool(), name="warm-driver-pool"
+        )
+        provider: ReservationProvider = walden_provider
     else:
         logger.warning(
             "Walden Golf credentials not configured - using MockWaldenProvider. "
@@ -124,6 +131,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await booking_service.wait_for_background_bookings(timeout=SHUTDOWN_BOOKING_TIMEOUT_SECONDS)
     if discord_gateway is not None:
         await discord_gateway.stop()
+    # Not cancelled: the browsers start in worker threads that would carry on
+    # regardless, and a driver that never reached the pool would not be quit.
+    # Waiting lets close() drain them with the rest.
+    if warm_pool_task is not None:
+        await warm_pool_task
     await provider.close()
 
 
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date, datetime, time
@@ -69,6 +70,32 @@ class ReservationProvider(ABC):
         """Get available tee times for a given date."""
         pass
 
+    async def get_available_times_batch(
+        self, target_dates: list[date], max_concurrency: int = 2
+    ) -> dict[date, list[time]]:
+        """
+        Get available tee times for several dates concurrently.
+
+        Each lookup is independent and spends its time waiting on the site, so
+        up to max_concurrency run at once. Each may drive its own browser, which
+        is why the bound stays small.
+
+        Args:
+            target_dates: Dates to check; duplicates are looked up once
+            max_concurrency: Maximum lookups in flight at a time
+
+        Returns:
+            Available times keyed by date, in the order the dates were given
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def lookup(target_date: date) -> tuple[date, list[time]]:
+            async with semaphore:
+                return target_date, await self.get_available_times(target_date)
+
+        results = await asyncio.gather(*(lookup(d) for d in dict.fromkeys(target_dates)))
+        return dict(results)
+
     @abstractmethod
     async def book_multiple_tee_times(
         self,
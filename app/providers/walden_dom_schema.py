@@ -285,7 +285,7 @@ class TBDGuestSelectors:
     )
     # Player rows wait selector
     player_rows_wait: str = "[id*='playersTable'] tbody tr, table[id*='player'] tbody tr"
-    # TBD button CSS selectors (tried per row, in order)
+    # TBD button CSS selectors (queried per row as one union; any match is a TBD control)
     tbd_button_css: tuple[str, ...] = (
         "a[id*='tbd']",
         "span[id*='tbd']",
@@ -298,6 +298,9 @@ class TBDGuestSelectors:
         "span[id*='TBD']",
         "button[id*='TBD']",
         "[class*='TBD']",
+    )
+    # Generic command buttons, only consulted when no TBD-specific control matched
+    tbd_button_generic_css: tuple[str, ...] = (
         "a.ui-commandlink",
         "button.ui-button",
     )
@@ -432,7 +435,9 @@ class CancellationSelectors:
         "a[class*='cancel'], "
         "button[class*='cancel']"
     )
-    # Confirm cancellation CSS selectors (tried in order)
+    # Any link labelled or titled "cancel", case-insensitively, when cancel_link misses
+    cancel_link_fallback: str = "a[aria-label*='cancel' i], a[title*='cancel' i]"
+    # Confirm cancellation CSS selectors (queried as one comma-joined union)
     confirm_css: tuple[str, ...] = (
         "button[class*='confirm']",
         "button[class*='yes']",
@@ -440,7 +445,7 @@ class CancellationSelectors:
         "input[type='submit'][value*='Confirm']",
         ".modal button[class*='primary']",
     )
-    # Confirm cancellation XPath fallbacks (tried in order)
+    # Confirm cancellation XPath fallbacks (queried as one "|" union)
     confirm_xpaths: tuple[str, ...] = (
         "//button[contains(text(), 'Yes')]",
         "//button[contains(text(), 'Confirm')]",
@@ -1,19 +1,25 @@
 import asyncio
+import calendar
 import functools
 import logging
 import os
+import queue
+import random
 import re
+import threading
 import time as time_module
 from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, time, timedelta
-from typing import Any, TypeVar
+from itertools import accumulate
+from typing import Any, TypeVar, cast
 
-import google.auth
 import httpx
-from google.auth.transport.requests import Request as GoogleAuthRequest
 from selenium import webdriver
 from selenium.common.exceptions import (
     ElementClickInterceptedException,
+    InvalidArgumentException,
+    NoAlertPresentException,
     NoSuchElementException,
     StaleElementReferenceException,
     TimeoutException,
@@ -21,11 +27,11 @@ from selenium.common.exceptions import (
 )
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.alert import Alert
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions
 from selenium.webdriver.support.ui import Select, WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
 from app.config import settings
 from app.providers.base import (
@@ -50,10 +56,13 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# DOM churn that a retry genuinely recovers from: the element was re-rendered
+# or briefly covered. A TimeoutException usually means the thing waited for is
+# not coming (no slot, no modal), so retrying it only spends seconds on the
+# 6:30 path.
 TRANSIENT_EXCEPTIONS = (
     StaleElementReferenceException,
     ElementClickInterceptedException,
-    TimeoutException,
 )
 
 
@@ -61,16 +70,22 @@ def with_retry(
     max_attempts: int = 3,
     backoff_base: float = 0.5,
     exceptions: tuple[type[Exception], ...] = TRANSIENT_EXCEPTIONS,
+    max_delay: float = 30.0,
+    jitter: float = 0.5,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     Decorator for retrying operations that may fail due to transient Selenium issues.
 
-    Uses exponential backoff between attempts. Only retries on specified exception types.
+    Uses exponential backoff between attempts, capped and randomized so that
+    bookings failing together do not retry in lockstep. Only retries on
+    specified exception types.
 
     Args:
         max_attempts: Maximum number of attempts (default 3)
         backoff_base: Base delay in seconds, doubled each attempt (default 0.5)
         exceptions: Tuple of exception types to retry on
+        max_delay: Upper bound on the un-jittered delay in seconds (default 30)
+        jitter: Fraction of the delay randomly added or removed (default 0.5)
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
@@ -86,7 +101,8 @@ def with_retry(
                 except exceptions as e:
                     last_exception = e
                     if attempt < max_attempts - 1:
-                        delay = backoff_base * (2**attempt)
+                        delay = min(max_delay, backoff_base * (2**attempt))
+                        delay = max(0.0, delay * (1 + random.uniform(-jitter, jitter)))
                         logger.warning(
                             f"Attempt {attempt + 1}/{max_attempts} failed for {func.__name__}: {e}. "
                             f"Retrying in {delay:.1f}s..."
@@ -135,11 +151,11 @@ function findVisibleBlockedPopup() {
 
 # Shared async booking chain used by both the fast path (subsequent batch
 # bookings) and the timed path (the 6:30:00 race). Runs via
-# execute_async_script: every wait is setTimeout-based so the page event loop
-# keeps running between polls. This is essential - the things the chain waits
-# for (the site's own timer removing the 'disable-div' overlay at 6:30, the
-# PrimeFaces AJAX response that renders the player page, the blocked-slot
-# popup) are all delivered BY that event loop. The previous synchronous
+# execute_async_script: every wait yields via setTimeout or a MutationObserver,
+# so the page event loop keeps running between checks. This is essential - the
+# things the chain waits for (the site's own timer removing the 'disable-div'
+# overlay at 6:30, the PrimeFaces AJAX response that renders the player page,
+# the blocked-slot popup) are all delivered BY that event loop. The previous synchronous
 # spin-wait implementation blocked the loop and starved every one of them.
 # The only remaining busy-wait is the final <=25ms before the target
 # timestamp, for sub-millisecond click precision.
@@ -149,7 +165,7 @@ function findVisibleBlockedPopup() {
 #   1: numPlayers         1-4
 #   2: targetTimestampMs  epoch ms to click Reserve at, or null for "now"
 #   3: maxWaitMs          player-selector wait budget after Reserve click
-#   4: pollIntervalMs     polling cadence for element waits
+#   4: pollIntervalMs     fallback polling cadence for element waits
 #   5: blockedPatterns    substrings identifying the blocked-slot popup
 #   6: enabledMaxWaitMs   wait budget for disable-div removal
 _JS_ASYNC_BOOKING_CHAIN = """
@@ -187,21 +203,43 @@ _JS_ASYNC_BOOKING_CHAIN = """
             };
         }
 
-        // Async poll: checkFn is evaluated now and then every intervalMs via
-        // setTimeout, yielding to the event loop between checks so page JS
-        // (AJAX handlers, site timers) can run. Truthy return -> onFound(value).
-        // The tick (including onFound/onTimeout) is guarded: a throw completes
-        // the script with an error rather than hanging it.
+        // Async wait: checkFn is evaluated now, again after every batch of DOM
+        // mutations, and every intervalMs via setTimeout as a fallback for
+        // changes no mutation reports. Waiting yields to the event loop so
+        // page JS (AJAX handlers, site timers) can run, and the mutation
+        // re-check reacts as soon as an AJAX update or the overlay removal
+        // lands instead of on the next poll tick. Truthy return ->
+        // onFound(value), exactly once. Every continuation is guarded: a throw
+        // completes the script with an error rather than hanging it.
         function pollUntil(checkFn, timeoutMs, intervalMs, onFound, onTimeout) {
             var deadline = Date.now() + timeoutMs;
-            var tick = guard(function() {
+            var settled = false;
+            var timer = null;
+            var observer = null;
+            function settle(fn, val) {
+                settled = true;
+                if (observer) observer.disconnect();
+                clearTimeout(timer);
+                fn(val);
+            }
+            var check = guard(function() {
+                if (settled) return;
                 var val = null;
                 try { val = checkFn(); } catch (e) { /* keep polling */ }
-                if (val) { onFound(val); return; }
-                if (Date.now() >= deadline) { onTimeout(); return; }
-                setTimeout(tick, intervalMs);
+                if (val) settle(onFound, val);
+            });
+            var tick = guard(function() {
+                check();
+                if (settled) return;
+                if (Date.now() >= deadline) { settle(onTimeout); return; }
+                timer = setTimeout(tick, intervalMs);
             });
             tick();
+            if (!settled && typeof MutationObserver !== 'undefined') {
+                observer = new MutationObserver(check);
+                observer.observe(document.documentElement,
+                    {childList: true, subtree: true, attributes: true});
+            }
         }
 
         function handlePopup(popup, timingKey, suffix) {
@@ -529,7 +567,7 @@ _JS_ASYNC_BOOKING_CHAIN = """
 
 # Timing budgets for the shared booking chain
 _CHAIN_MAX_WAIT_MS = 5000  # player-selector wait after Reserve click
-_CHAIN_POLL_INTERVAL_MS = 10  # element polling cadence
+_CHAIN_POLL_INTERVAL_MS = 10  # fallback cadence; DOM mutations trigger re-checks
 # Wait budget for the site's JS to remove the disable-div overlay at 6:30.
 # Generous on purpose: the wait starts at the local-clock target, so this must
 # absorb clock offset plus any lag in the site's own enable timer. Waiting
@@ -558,6 +596,1140 @@ _SLOT_RESCAN_FINAL_INTERVAL_S = 0.1
 # timer - and because overrunning it delays every later booking in the batch.
 _SLOT_RESCAN_GRACE_MS = _CHAIN_ENABLED_MAX_WAIT_MS
 
+# How long a login's session cookies are replayed into new drivers instead of
+# re-submitting the login form. Kept under the portal's idle session timeout; a
+# session the server has dropped anyway is detected and falls back to a login.
+_SESSION_REUSE_TTL_S = 20 * 60
+
+# Finds the clickable calendar cell for a day of the month. Matches what the
+# old XPath union did - td[data-date], or an <a>/<td> whose own text is the day -
+# and keeps only visible, enabled cells outside the other-month classes.
+# Returns the first match in document order, or null.
+_JS_FIND_CALENDAR_DAY = """
+const day = arguments[0];
+const skipClasses = arguments[1];
+const ownText = (el) => Array.from(el.childNodes)
+    .filter((n) => n.nodeType === Node.TEXT_NODE)
+    .map((n) => n.textContent)
+    .join('')
+    .trim();
+for (const el of document.querySelectorAll('td, a')) {
+    const matches = (el.tagName === 'TD' && el.getAttribute('data-date') === day)
+        || ownText(el) === day;
+    if (!matches) continue;
+    if (el.getClientRects().length === 0 || el.disabled) continue;
+    const cls = el.getAttribute('class') || '';
+    if (skipClasses.some((c) => cls.includes(c))) continue;
+    return el;
+}
+return null;
+"""
+
+# Candidate triggers for the course multi-select, most specific first.
+_COURSE_DROPDOWN_TRIGGER_SELECTORS = (
+    "[class*='select'][class*='course']",
+    "div[class*='multiselect']",
+    "button[class*='dropdown']",
+    ".course-dropdown",
+    "[aria-label*='course' i]",
+    "[placeholder*='course' i]",
+)
+
+# Close control of the opened course multi-select
+_COURSE_DROPDOWN_CLOSE_SELECTOR = "[class*='close'], .x, button[aria-label='close']"
+
+# Course option rows inside the opened multi-select, and the looser XPath
+# tried when none match.
+_COURSE_OPTION_ITEM_SELECTOR = (
+    "input[type='checkbox'], li[class*='option'], div[class*='option'], label[class*='checkbox']"
+)
+_COURSE_OPTION_ITEM_XPATH = (
+    "//li[.//input[@type='checkbox']] | "
+    "//div[contains(@class, 'option')] | "
+    "//label[contains(@class, 'check')]"
+)
+
+# Check the target course and uncheck the other one in the opened course
+# multi-select, in one call instead of ~5 round-trips per option. Mirrors the
+# per-item walk: match options by lowercased text, find each option's checkbox
+# (own input, else a checkbox beside the course label), and click only when the
+# state has to change - the checkbox itself if it is rendered, else the
+# option's label or the option (PrimeFaces hides the native input).
+# Arguments: 0 option selector, 1 target course, 2 course to deselect,
+# 3 option XPath fallback.
+_JS_CONFIGURE_COURSE_CHECKBOXES = """
+var target = arguments[1], deselect = arguments[2];
+var targetLower = target.toLowerCase(), deselectLower = deselect.toLowerCase();
+var items = Array.prototype.slice.call(document.querySelectorAll(arguments[0]));
+if (items.length === 0) {
+    var snap = document.evaluate(
+        arguments[3], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var s = 0; s < snap.snapshotLength; s++) items.push(snap.snapshotItem(s));
+}
+function checkboxFor(item, name) {
+    var cb = item.querySelector("input[type='checkbox']") || item.querySelector('input');
+    if (cb) return cb;
+    for (const input of document.querySelectorAll("input[type='checkbox']")) {
+        var sib = input.parentElement ? input.parentElement.children : [];
+        for (const el of sib) {
+            if (el !== input && (el.textContent || '').indexOf(name) !== -1) return input;
+        }
+    }
+    return null;
+}
+function toggle(item, cb) {
+    if (cb.getClientRects().length > 0) { cb.click(); return; }
+    var label = item.querySelector('label');
+    (label || item).click();
+}
+var result = {
+    targetFound: false, deselectFound: false,
+    targetChecked: false, deselectUnchecked: false,
+    targetAlready: false, deselectAlready: false
+};
+for (const item of items) {
+    var text = (item.innerText || item.textContent || '').toLowerCase();
+    if (!text) continue;
+    if (text.indexOf(targetLower) !== -1) {
+        result.targetFound = true;
+        var cb = checkboxFor(item, target);
+        if (!cb) continue;
+        if (cb.checked) { result.targetAlready = true; continue; }
+        toggle(item, cb);
+        result.targetChecked = true;
+    } else if (text.indexOf(deselectLower) !== -1) {
+        result.deselectFound = true;
+        var dcb = checkboxFor(item, deselect);
+        if (!dcb) continue;
+        if (!dcb.checked) { result.deselectAlready = true; continue; }
+        toggle(item, dcb);
+        result.deselectUnchecked = true;
+    }
+}
+return result;
+"""
+
+# Plain <select> course pickers, most specific first.
+_COURSE_SELECT_SELECTORS = (
+    "select[id*='course']",
+    "select[name*='course']",
+    "select[id*='Course']",
+    "select[name*='Course']",
+    "select.course-select",
+    "#courseSelect",
+)
+_COURSE_SELECT_ANY = ", ".join(_COURSE_SELECT_SELECTORS)
+
+# Free-text or native date inputs, most specific first. The tee sheet uses a
+# calendar picker instead, so the grouped selector lets one find_elements call
+# rule them all out before the priority walk.
+_DATE_INPUT_SELECTORS = (
+    "input[type='text'][id*='date']",
+    "input[type='date']",
+    "input[id*='date']",
+    "input[name*='date']",
+    "input[class*='date']",
+    "input[placeholder*='date' i]",
+    "input[placeholder*='mm/dd' i]",
+    ".datepicker input",
+    "[data-date] input",
+)
+_DATE_INPUT_ANY = ", ".join(_DATE_INPUT_SELECTORS)
+
+_DATE_SUBMIT_BUTTON_SELECTOR = (
+    "button[type='submit'], input[type='submit'], button.search, .btn-search"
+)
+
+_CALENDAR_TRIGGER_SELECTOR = (
+    ".calendar-trigger, .datepicker-trigger, [class*='calendar'], "
+    "button[aria-label*='calendar' i], .ui-datepicker-trigger, "
+    "span.icon-calendar, i.fa-calendar"
+)
+
+# First rendered element for the earliest selector that has one, or null.
+# Replaces a find_elements plus an is_displayed round trip per candidate.
+_JS_FIRST_DISPLAYED_BY_PRIORITY = """
+for (const sel of arguments[0]) {
+    for (const el of document.querySelectorAll(sel)) {
+        if (el.getClientRects().length === 0) continue;
+        if (getComputedStyle(el).visibility === 'hidden') continue;
+        return el;
+    }
+}
+return null;
+"""
+
+# Chrome features the booking flow never uses. Each one costs cold-start time,
+# background network chatter or resident memory in every driver we launch.
+_CHROME_LEAN_ARGS = (
+    "--disable-extensions",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-networking",
+    # Skips the component updater's startup registration and update checks
+    # that a fresh profile would otherwise run
+    "--disable-component-update",
+    "--disable-client-side-phishing-detection",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--disable-features=site-per-process,Translate,BackForwardCache",
+    # The tee sheet is the heaviest page we load and stays far below this
+    "--js-flags=--max-old-space-size=256",
+)
+
+# Third-party analytics and ad hosts. Nothing in the booking flow depends on
+# them, and their standard snippets define stub functions inline, so the
+# portal's own scripts keep working when the loads are refused.
+_TRACKER_URL_PATTERNS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*fullstory.com*",
+)
+
+# Photographic images: the portal's banners and background pictures, which
+# are most of a page's image bytes. No control is drawn from one, so they are
+# blocked in every workflow.
+_PHOTO_URL_PATTERNS = (
+    "*.jpg",
+    "*.jpeg",
+    "*.webp",
+)
+
+# Blocked on every driver for its whole life.
+_ALWAYS_BLOCKED_URL_PATTERNS = (*_TRACKER_URL_PATTERNS, *_PHOTO_URL_PATTERNS)
+
+# Icons and web fonts, which the availability check never looks at: it reads
+# slot times out of the DOM. Blocked for that workflow only - booking and
+# cancellation click icon buttons whose size depends on these loading.
+_MEDIA_URL_PATTERNS = (
+    "*.png",
+    "*.gif",
+    "*.svg",
+    "*.ico",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+)
+
+# Replaces an input's value and fires the events a user's typing would, so
+# listeners bound to input/change (JSF onchange, form validation) still run.
+_JS_FILL_INPUT = """
+const el = arguments[0];
+el.value = arguments[1];
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+# A 12-hour time like "07:46 AM" or "1:30 PM" inside a slot's text. Bounded by
+# digits rather than \b: textContent glues a label to the next element's text
+# ("1:30 PMAvailable"), where a word boundary would fail and let the 24-hour
+# pattern misread the time as 01:30.
+_SLOT_TIME_PATTERN = re.compile(r"(?<!\d)(\d{1,2}:\d{2}\s*[AaPp][Mm])")
+_SLOT_TIME_24H_PATTERN = re.compile(r"(?<!\d)(?:[01]?\d|2[0-3]):[0-5]\d(?!\d)")
+# Event/maintenance ranges like "08:26 AM-10:42 AM" or "9:00 AM - 11:00 AM"
+_TIME_RANGE_PATTERN = re.compile(r"(\d{1,2}:\d{2}\s*[AaPp][Mm])\s*-\s*(\d{1,2}:\d{2}\s*[AaPp][Mm])")
+# A disabled slot's time label, split into hour, minute and meridiem
+_TIME_PARTS_PATTERN = re.compile(r"(\d{1,2}):(\d{2})\s*([AaPp][Mm])")
+# A free-slot span's row container in one round trip, keeping the preference
+# order block-available > ui-grid-a.full-width > teetime-row: each later branch
+# only applies when the span has no ancestor matching an earlier one, so the
+# union yields at most one element
+_ROW_BLOCK_AVAILABLE = "contains(@class, 'block-available')"
+_ROW_GRID = "contains(@class, 'ui-grid-a') and contains(@class, 'full-width')"
+_ROW_CONTAINER_XPATH = (
+    f"./ancestor::div[{_ROW_BLOCK_AVAILABLE}][1]"
+    f" | ./self::*[not(ancestor::div[{_ROW_BLOCK_AVAILABLE}])]/ancestor::div[{_ROW_GRID}][1]"
+    f" | ./self::*[not(ancestor::div[{_ROW_BLOCK_AVAILABLE}] or ancestor::div[{_ROW_GRID}])]"
+    "/ancestor::div[contains(@class, 'teetime-row')][1]"
+)
+# Formats _parse_time accepts, most common first
+_TIME_FORMATS = ("%I:%M %p", "%I:%M%p", "%H:%M")
+# Fast path for the shapes the tee sheet actually renders ("07:30 AM", "7:30PM",
+# "14:05"); anything else falls back to strptime over _TIME_FORMATS
+_TIME_FAST_PATTERN = re.compile(r"(\d{1,2}):(\d{2})(?:\s*([AP]M))?")
+# Course index embedded in tee sheet element IDs
+_COURSE_INDEX_PATTERN = re.compile(r"teeTimeCourses:(\d+)")
+# Booker names as the sheet renders them: "O'Donnell, Deborah", "mcghee, mike"
+_BOOKER_NAME_PATTERN = re.compile(r"([A-Za-z][A-Za-z']+,\s*[A-Za-z][A-Za-z' ]*)")
+_BOOKER_LINE_PATTERN = re.compile(r"^[A-Za-z]")
+_BOOKER_SPAN_PATTERN = re.compile(r"^[A-Za-z][A-Za-z']+,")
+# Confirmation numbers after any of the keywords, in one pass; the number must
+# contain a digit so DOM ids like "DialogDIV" can't match. Keywords are listed
+# in preference order: a "confirmation" number beats a "booking" number even
+# when the latter appears first on the page.
+_CONFIRMATION_KEYWORDS = ("confirmation", "booking", "reference")
+_CONFIRMATION_NUMBER_PATTERN = re.compile(
+    r"(confirmation|booking|reference)[:\s#]*([A-Z0-9-]*\d[A-Z0-9-]*)", re.IGNORECASE
+)
+# Wording that marks a page as post-booking; numbers are only looked for there
+_CONFIRMATION_CONTEXT_PATTERN = re.compile(r"confirmation|booked|reserved", re.IGNORECASE)
+
+# Classifies every slot item on the tee sheet in one pass. A slot with a
+# div.Empty has all maxPlayers spots open; otherwise each open spot renders an
+# Available span. Only slots with at least minSpots open are returned, each with
+# the element to click (reserve button, first Available span, or the item) and
+# the texts its time is parsed from. Time fragments are span texts, then div
+# texts, that start like a time.
+_JS_ENUMERATE_SLOTS = r"""
+const root = arguments[0] || document;
+const itemSel = arguments[1];
+const emptySel = arguments[2];
+const reserveSels = arguments[3];
+const spanSel = arguments[4];
+const minSpots = arguments[5];
+const maxPlayers = arguments[6];
+const items = root.querySelectorAll(itemSel);
+const slots = [];
+items.forEach((item, index) => {
+    const isEmpty = item.querySelector(emptySel) !== null;
+    const spans = isEmpty ? [] : item.querySelectorAll(spanSel);
+    const available = isEmpty ? maxPlayers : spans.length;
+    if (available < minSpots) return;
+    let clickable = null;
+    if (isEmpty) {
+        for (const sel of reserveSels) {
+            clickable = item.querySelector(sel);
+            if (clickable) break;
+        }
+    } else {
+        clickable = spans[0] || null;
+    }
+    const label = item.querySelector('label');
+    const fragments = [];
+    for (const tag of ['span', 'div']) {
+        for (const el of item.querySelectorAll(tag)) {
+            const t = (el.innerText || '').trim();
+            if (/^\d{1,2}:\d{2}/.test(t)) fragments.push(t);
+        }
+    }
+    slots.push({
+        index: index,
+        isEmpty: isEmpty,
+        available: available,
+        clickable: clickable || item,
+        labelText: label ? (label.innerText || '').trim() : '',
+        text: item.innerText || '',
+        timeFragments: fragments,
+    });
+});
+return {total: items.length, slots: slots};
+"""
+
+# Elements inside a row container that hold its time, in preference order
+_CONTAINER_TIME_SELECTORS = (".teetime-player-col-4", "[class*='time']", ".time-cell")
+
+# CSS twins of _ROW_CONTAINER_XPATH's branches, in the same preference order
+_ROW_CONTAINER_CSS = (
+    "div[class*='block-available']",
+    "div[class*='ui-grid-a'][class*='full-width']",
+    "div[class*='teetime-row']",
+)
+
+# Resolves every Available span's row container, time texts and link in one
+# pass, instead of a container lookup, up to three time-element probes, a
+# textContent read and a link lookup per span. Spans without a known container
+# are skipped, as _find_row_container would.
+_JS_COLLECT_AVAILABLE_SPANS = r"""
+const root = arguments[0] || document;
+const spanSel = arguments[1];
+const containerSels = arguments[2];
+const timeSels = arguments[3];
+const linkSel = arguments[4];
+const spans = root.querySelectorAll(spanSel);
+const rows = [];
+spans.forEach((span) => {
+    let container = null;
+    for (const sel of containerSels) {
+        container = span.closest(sel);
+        if (container) break;
+    }
+    if (!container) return;
+    const timeTexts = [];
+    for (const sel of timeSels) {
+        const el = container.querySelector(sel);
+        if (el) timeTexts.push((el.innerText || '').trim());
+    }
+    rows.push({
+        link: span.querySelector(linkSel) || span.querySelector('a') || span,
+        timeTexts: timeTexts,
+        text: container.textContent || '',
+    });
+});
+return {total: spans.length, rows: rows};
+"""
+
+# Slot-ranking functions shared by the single and batched slot finders.
+# collectNorthgateSlots reads every Northgate row once; rankSlots filters and
+# orders those rows for one request, so a batch scans the DOM only once.
+_JS_SLOT_RANKING_HELPERS = """
+function collectNorthgateSlots(northgateIndex, maxPlayers) {
+    var items = document.querySelectorAll('li.ui-datascroller-item');
+    var slots = [];
+    for (var i = 0; i < items.length; i++) {
+        var item = items[i];
+
+        // Check course via element ID pattern: teeTimeCourses:X
+        // Northgate uses index "0", Walden uses index "1"
+        var courseMatch = item.innerHTML.match(/teeTimeCourses:(\\d+)/);
+        if (!courseMatch || courseMatch[1] !== northgateIndex) {
+            continue; // Skip slots without a course index or non-Northgate slots
+        }
+
+        // Extract time from label or text content
+        var label = item.querySelector('label');
+        var timeText = label ? label.textContent.trim() : '';
+        if (!timeText) {
+            var timeMatch = item.textContent.match(/(\\d{1,2}):(\\d{2})\\s*([AaPp][Mm])/);
+            if (timeMatch) {
+                timeText = timeMatch[0];
+            }
+        }
+        if (!timeText) continue;
+
+        // Parse time
+        var tmatch = timeText.match(/(\\d{1,2}):(\\d{2})\\s*([AaPp][Mm])/i);
+        if (!tmatch) continue;
+        var h = parseInt(tmatch[1]);
+        var m = parseInt(tmatch[2]);
+        var ampm = tmatch[3].toUpperCase();
+        if (ampm === 'PM' && h !== 12) h += 12;
+        if (ampm === 'AM' && h === 12) h = 0;
+
+        // Component id of the slot's Reserve link. The direct-HTTP path
+        // replays that component's PrimeFaces request, so it needs the id
+        // rather than the NodeList index the JS chain clicks by.
+        var reserveEl = item.querySelector("a[id*='reserve_button']") ||
+            item.querySelector('a.slot-link');
+
+        slots.push({
+            hours: h,
+            minutes: m,
+            index: i,
+            fullyEmpty: item.querySelectorAll('div.Empty').length > 0,
+            freeSpans: item.querySelectorAll('span.custom-free-slot-span').length,
+            maxPlayers: maxPlayers,
+            reserveId: reserveEl ? reserveEl.id : null
+        });
+    }
+    return slots;
+}
+
+function rankSlots(slots, spec) {
+    var targetMinutes = spec.targetHour * 60 + spec.targetMinute;
+    var candidates = [];
+
+    // Build exclude set for O(1) lookup
+    var excludeSet = {};
+    for (var e = 0; e < spec.excludeTimes.length; e++) {
+        excludeSet[spec.excludeTimes[e].h * 60 + spec.excludeTimes[e].m] = true;
+    }
+
+    for (var i = 0; i < slots.length; i++) {
+        var slot = slots[i];
+        var h = slot.hours;
+        var m = slot.minutes;
+        var slotMinutes = h * 60 + m;
+        var diff = Math.abs(slotMinutes - targetMinutes);
+
+        // Check fallback window
+        if (diff > spec.fallbackMinutes) continue;
+
+        // Check interval alignment
+        if (diff % spec.intervalMinutes !== 0) continue;
+
+        // Check availability
+        var isAvailable = false;
+        var availableCount = 0;
+
+        if (slot.fullyEmpty) {
+            availableCount = slot.maxPlayers;
+            isAvailable = (spec.minPlayers <= slot.maxPlayers);
+        } else if (slot.freeSpans >= spec.minPlayers) {
+            availableCount = slot.freeSpans;
+            isAvailable = true;
+        }
+
+        if (!isAvailable) continue;
+
+        // For fallback slots, skip excluded times. Never for the exact time
+        // asked for: that one is the booking, not a stand-in chosen for it.
+        if (diff !== 0 && excludeSet[slotMinutes]) continue;
+
+        candidates.push({
+            timeStr: h + ':' + (m < 10 ? '0' : '') + m,
+            hours: h,
+            minutes: m,
+            index: slot.index,
+            diff: diff,
+            available: availableCount,
+            isExact: (diff === 0),
+            reserveId: slot.reserveId
+        });
+    }
+
+    // Nearest to the requested time first, and on a tie the earlier tee
+    // time - the same order the single-slot search reached by scanning rows
+    // in time order and keeping the first strictly-closer one.
+    candidates.sort(function (a, b) {
+        if (a.diff !== b.diff) return a.diff - b.diff;
+        return (a.hours * 60 + a.minutes) - (b.hours * 60 + b.minutes);
+    });
+
+    return candidates;
+}
+"""
+
+# Ranks every suitable Northgate slot in one pass; see _rank_candidate_slots_js
+_JS_RANK_CANDIDATE_SLOTS = (
+    _JS_SLOT_RANKING_HELPERS
+    + """
+return rankSlots(collectNorthgateSlots(arguments[6], arguments[7]), {
+    targetHour: arguments[0],
+    targetMinute: arguments[1],
+    minPlayers: arguments[2],
+    fallbackMinutes: arguments[3],
+    intervalMinutes: arguments[4],
+    excludeTimes: arguments[5]
+});
+"""
+)
+
+# Best slot per request from a single scan; see _find_target_slots_js_batch
+_JS_FIND_TARGET_SLOTS_BATCH = (
+    _JS_SLOT_RANKING_HELPERS
+    + """
+var specs = arguments[0];
+var slots = collectNorthgateSlots(arguments[1], arguments[2]);
+var found = {};
+for (var s = 0; s < specs.length; s++) {
+    var ranked = rankSlots(slots, specs[s]);
+    if (ranked.length) found[specs[s].bookingId] = ranked[0];
+}
+return found;
+"""
+)
+
+# Clicks the Reserve control of the slot item at a DOM index; see
+# _click_slot_by_index_js
+_JS_CLICK_SLOT_BY_INDEX = """
+var items = document.querySelectorAll('li.ui-datascroller-item');
+var item = items[arguments[0]];
+if (!item) return false;
+
+// Find the clickable element in priority order
+var btn = item.querySelector("a[id*='reserve_button']");
+if (!btn) {
+    var spans = item.querySelectorAll('span.custom-free-slot-span');
+    btn = spans.length > 0 ? spans[0] : null;
+}
+if (!btn) btn = item.querySelector("a.slot-link");
+if (!btn) return false;
+
+btn.scrollIntoView({block: 'center'});
+btn.click();
+return true;
+"""
+
+# Page-level waits: how long a navigation may take to render its form, how
+# often to look, and the conditions polled for, built once rather than per
+# navigation. Each poll is one find_element round trip, so a 50ms poll costs
+# little and stops the default 500ms poll adding up to half a second after
+# every login and tee-sheet load. A page still loading after a second is
+# having a slow moment (6:30 contention, mostly), so the poll backs off from
+# there rather than adding ~20 round trips a second to the browser's load.
+_PAGE_WAIT_S = 15
+_PAGE_WAIT_POLL_S = 0.05
+# (elapsed seconds below which it applies, poll interval), in order
+_PAGE_WAIT_POLL_SCHEDULE = ((1.0, _PAGE_WAIT_POLL_S), (3.0, 0.2), (float("inf"), 0.5))
+_FORM_PRESENT = expected_conditions.presence_of_element_located((By.CSS_SELECTOR, "form"))
+_DASHBOARD_PRESENT = expected_conditions.presence_of_element_located(
+    (By.CSS_SELECTOR, DOM.CANCELLATION.dashboard_presence)
+)
+_TEE_SHEET_LOADED = expected_conditions.presence_of_element_located(
+    (By.CSS_SELECTOR, DOM.SLOT_DISCOVERY.page_loaded)
+)
+_MEMBER_INPUT_PRESENT = expected_conditions.presence_of_element_located(
+    (By.NAME, DOM.LOGIN.member_input_name)
+)
+
+
+class _BackoffWait:
+    """
+    Poll a condition on a driver until it holds, backing off per _PAGE_WAIT_POLL_SCHEDULE.
+
+    Behaves like WebDriverWait.until: a NoSuchElementException from the
+    condition counts as "not yet", and a condition still false at the timeout
+    raises TimeoutException. WebDriverWait keeps one poll interval for the
+    whole wait, so the schedule needs a loop of its own.
+    """
+
+    def __init__(self, driver: webdriver.Chrome, timeout: float) -> None:
+        self.driver = driver
+        self.timeout = timeout
+
+    def until(self, method: Callable[[webdriver.Chrome], T], message: str = "") -> T:
+        start = time_module.monotonic()
+        while True:
+            try:
+                value = method(self.driver)
+                if value:
+                    return value
+            except NoSuchElementException:
+                pass
+            elapsed = time_module.monotonic() - start
+            if elapsed >= self.timeout:
+                raise TimeoutException(message)
+            poll = next(poll for limit, poll in _PAGE_WAIT_POLL_SCHEDULE if elapsed < limit)
+            time_module.sleep(min(poll, self.timeout - elapsed))
+
+
+# Conditions for the waits inside date selection and booking completion
+_CALENDAR_POPUP_PRESENT = expected_conditions.presence_of_element_located(
+    (
+        By.CSS_SELECTOR,
+        ".ui-datepicker, .datepicker, [class*='calendar-popup'], "
+        ".ui-datepicker-calendar, select[class*='month'], select[class*='year']",
+    )
+)
+
+# Month/year selects of the calendar popup
+_CALENDAR_MONTH_SELECT_SELECTOR = (
+    "select.ui-datepicker-month, select[class*='month'], "
+    "select[data-handler='selectMonth'], select[name*='month']"
+)
+_CALENDAR_YEAR_SELECT_SELECTOR = (
+    "select.ui-datepicker-year, select[class*='year'], "
+    "select[data-handler='selectYear'], select[name*='year']"
+)
+
+# Month/year title of the drawn calendar. One grouped query: only a header
+# whose text parses as a month counts, so document order is as good as any.
+_CALENDAR_HEADER_SELECTOR = (
+    ".ui-datepicker-title, .datepicker-title, "
+    "[class*='calendar-header'], [class*='datepicker-header']"
+)
+
+# "January 2026" / "Jan 2026" in a calendar header, parsed with one regex match
+# and a dict lookup rather than a strptime attempt (and exception) per format
+_CALENDAR_HEADER_PATTERN = re.compile(r"^([A-Za-z]+)\s+(\d{4})$")
+_MONTH_NUMBERS = {
+    name.lower(): number
+    for names in (calendar.month_name, calendar.month_abbr)
+    for number, name in enumerate(names)
+    if name
+}
+
+# The datepicker rebuilds its day grid whenever the month or year changes,
+# usually within the click itself. The fixed 0.3-0.5s pause after every change
+# paid the worst case each step; a day cell read beforehand going stale marks
+# the redraw instead.
+_CALENDAR_DAY_CELL_SELECTOR = ".ui-datepicker-calendar td, .datepicker td"
+_CALENDAR_REDRAW_WAIT_S = 2.0
+_CALENDAR_REDRAW_POLL_S = 0.05
+# Fixed pause after a month step when no day cell can be watched
+_CALENDAR_NAV_PAUSE_MS = 300
+
+# Steps the calendar with its next/prev arrow, all inside one async script
+# rather than a lookup and click round-trip per month. Before each click a day
+# cell is read; the next step waits for the redraw to detach it (checked on
+# every DOM mutation, with a timeout), or for the fixed pause if there is none.
+# The arrow is looked up again each step because the redraw replaces it; one
+# the datepicker has disabled (ui-state-disabled, at its date limit) does not
+# count, so running out of months stops the steps rather than clicking nothing.
+#
+# Arguments (Selenium appends the async callback as the last argument):
+#   0: selectors        arrow selectors, most specific first
+#   1: steps            number of clicks
+#   2: cellSelector     day cells of the drawn month
+#   3: redrawTimeoutMs  per-step wait budget for the redraw
+#   4: pauseMs          per-step pause without a day cell to watch
+# Completes with {steps: clicks made, error: reason it stopped early or null}.
+_JS_STEP_CALENDAR_MONTHS = """
+const selectors = arguments[0];
+const steps = arguments[1];
+const cellSelector = arguments[2];
+const redrawTimeoutMs = arguments[3];
+const pauseMs = arguments[4];
+const done = arguments[arguments.length - 1];
+const result = {steps: 0, error: null};
+
+const findButton = () => {
+    for (const sel of selectors) {
+        for (const el of document.querySelectorAll(sel)) {
+            if (el.getClientRects().length === 0 || el.disabled) continue;
+            if (el.classList.contains('ui-state-disabled')) continue;
+            if (getComputedStyle(el).visibility === 'hidden') continue;
+            return el;
+        }
+    }
+    return null;
+};
+
+const redrawn = (cell) => new Promise((resolve) => {
+    if (!cell) {
+        setTimeout(resolve, pauseMs);
+        return;
+    }
+    let observer = null;
+    let timer = null;
+    const finish = () => {
+        if (observer) observer.disconnect();
+        clearTimeout(timer);
+        resolve();
+    };
+    if (!cell.isConnected) {
+        finish();
+        return;
+    }
+    observer = new MutationObserver(() => {
+        if (!cell.isConnected) finish();
+    });
+    observer.observe(document.documentElement, {childList: true, subtree: true});
+    timer = setTimeout(finish, redrawTimeoutMs);
+});
+
+(async () => {
+    for (let i = 0; i < steps; i++) {
+        const button = findButton();
+        if (!button) {
+            result.error = 'no navigation button';
+            return;
+        }
+        const cell = document.querySelector(cellSelector);
+        button.click();
+        result.steps = i + 1;
+        await redrawn(cell);
+    }
+})().catch((e) => {
+    result.error = e.message;
+}).then(() => done(result));
+"""
+_TEE_TIMES_PRESENT = expected_conditions.presence_of_element_located(
+    (By.CSS_SELECTOR, DOM.DATE_SELECTION.tee_time_presence)
+)
+_BOOK_NOW_PRESENT = expected_conditions.presence_of_element_located(
+    (By.CSS_SELECTOR, DOM.BOOKING_COMPLETION.book_now_wait)
+)
+_SUCCESS_TEXT_PRESENT = expected_conditions.presence_of_element_located(
+    (
+        By.XPATH,
+        "//*[contains(text(), 'success') or contains(text(), 'confirm') or "
+        "contains(text(), 'thank')]",
+    )
+)
+
+# Idle drivers kept for reuse between operations. Chrome start-up costs
+# seconds per call; each idle headless Chrome also holds a few hundred MB, so
+# the pool stays small.
+_DRIVER_POOL_SIZE = 2
+
+# Stages of the Python-side precision wait. One sleep covers everything up to
+# the coarse margin (OS sleep overshoot is well under it), short sleeps cover
+# the rest down to the spin margin, and only the last couple of milliseconds
+# spin on the clock, so the wait costs almost no CPU.
+_PRECISION_COARSE_MARGIN_S = 0.05
+_PRECISION_SPIN_MARGIN_S = 0.002
+_PRECISION_SHORT_SLEEP_S = 0.0005
+
+# Upper bound on a single driver.get(). With the eager load strategy navigation
+# returns at DOMContentLoaded, so hitting this means the site is not responding.
+_PAGE_LOAD_TIMEOUT_S = 20
+
+# Poll interval for the waits in course/date selection and booking completion.
+# The modal and the post-Book-Now navigation usually land within ~200ms, so
+# WebDriverWait's default 500ms poll mostly added idle time to each step.
+_BOOKING_POLL_S = 0.1
+
+# Player rows render from the AJAX update fired by the player-count click, which
+# typically lands well under a second; the old fixed 2s wait paid the worst case
+# every time. Poll the row count instead and move on as soon as it is reached.
+# A form that renders fewer rows than asked for (a prefilled member row, say)
+# never reaches the count, so the wait is capped at that old 2s rather than
+# making every such booking pay a longer timeout.
+_PLAYER_ROWS_POLL_S = 0.05
+_PLAYER_ROWS_TIMEOUT_S = 2.0
+
+# The course multi-select opens and closes client-side, usually within a frame
+# or two; the fixed 0.5s pause after each toggle paid the worst case twice per
+# course selection. Poll the number of rendered course options instead.
+_COURSE_DROPDOWN_WAIT_S = 2.0
+_COURSE_DROPDOWN_POLL_S = 0.05
+
+# Number of rendered course options with text; compared against the count
+# before the dropdown was opened, since unrelated checkboxes may be on the page
+_JS_COUNT_SHOWN_COURSE_OPTIONS = """
+var n = 0;
+for (const el of document.querySelectorAll(arguments[0])) {
+    if (el.getClientRects().length > 0 && (el.textContent || '').trim()) n++;
+}
+return n;
+"""
+
+# Rendered text of the page body: what the member sees, without markup or scripts
+_JS_BODY_TEXT = "return document.body ? document.body.innerText : '';"
+
+# Markup and rendered text of the displayed, non-aria-hidden matches for each
+# selector (first 10 per selector, selector order), in one round-trip instead
+# of find_elements plus three reads per candidate
+_JS_VISIBLE_MESSAGE_CONTAINERS = """
+var out = [];
+for (const sel of arguments[0]) {
+    let matches;
+    try { matches = document.querySelectorAll(sel); } catch (e) { continue; }
+    for (const el of Array.prototype.slice.call(matches, 0, 10)) {
+        if ((el.getAttribute('aria-hidden') || '').toLowerCase() === 'true') continue;
+        if (el.getClientRects().length === 0) continue;
+        if (getComputedStyle(el).visibility === 'hidden') continue;
+        out.push({html: el.outerHTML, text: el.innerText || ''});
+    }
+}
+return out;
+"""
+
+# Whether any text in the document, rendered or not, contains a lowercase
+# needle: one string scan instead of an XPath translate() over every text node
+# Whether the rendered body text contains a lowercase needle. Only the boolean
+# crosses the wire, not a tee sheet's worth of text to lowercase in Python.
+_JS_BODY_TEXT_CONTAINS = (
+    "return document.body ? document.body.innerText.toLowerCase().includes(arguments[0])"
+    " : false;"
+)
+
+_JS_DOCUMENT_TEXT_CONTAINS = (
+    "return (document.documentElement.textContent || '').toLowerCase()"
+    ".indexOf(arguments[0]) !== -1;"
+)
+
+# First element matching a selector whose rendered text contains a lowercase
+# needle - one round-trip instead of a .text read per candidate element
+_JS_FIRST_ELEMENT_WITH_TEXT = """
+const needle = arguments[1];
+for (const el of document.querySelectorAll(arguments[0])) {
+    if ((el.innerText || '').toLowerCase().includes(needle)) return el;
+}
+return null;
+"""
+
+# Plain JS click, used to get past overlays that intercept native clicks
+_JS_CLICK = "arguments[0].click();"
+
+# Finds one guest's player row and clicks its TBD control in a single call,
+# instead of a lookup round-trip per row selector and per strategy. Mirrors the
+# Python lookups: rows from the first selector matching more than the member's
+# row; then a displayed TBD-specific control, a displayed generic command
+# button, the first XPath text match, and a displayed clickable mentioning
+# tbd/guest. Completes with {rows, clicked: strategy or null}; a null click
+# leaves the row to the Python strategies, including typing into the name input.
+_JS_CLICK_TBD_IN_ROW = """
+const root = arguments[0] || document;
+const rowSelectors = arguments[1];
+const guestIndex = arguments[2];
+const tbdCss = arguments[3];
+const genericCss = arguments[4];
+const tbdXpath = arguments[5];
+const clickableCss = arguments[6];
+const shown = (el) => el.getClientRects().length > 0
+    && getComputedStyle(el).visibility !== 'hidden';
+let rows = [];
+for (const sel of rowSelectors) {
+    rows = root.querySelectorAll(sel);
+    if (rows.length > 1) break;
+}
+const result = {rows: rows.length, clicked: null};
+const row = rows[guestIndex + 1];
+if (!row) return result;
+const firstShown = (sel) => Array.from(row.querySelectorAll(sel)).find(shown) || null;
+const strategies = [
+    ['css', () => firstShown(tbdCss)],
+    ['generic', () => firstShown(genericCss)],
+    ['xpath', () => document.evaluate(
+        tbdXpath, row, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue],
+    ['scan', () => Array.from(row.querySelectorAll(clickableCss)).find((el) => {
+        const text = (el.innerText || '').trim().toLowerCase();
+        const id = (el.id || '').toLowerCase();
+        const cls = (el.getAttribute('class') || '').toLowerCase();
+        return (text.includes('tbd') || id.includes('tbd') || cls.includes('tbd')
+            || text.includes('guest')) && shown(el);
+    }) || null],
+];
+for (const [name, find] of strategies) {
+    const el = find();
+    if (el) {
+        el.click();
+        result.clicked = name;
+        break;
+    }
+}
+return result;
+"""
+
+# Centers an element (clear of the sticky header) and JS-clicks it in one
+# round-trip. A {block: 'center'} scroll is not animated, so the click lands
+# on the scrolled element without a wait in between. Returns the element's id,
+# text and the page URL as they were before the click, for logging and for
+# detecting the post-click navigation.
+_JS_SCROLL_AND_CLICK = """
+const el = arguments[0];
+const info = {
+    id: el.id || '',
+    text: (el.innerText || '').trim().slice(0, 50),
+    url: window.location.href,
+};
+el.scrollIntoView({block: 'center'});
+el.click();
+return info;
+"""
+
+# Every reservations-table row's rendered text in one round-trip instead of a
+# .text read per row. The form scopes the rows when present; the whole page is
+# the fallback.
+_JS_RESERVATION_ROW_TEXTS = """
+const form = document.querySelector(arguments[0]);
+const rows = (form || document).querySelectorAll(arguments[1]);
+return {formFound: !!form, texts: Array.from(rows, (row) => row.innerText || '')};
+"""
+
+# Cancellation waits poll instead of sleeping: the confirm dialog is up within
+# a frame or two of the cancel click, and the reservations update that follows
+# usually lands well before the 1-2s the fixed waits allowed.
+_CANCEL_POLL_S = 0.05
+_CANCEL_DIALOG_TIMEOUT_S = 2
+_CANCEL_SETTLE_TIMEOUT_S = 3
+
+# The row being cancelled is tagged before its cancel control is clicked. The
+# cancellation has been processed once the tag is gone - the row was removed or
+# re-rendered, or the page reloaded - and the document has finished loading.
+_CANCEL_PENDING_ATTR = "data-teetime-cancel-pending"
+_JS_MARK_CANCEL_PENDING = f"""
+const row = arguments[0].closest('tr');
+if (row) row.setAttribute('{_CANCEL_PENDING_ATTR}', '1');
+return !!row;
+"""
+_JS_CANCEL_SETTLED = (
+    f"return document.readyState === 'complete' && "
+    f"!document.querySelector('[{_CANCEL_PENDING_ATTR}]');"
+)
+
+# Finds the reservation being cancelled entirely in the page: the first row
+# that is a tee time on one of the dates, whose time matches the pattern
+# _reservation_match_patterns built (so the digit-boundary rule is the same
+# one the Python matcher applies), and that has a cancel control. That row is
+# tagged as pending and its cancel control returned - one round-trip where
+# the row scan needed a second one to tag the row.
+_JS_FIND_RESERVATION_TO_CANCEL = f"""
+const [formSelector, rowSelector, cancelSelector, fallbackSelector, dates, timeSource] =
+    arguments;
+const timePattern = new RegExp(timeSource, 'i');
+const form = document.querySelector(formSelector);
+const rows = (form || document).querySelectorAll(rowSelector);
+const result = {{formFound: !!form, rowCount: rows.length, text: '', cancel: null, missing: 0}};
+for (const row of rows) {{
+    const text = row.innerText || '';
+    if (!text.toLowerCase().includes('tee time')) continue;
+    if (!dates.some((d) => text.includes(d)) || !timePattern.test(text)) continue;
+    const cancel = row.querySelector(cancelSelector) || row.querySelector(fallbackSelector);
+    if (!cancel) {{
+        result.missing += 1;
+        continue;
+    }}
+    row.setAttribute('{_CANCEL_PENDING_ATTR}', '1');
+    result.text = text;
+    result.cancel = cancel;
+    break;
+}}
+return result;
+"""
+
+# Explicit messages _verify_cancellation_success looks for. Failures are
+# checked first, so a page mentioning both reads as a failed cancellation.
+_CANCELLATION_SUCCESS_INDICATORS = (
+    "cancelled successfully",
+    "canceled successfully",
+    "reservation cancelled",
+    "reservation canceled",
+    "successfully cancelled",
+    "successfully canceled",
+)
+_CANCELLATION_FAILURE_INDICATORS = (
+    "error cancelling",
+    "error canceling",
+    "failed to cancel",
+    "unable to cancel",
+    "cannot cancel",
+    "cancellation failed",
+)
+# One alternation per list for the Python fallback, so a page read through
+# page_source is scanned once per list rather than once per phrase
+_CANCELLATION_SUCCESS_PATTERN = re.compile(
+    "|".join(map(re.escape, _CANCELLATION_SUCCESS_INDICATORS))
+)
+_CANCELLATION_FAILURE_PATTERN = re.compile(
+    "|".join(map(re.escape, _CANCELLATION_FAILURE_INDICATORS))
+)
+
+# Checks the reservations form's rendered text (the body when the form is
+# missing) for those messages in the browser, returning which one matched
+# instead of shipping page_source over the wire to scan in Python.
+_JS_CANCELLATION_VERDICT = """
+const [formSelector, failures, successes] = arguments;
+const form = document.querySelector(formSelector);
+const scope = form || document.body;
+const text = scope ? (scope.innerText || '').toLowerCase() : '';
+for (const phrase of failures) {
+    if (text.includes(phrase)) return {formFound: !!form, verdict: 'fail', indicator: phrase};
+}
+for (const phrase of successes) {
+    if (text.includes(phrase)) return {formFound: !!form, verdict: 'ok', indicator: phrase};
+}
+return {formFound: !!form, verdict: 'unknown', indicator: ''};
+"""
+
+# The cancel confirmation XPaths as one union expression, built once
+_CANCEL_CONFIRM_XPATH = " | ".join(DOM.CANCELLATION.confirm_xpaths)
+
+# A post-booking redirect lands on a confirmation/success/thank-you URL. The
+# wait predicate polls this, so read current_url once per poll, not per keyword.
+_SUCCESS_URL_PATTERN = re.compile(r"confirmation|success|thank", re.IGNORECASE)
+
+# Phrases _booking_text_verdict looks for, in reporting order. Each list is
+# matched by one case-insensitive alternation, so the text is scanned once per
+# list instead of lowercased and then scanned once per phrase.
+_BOOKING_SUCCESS_INDICATORS = (
+    "successfully",
+    "confirmed",
+    "booked",
+    "reservation complete",
+    "thank you",
+    "your tee time",
+)
+_BOOKING_FAILURE_INDICATORS = (
+    "error",
+    "failed",
+    "unavailable",
+    "could not",
+    "unable to",
+    "already booked",
+    "no longer available",
+)
+_BOOKING_SUCCESS_PATTERN = re.compile(
+    "|".join(map(re.escape, _BOOKING_SUCCESS_INDICATORS)), re.IGNORECASE
+)
+_BOOKING_FAILURE_PATTERN = re.compile(
+    "|".join(map(re.escape, _BOOKING_FAILURE_INDICATORS)), re.IGNORECASE
+)
+
+
+def _matched_indicators(
+    pattern: re.Pattern[str], indicators: Sequence[str], text: str
+) -> list[str]:
+    """Return the indicators found in text, in the order they are listed."""
+    found = {match.group(0).lower() for match in pattern.finditer(text)}
+    return [indicator for indicator in indicators if indicator in found]
+
+
+@functools.lru_cache(maxsize=8)
+def _reservation_match_patterns(
+    target_date: date, target_time: time
+) -> tuple[tuple[str, ...], re.Pattern[str]]:
+    """
+    Date strings and time pattern a reservations-table row must contain.
+
+    Built once per tee time rather than once per row scanned. The time pattern
+    is every rendering the page has been seen to use, as one alternation.
+    """
+    date_variations = (
+        target_date.strftime("%m/%d/%Y"),
+        target_date.strftime("%m/%d/%y"),
+    )
+    time_variations = (
+        target_time.strftime("%I:%M %p").lstrip("0"),
+        target_time.strftime("%H:%M"),
+        target_time.strftime("%I:%M%p").lstrip("0"),
+        target_time.strftime("%I:%M %p"),
+    )
+    # The hour must not be preceded by another digit. A bare substring test
+    # lets a row rendering "12:08 PM" satisfy a search for "2:08 PM", which
+    # would report a tee time the member never booked as held - the exact
+    # false confirmation this whole check exists to rule out.
+    time_pattern = re.compile(
+        r"(?<!\d)(?:" + "|".join(map(re.escape, time_variations)) + ")", re.IGNORECASE
+    )
+    return date_variations, time_pattern
+
+
+def _remembered_first(selectors: Sequence[str], remembered: str | None) -> list[str]:
+    """The selectors in order, with the one that matched last time moved first."""
+    if remembered is None or remembered not in selectors:
+        return list(selectors)
+    return [remembered, *(selector for selector in selectors if selector != remembered)]
+
+
+def _owning_driver(search_context: Any) -> Any:
+    """The driver a search context belongs to: an element's driver, or the context itself."""
+    return search_context.parent if isinstance(search_context, WebElement) else search_context
+
+
+def _later_target_times(sorted_requests: list[BatchBookingRequest]) -> list[set[time]]:
+    """
+    For each request, the target times of the requests after it.
+
+    The list is sorted, so these are the targets after position i that are
+    strictly later than request i's own (a tie is not protected). Built in one
+    backward pass.
+    """
+    later_times: list[set[time]] = [set() for _ in sorted_requests]
+    seen_times: set[time] = set()
+    for idx in range(len(sorted_requests) - 1, -1, -1):
+        own_time = sorted_requests[idx].target_time
+        later_times[idx] = seen_times - {own_time}
+        seen_times.add(own_time)
+    return later_times
+
+
+# The ChromeDriver path once resolved, and the lock that lets one caller resolve
+# it. The pool starts browsers from several threads at once; without the
+# re-check under the lock each concurrent first caller would still run
+# ChromeDriverManager().install() against the same driver cache directory.
+_chromedriver_path: str | None = None
+_CHROMEDRIVER_INSTALL_LOCK = threading.Lock()
+
+
+def _resolved_chromedriver_path() -> str:
+    """
+    Resolve the ChromeDriver binary path once per process.
+
+    Prefers CHROMEDRIVER_PATH from the environment, falling back to
+    ChromeDriverManager for automatic version management. install() does a
+    version check against the network and the driver cache, which every booking
+    used to pay again; the resolved path does not change within a process.
+
+    webdriver_manager is imported here rather than at module level: deployed
+    images bake chromedriver in and set CHROMEDRIVER_PATH, so they never load
+    it or its HTTP stack.
+    """
+    global _chromedriver_path
+    path = _chromedriver_path
+    if path is not None:
+        return path
+
+    with _CHROMEDRIVER_INSTALL_LOCK:
+        if _chromedriver_path is None:
+            env_path = os.environ.get("CHROMEDRIVER_PATH")
+            if env_path and os.path.exists(env_path):
+                _chromedriver_path = env_path
+            else:
+                from webdriver_manager.chrome import ChromeDriverManager
+
+                _chromedriver_path = ChromeDriverManager().install()
+        return _chromedriver_path
+
 
 class WaldenGolfProvider(ReservationProvider):
     """
@@ -576,8 +1748,10 @@ class WaldenGolfProvider(ReservationProvider):
 
     Implementation Note:
         All public async methods use asyncio.to_thread() to run blocking Selenium
-        operations in a background thread. Each operation manages its own WebDriver
-        lifecycle (create -> use -> quit) to avoid thread-affinity issues.
+        operations in a background thread. Every operation borrows a driver from
+        a small pool (acquire -> use -> release) and returns it reset, so each
+        driver is still used by one thread at a time. The app starts the pool's
+        browsers at startup through warm_driver_pool().
     """
 
     BASE_URL = "https://www.waldengolf.com"
@@ -586,6 +1760,7 @@ class WaldenGolfProvider(ReservationProvider):
     TEE_TIME_URL = f"{BASE_URL}/group/pages/book-a-tee-time"
 
     NORTHGATE_COURSE_NAME = "Northgate"
+    NORTHGATE_COURSE_NAME_LC = NORTHGATE_COURSE_NAME.lower()
     TEE_TIME_INTERVAL_MINUTES = 8
     MAX_PLAYERS = 4  # Maximum players per tee time slot
 
@@ -594,6 +1769,17 @@ class WaldenGolfProvider(ReservationProvider):
     NORTHGATE_COURSE_INDEX = "0"
     WALDEN_COURSE_INDEX = "1"
 
+    # Uploads/writes captured diagnostics off the failure path. One worker keeps
+    # artifacts in capture order; the thread is joined at interpreter exit, so
+    # queued artifacts are not lost on shutdown.
+    _diagnostic_executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="walden-diagnostics"
+    )
+    # Resets and quits drivers after an operation has its result, so browser
+    # teardown is not part of the caller's latency. One worker runs them in
+    # submission order, which lets close() queue the pool drain behind them.
+    _cleanup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="walden-cleanup")
+
     def __init__(self) -> None:
         """
         Initialize the WaldenGolfProvider.
@@ -602,6 +1788,34 @@ class WaldenGolfProvider(ReservationProvider):
         credentials are missing - operations will fail at login time.
         """
         self.wait_strategy = WaitStrategy()
+        # Authenticated session from the last successful login, replayed into
+        # fresh drivers so back-to-back operations skip the login form. Shared
+        # by every driver, so the cookies and their expiry are read and written
+        # together under the lock.
+        self._session_lock = threading.Lock()
+        self._session_cookies: list[dict[str, Any]] | None = None
+        self._session_expiry: float = 0.0
+        # Slot <li> items for the tee sheet each live driver has rendered,
+        # paired with the context they were queried under. Reused by the helpers
+        # that walk the sheet after a failed scan; dropped whenever the sheet
+        # can change. Per driver, since parallel batch sessions each have a sheet.
+        # The items hold their driver, so its entry goes when it is released or quit.
+        self._slot_items: dict[Any, tuple[Any, list[Any]]] = {}
+        # Player row selector that last matched the booking form. Every booking
+        # renders the same form, so later ones try it before the rest of the list.
+        # Shared across threads: it only orders the selectors tried, so whichever
+        # thread wrote it last, every selector is still tried.
+        self._player_row_selector: str | None = None
+        # Whether the calendar popup offers month/year selects; None until a
+        # drawn calendar has been looked at. The site's own calendar has none,
+        # so once that is known the probe for them is skipped. Shared across
+        # threads: it describes the site, which every driver sees alike.
+        self._calendar_uses_dropdowns: bool | None = None
+        # Idle drivers returned by _release_driver, most recently used on top.
+        # LifoQueue does its own locking, so worker threads can share it.
+        self._driver_pool: queue.LifoQueue[webdriver.Chrome] = queue.LifoQueue(
+            maxsize=_DRIVER_POOL_SIZE
+        )
         if not settings.walden_member_number or not settings.walden_password:
             logger.warning(
                 "Walden Golf credentials not configured. "
@@ -609,7 +1823,8 @@ class WaldenGolfProvider(ReservationProvider):
             )
 
     async def __aenter__(self) -> "WaldenGolfProvider":
-        """Async context manager entry."""
+        """Async context manager entry. Starts the pooled browsers up front."""
+        await self.warm_driver_pool()
         return self
 
     async def __aexit__(
@@ -631,17 +1846,24 @@ class WaldenGolfProvider(ReservationProvider):
         options.add_argument("--disable-gpu")
         options.add_argument("--window-size=1920,1080")
         options.add_argument("--disable-blink-features=AutomationControlled")
+        for arg in _CHROME_LEAN_ARGS:
+            options.add_argument(arg)
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
-
-        # Check for ChromeDriver path from environment variable first,
-        # then fall back to ChromeDriverManager for automatic version management
-        chromedriver_path = os.environ.get("CHROMEDRIVER_PATH")
-        if chromedriver_path and os.path.exists(chromedriver_path):
-            service = Service(chromedriver_path)
-        else:
-            service = Service(ChromeDriverManager().install())
+        # Every page in the booking flow is driven by its forms, which exist at
+        # DOMContentLoaded; "normal" would also block each get() on the site's
+        # analytics and tracking subresources finishing.
+        options.page_load_strategy = "eager"
+        # A native confirm() the flow did not look for is accepted by the next
+        # command rather than dismissed with an UnexpectedAlertPresentException.
+        # Cancellation still probes for its confirm first, so it can tell an
+        # accepted alert from a modal it has to click.
+        options.unhandled_prompt_behavior = "accept"
+
+        service = Service(_resolved_chromedriver_path())
         driver = webdriver.Chrome(service=service, options=options)
+        driver.set_page_load_timeout(_PAGE_LOAD_TIMEOUT_S)
+        self._set_blocked_urls(driver)
 
         driver.execute_cdp_cmd(
             "Page.addScriptToEvaluateOnNewDocument",
@@ -656,11 +1878,119 @@ class WaldenGolfProvider(ReservationProvider):
 
         return driver
 
+    def _page_wait(self, driver: webdriver.Chrome) -> _BackoffWait:
+        """
+        Return a page-level wait for the driver.
+
+        Built per call: it is two attributes, and a cache keyed by driver would
+        keep every driver it ever saw alive through the wait's own reference.
+        """
+        return _BackoffWait(driver, _PAGE_WAIT_S)
+
+    def _acquire_driver(self) -> webdriver.Chrome:
+        """
+        Take an idle driver from the pool, or create one if none is usable.
+
+        A pooled driver whose browser has died since it was released is quit
+        and skipped rather than handed out.
+        """
+        while True:
+            try:
+                driver = self._driver_pool.get_nowait()
+            except queue.Empty:
+                return self._create_driver()
+            try:
+                driver.current_url  # liveness probe
+                return driver
+            except WebDriverException:
+                logger.debug("Discarding pooled driver whose session has ended")
+                self._quit_driver(driver)
+
+    def _release_driver_later(self, driver: webdriver.Chrome) -> None:
+        """Hand a driver to the cleanup worker for _release_driver and return at once."""
+        self._cleanup_executor.submit(self._release_driver, driver)
+
+    async def warm_driver_pool(self) -> None:
+        """
+        Start browsers until the driver pool is full.
+
+        The drivers are created concurrently, so a scheduled booking finds a
+        running Chrome instead of paying its start-up. A driver that fails to
+        start is logged and skipped; the operation that needs it creates one.
+        """
+        missing = _DRIVER_POOL_SIZE - self._driver_pool.qsize()
+        if missing <= 0:
+            return
+        created = await asyncio.gather(
+            *(asyncio.to_thread(self._create_driver) for _ in range(missing)),
+            return_exceptions=True,
+        )
+        for driver in created:
+            if isinstance(driver, BaseException):
+                logger.warning(f"Could not pre-start a browser: {driver}")
+                continue
+            try:
+                self._driver_pool.put_nowait(driver)
+            except queue.Full:
+                self._quit_driver(driver)
+
+    def _release_driver(self, driver: webdriver.Chrome) -> None:
+        """
+        Reset a driver and return it to the pool, quitting it if that fails.
+
+        Cookies are cleared, URL blocking reset and the page blanked so nothing
+        from one operation leaks into the next; the next operation restores the
+        login session from the saved cookies as usual. A full pool quits the
+        driver instead.
+        """
+        self._invalidate_slot_items(driver)
+        try:
+            driver.delete_all_cookies()
+            self._set_blocked_urls(driver)
+            driver.get("about:blank")
+            self._driver_pool.put_nowait(driver)
+        except (WebDriverException, queue.Full):
+            self._quit_driver(driver)
+
+    @staticmethod
+    def _set_blocked_urls(driver: webdriver.Chrome, extra: Sequence[str] = ()) -> None:
+        """
+        Make the browser refuse tracker and photo requests, plus any extra URL patterns.
+
+        Replaces whatever was blocked before, so calling it with no extra
+        patterns drops back to the always-blocked set. Failure only costs the saving, so
+        it is logged and ignored.
+        """
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": [*_ALWAYS_BLOCKED_URL_PATTERNS, *extra]}
+            )
+        except WebDriverException as e:
+            logger.debug(f"Could not set blocked URLs: {e}")
+
+    def _drain_driver_pool(self) -> None:
+        """Quit every idle pooled driver."""
+        while True:
+            try:
+                driver = self._driver_pool.get_nowait()
+            except queue.Empty:
+                return
+            self._quit_driver(driver)
+
+    def _quit_driver(self, driver: webdriver.Chrome) -> None:
+        """Quit a driver, ignoring a browser that is already gone."""
+        self._invalidate_slot_items(driver)
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            logger.debug(f"Error quitting driver: {e}")
+
     async def login(self) -> bool:
         """
         Log in to the Walden Golf member portal.
 
-        This method creates a temporary driver, logs in, and closes it.
+        This method borrows a pooled driver, logs in, and returns it.
         It is primarily useful for testing credentials.
 
         Returns:
@@ -669,42 +1999,44 @@ class WaldenGolfProvider(ReservationProvider):
         return await asyncio.to_thread(self._login_sync)
 
     def _login_sync(self) -> bool:
-        """Synchronous login implementation with full driver lifecycle."""
-        driver = self._create_driver()
+        """Synchronous login implementation on a pooled driver."""
+        driver = self._acquire_driver()
         try:
-            return self._perform_login(driver)
+            # login() exists to test credentials, which a replayed session would not
+            return self._perform_login(driver, reuse_session=False)
         finally:
-            driver.quit()
+            self._release_driver_later(driver)
 
-    def _perform_login(self, driver: webdriver.Chrome) -> bool:
+    def _perform_login(self, driver: webdriver.Chrome, reuse_session: bool = True) -> bool:
         """
         Perform the login flow on an existing driver.
 
+        When a session from an earlier login is still within its reuse window,
+        its cookies are replayed instead and the login form is skipped. A
+        replayed session the site no longer honours falls back to a full login.
+
         Args:
             driver: The WebDriver instance to use
+            reuse_session: Whether a cached session may stand in for the login form
 
         Returns:
             True if login was successful, False otherwise.
         """
+        if reuse_session and self._restore_session(driver):
+            return True
+
         try:
             logger.info("Navigating to login page...")
             driver.get(self.LOGIN_URL)
 
-            wait = WebDriverWait(driver, 15)
-            member_input = wait.until(
-                expected_conditions.presence_of_element_located(
-                    (By.NAME, DOM.LOGIN.member_input_name)
-                )
-            )
+            wait = self._page_wait(driver)
+            member_input = wait.until(_MEMBER_INPUT_PRESENT)
 
             password_input = driver.find_element(By.NAME, DOM.LOGIN.password_input_name)
 
             logger.info("Entering credentials...")
-            member_input.clear()
-            member_input.send_keys(settings.walden_member_number)
-
-            password_input.clear()
-            password_input.send_keys(settings.walden_password)
+            self._fill_input(driver, member_input, settings.walden_member_number)
+            self._fill_input(driver, password_input, settings.walden_password)
 
             submit_button = driver.find_element(By.CSS_SELECTOR, DOM.LOGIN.submit_button)
             current_url = driver.current_url
@@ -715,11 +2047,14 @@ class WaldenGolfProvider(ReservationProvider):
             except TimeoutException:
                 pass
 
-            if "login" not in driver.current_url.lower() or "home" in driver.current_url.lower():
-                logger.info(f"Login successful. Current URL: {driver.current_url}")
+            landed_url = driver.current_url
+            landed_url_lower = landed_url.lower()
+            if "login" not in landed_url_lower or "home" in landed_url_lower:
+                logger.info(f"Login successful. Current URL: {landed_url}")
+                self._remember_session(driver)
                 return True
 
-            logger.error(f"Login failed. Still on URL: {driver.current_url}")
+            logger.error(f"Login failed. Still on URL: {landed_url}")
             return False
 
         except TimeoutException as e:
@@ -729,6 +2064,75 @@ class WaldenGolfProvider(ReservationProvider):
             logger.error(f"Login WebDriver error: {e}")
             return False
 
+    def _fill_input(self, driver: webdriver.Chrome, element: WebElement, value: str) -> None:
+        """
+        Set an input's value in one command, firing the events typing would.
+
+        send_keys dispatches a WebDriver command per character, so a member
+        number and password cost dozens of round-trips. Assigning the value and
+        dispatching input/change lets the page's listeners see the same result.
+        """
+        driver.execute_script(_JS_FILL_INPUT, element, value)
+
+    def _remember_session(self, driver: webdriver.Chrome) -> None:
+        """Cache the driver's session cookies for replay into later drivers."""
+        try:
+            cookies = driver.get_cookies()
+        except WebDriverException as e:
+            logger.debug(f"Could not capture session cookies: {e}")
+            with self._session_lock:
+                self._session_cookies = None
+            return
+        with self._session_lock:
+            self._session_cookies = cookies
+            self._session_expiry = time_module.monotonic() + _SESSION_REUSE_TTL_S
+
+    def _forget_session(self, cookies: list[dict[str, Any]]) -> None:
+        """
+        Drop the cached session, if it is still the one that was just rejected.
+
+        Another driver may have logged in and cached a newer session since;
+        that one is kept.
+        """
+        with self._session_lock:
+            if self._session_cookies is cookies:
+                self._session_cookies = None
+
+    def _restore_session(self, driver: webdriver.Chrome) -> bool:
+        """
+        Replay cached session cookies into a fresh driver.
+
+        Cookies can only be set for the domain the driver is on, so this loads
+        the site root first, then confirms the session on the dashboard. A
+        redirect back to the login page means the server dropped the session.
+
+        Returns:
+            True if the driver is now logged in, False if a full login is needed.
+        """
+        with self._session_lock:
+            cookies = self._session_cookies
+            expiry = self._session_expiry
+        if not cookies or time_module.monotonic() >= expiry:
+            return False
+
+        try:
+            driver.get(self.BASE_URL)
+            for cookie in cookies:
+                driver.add_cookie(cookie)
+            driver.get(self.DASHBOARD_URL)
+            if "login" in driver.current_url.lower():
+                logger.info("Cached session was rejected, logging in again")
+                self._forget_session(cookies)
+                return False
+        except WebDriverException as e:
+            logger.info(f"Could not restore cached session, logging in again: {e}")
+            self._forget_session(cookies)
+            return False
+
+        logger.info("Reused cached login session")
+        self._remember_session(driver)
+        return True
+
     async def book_tee_time(
         self,
         target_date: date,
@@ -741,13 +2145,13 @@ class WaldenGolfProvider(ReservationProvider):
         Book a tee time at Northgate Country Club.
 
         This method runs the entire booking workflow in a background thread:
-        1. Creates a new WebDriver instance
+        1. Acquires a WebDriver from the pool
         2. Logs in to the member portal
         3. Navigates to the tee time booking page
         4. Selects the Northgate course and target date
         5. Finds the requested time slot (or nearest available within fallback window)
         6. Clicks Reserve, selects player count, and confirms the booking
-        7. Closes the WebDriver
+        7. Releases the WebDriver back to the pool
 
         The async interface is genuinely non-blocking - all Selenium operations
         run in a dedicated thread via asyncio.to_thread().
@@ -779,9 +2183,9 @@ class WaldenGolfProvider(ReservationProvider):
         tee_time_interval_minutes: int = 8,
     ) -> BookingResult:
         """
-        Synchronous booking implementation with full driver lifecycle.
+        Synchronous booking implementation on a pooled driver.
 
-        Creates driver, performs booking, and ensures cleanup in finally block.
+        Acquires a driver, performs booking, and releases it in the finally block.
         """
         # Calculate time range for logging
         target_minutes = target_time.hour * 60 + target_time.minute
@@ -805,7 +2209,7 @@ class WaldenGolfProvider(ReservationProvider):
             f"mode={'fast chain' if use_fast_js else 'Selenium'}"
             f"{' (direct HTTP enabled)' if use_fast_js and settings.walden_direct_http_booking else ''}"
         )
-        driver = self._create_driver()
+        driver = self._acquire_driver()
         try:
             logger.debug("BOOKING_DEBUG: Step 1/5 - Logging in to Walden Golf")
             if not self._perform_login(driver):
@@ -819,8 +2223,8 @@ class WaldenGolfProvider(ReservationProvider):
             logger.debug("BOOKING_DEBUG: Step 2/5 - Navigating to tee time booking page")
             driver.get(self.TEE_TIME_URL)
 
-            wait = WebDriverWait(driver, 15)
-            wait.until(expected_conditions.presence_of_element_located((By.CSS_SELECTOR, "form")))
+            wait = self._page_wait(driver)
+            wait.until(_FORM_PRESENT)
             logger.debug(f"BOOKING_DEBUG: Tee time page loaded. URL: {driver.current_url}")
 
             logger.debug("BOOKING_DEBUG: Step 3/5 - Selecting course and date")
@@ -844,14 +2248,7 @@ class WaldenGolfProvider(ReservationProvider):
                     ),
                 )
 
-            wait.until(
-                expected_conditions.presence_of_element_located(
-                    (
-                        By.CSS_SELECTOR,
-                        DOM.SLOT_DISCOVERY.page_loaded,
-                    )
-                )
-            )
+            wait.until(_TEE_SHEET_LOADED)
             logger.debug("BOOKING_DEBUG: Course and date selection complete")
 
             logger.debug("BOOKING_DEBUG: Step 4/5 - Finding and booking time slot")
@@ -887,8 +2284,8 @@ class WaldenGolfProvider(ReservationProvider):
                 error_message=f"Booking error: {str(e)}",
             )
         finally:
-            logger.debug("BOOKING_DEBUG: === BOOKING ATTEMPT COMPLETE - Closing driver ===")
-            driver.quit()
+            logger.debug("BOOKING_DEBUG: === BOOKING ATTEMPT COMPLETE - Releasing driver ===")
+            self._release_driver_later(driver)
 
     async def book_multiple_tee_times(
         self,
@@ -900,7 +2297,7 @@ class WaldenGolfProvider(ReservationProvider):
         Book multiple tee times in a single session for efficiency.
 
         This method is optimized for booking multiple tee times on the same date:
-        1. Creates a single WebDriver session
+        1. Acquires a single pooled WebDriver session
         2. Logs in once
         3. If execute_at is provided, waits until that time before booking
         4. Books all requested times in sequence
@@ -916,6 +2313,8 @@ class WaldenGolfProvider(ReservationProvider):
         Returns:
             BatchBookingResult with results for each booking request
         """
+        if settings.walden_parallel_batch_booking and len(requests) > 1:
+            return await self._book_batch_in_parallel(target_date, requests, execute_at)
         return await asyncio.to_thread(
             self._book_multiple_tee_times_sync,
             target_date,
@@ -923,21 +2322,96 @@ class WaldenGolfProvider(ReservationProvider):
             execute_at,
         )
 
+    async def _book_batch_in_parallel(
+        self,
+        target_date: date,
+        requests: list[BatchBookingRequest],
+        execute_at: datetime | None,
+    ) -> BatchBookingResult:
+        """
+        Book the batch on up to _DRIVER_POOL_SIZE drivers, concurrently.
+
+        The time-sorted requests are split into contiguous groups, one per
+        session, and each group runs as its own sequential batch. The sessions
+        book at the same time, so each one holds back every target of the
+        other groups, earlier ones included: a fallback landing on another
+        session's target would race that session for the slot. Every session
+        logs in through the form rather than replaying the cached cookies, so
+        none of them shares a server-side session with another. A session that
+        raises fails its own requests rather than losing the others.
+        """
+        sorted_requests = sorted(requests, key=lambda r: r.target_time)
+
+        sessions = min(len(sorted_requests), _DRIVER_POOL_SIZE)
+        size, extra = divmod(len(sorted_requests), sessions)
+        all_targets = {req.target_time for req in sorted_requests}
+        groups: list[tuple[list[BatchBookingRequest], frozenset[time]]] = []
+        start = 0
+        for n in range(sessions):
+            end = start + size + (1 if n < extra else 0)
+            group = sorted_requests[start:end]
+            own_targets = {req.target_time for req in group}
+            groups.append((group, frozenset(all_targets - own_targets)))
+            start = end
+        logger.info(
+            f"BATCH_BOOKING: Booking {len(sorted_requests)} requests on "
+            f"{sessions} parallel sessions"
+        )
+
+        outcomes = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._book_multiple_tee_times_sync,
+                    target_date,
+                    group,
+                    execute_at,
+                    reserved,
+                    reuse_session=False,
+                )
+                for group, reserved in groups
+            ),
+            return_exceptions=True,
+        )
+
+        combined = BatchBookingResult()
+        for (group, _), outcome in zip(groups, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    f"BATCH_BOOKING: Parallel session for booking_ids="
+                    f"{[req.booking_id for req in group]} raised: {outcome}"
+                )
+                outcome = BatchBookingResult(
+                    results=[
+                        self._failed_item(req.booking_id, f"Booking error: {outcome}")
+                        for req in group
+                    ],
+                    total_failed=len(group),
+                )
+            combined.results.extend(outcome.results)
+            combined.total_succeeded += outcome.total_succeeded
+            combined.total_failed += outcome.total_failed
+        return combined
+
     def _book_multiple_tee_times_sync(
         self,
         target_date: date,
         requests: list[BatchBookingRequest],
         execute_at: datetime | None,
+        reserved_times: frozenset[time] = frozenset(),
+        reuse_session: bool = True,
     ) -> BatchBookingResult:
         """
-        Synchronous batch booking implementation with single driver lifecycle.
+        Synchronous batch booking implementation on a single pooled driver.
 
-        Creates driver once, logs in once, then books all requested times in sequence.
+        Acquires a driver once, logs in once, then books all requested times in sequence.
         If execute_at is provided, waits until that time before refreshing and booking.
 
         Requests are sorted by target_time to process earlier times first, which helps
         avoid conflicts where a fallback slot for an earlier booking takes a slot needed
-        by a later booking.
+        by a later booking. reserved_times are kept off every fallback as well; the
+        parallel batch uses them for targets being booked on other sessions.
+        reuse_session is passed to _perform_login; the parallel batch turns it
+        off so each of its sessions logs in on its own.
         """
         if not requests:
             return BatchBookingResult()
@@ -946,12 +2420,26 @@ class WaldenGolfProvider(ReservationProvider):
         # This helps avoid conflicts where fallback slots overlap with later bookings
         sorted_requests = sorted(requests, key=lambda r: r.target_time)
 
-        # Build list of all requested times and their fallback windows for conflict detection
-        # Each entry is (target_time, fallback_window_minutes, booking_id)
-        pending_booking_times: list[tuple[time, int, str]] = [
-            (req.target_time, req.fallback_window_minutes, req.booking_id)
-            for req in sorted_requests
+        # Target times of later bookings, per request, for conflict detection
+        later_target_times = [
+            later | reserved_times for later in _later_target_times(sorted_requests)
         ]
+        # Last minute any request from index i onward can book, for the
+        # pre-scrolls: suffix maxima of each request's fallback window end
+        remaining_end_minutes = list(
+            accumulate(
+                (
+                    min(
+                        24 * 60 - 1,
+                        req.target_time.hour * 60
+                        + req.target_time.minute
+                        + req.fallback_window_minutes,
+                    )
+                    for req in reversed(sorted_requests)
+                ),
+                max,
+            )
+        )[::-1]
 
         logger.info(
             f"BATCH_BOOKING: === STARTING BATCH BOOKING === "
@@ -965,22 +2453,16 @@ class WaldenGolfProvider(ReservationProvider):
         total_succeeded = 0
         total_failed = 0
 
-        driver = self._create_driver()
+        driver = self._acquire_driver()
         try:
             logger.info("BATCH_BOOKING: Step 1 - Logging in to Walden Golf")
-            if not self._perform_login(driver):
+            if not self._perform_login(driver, reuse_session=reuse_session):
                 logger.error("BATCH_BOOKING: Login failed")
-                for req in sorted_requests:
-                    results.append(
-                        BatchBookingItemResult(
-                            booking_id=req.booking_id,
-                            result=BookingResult(
-                                success=False,
-                                error_message="Failed to log in to Walden Golf",
-                            ),
-                        )
-                    )
-                    total_failed += 1
+                results.extend(
+                    self._failed_item(req.booking_id, "Failed to log in to Walden Golf")
+                    for req in sorted_requests
+                )
+                total_failed += len(sorted_requests)
                 return BatchBookingResult(
                     results=results,
                     total_succeeded=total_succeeded,
@@ -991,26 +2473,18 @@ class WaldenGolfProvider(ReservationProvider):
             logger.info("BATCH_BOOKING: Step 2 - Navigating to tee time booking page")
             driver.get(self.TEE_TIME_URL)
 
-            wait = WebDriverWait(driver, 15)
-            wait.until(expected_conditions.presence_of_element_located((By.CSS_SELECTOR, "form")))
+            wait = self._page_wait(driver)
+            wait.until(_FORM_PRESENT)
             logger.info(f"BATCH_BOOKING: Tee time page loaded. URL: {driver.current_url}")
 
             logger.info("BATCH_BOOKING: Step 3 - Selecting course")
             if not self._select_course_sync(driver, self.NORTHGATE_COURSE_NAME):
                 logger.error("BATCH_BOOKING: Course selection/verification failed")
-                for req in sorted_requests:
-                    results.append(
-                        BatchBookingItemResult(
-                            booking_id=req.booking_id,
-                            result=BookingResult(
-                                success=False,
-                                error_message=(
-                                    f"Failed to select or verify {self.NORTHGATE_COURSE_NAME} course."
-                                ),
-                            ),
-                        )
-                    )
-                    total_failed += 1
+                error_message = f"Failed to select or verify {self.NORTHGATE_COURSE_NAME} course."
+                results.extend(
+                    self._failed_item(req.booking_id, error_message) for req in sorted_requests
+                )
+                total_failed += len(sorted_requests)
                 return BatchBookingResult(
                     results=results,
                     total_succeeded=total_succeeded,
@@ -1024,55 +2498,35 @@ class WaldenGolfProvider(ReservationProvider):
             logger.info("BATCH_BOOKING: Step 4 - Selecting date")
             if not self._select_date_sync(driver, target_date):
                 logger.error("BATCH_BOOKING: Date selection failed")
-                for req in sorted_requests:
-                    results.append(
-                        BatchBookingItemResult(
-                            booking_id=req.booking_id,
-                            result=BookingResult(
-                                success=False,
-                                error_message=(
-                                    f"Failed to select date {target_date.strftime('%m/%d/%Y')}. "
-                                    f"Cannot proceed with booking - would search wrong date."
-                                ),
-                            ),
-                        )
-                    )
-                    total_failed += 1
+                error_message = (
+                    f"Failed to select date {target_date.strftime('%m/%d/%Y')}. "
+                    f"Cannot proceed with booking - would search wrong date."
+                )
+                results.extend(
+                    self._failed_item(req.booking_id, error_message) for req in sorted_requests
+                )
+                total_failed += len(sorted_requests)
                 return BatchBookingResult(
                     results=results,
                     total_succeeded=total_succeeded,
                     total_failed=total_failed,
                 )
 
-            wait.until(
-                expected_conditions.presence_of_element_located(
-                    (
-                        By.CSS_SELECTOR,
-                        DOM.SLOT_DISCOVERY.page_loaded,
-                    )
-                )
-            )
+            wait.until(_TEE_SHEET_LOADED)
             logger.info("BATCH_BOOKING: Date selection complete")
 
             # Step 5 - Pre-scroll tee sheet to load all needed slot items
-            max_needed_minutes = None
-            for req in sorted_requests:
-                req_minutes = req.target_time.hour * 60 + req.target_time.minute
-                req_end_minutes = min(24 * 60 - 1, req_minutes + req.fallback_window_minutes)
-                if max_needed_minutes is None or req_end_minutes > max_needed_minutes:
-                    max_needed_minutes = req_end_minutes
-
-            if max_needed_minutes is not None:
-                logger.info(
-                    "BATCH_BOOKING: Step 5 - Pre-scrolling tee sheet to latest needed time "
-                    f"{time(max_needed_minutes // 60, max_needed_minutes % 60).strftime('%I:%M %p')}"
-                )
-                self._scroll_to_load_all_slots(
-                    driver,
-                    target_time=sorted_requests[-1].target_time,
-                    fallback_window_minutes=sorted_requests[-1].fallback_window_minutes,
-                    max_time_minutes_override=max_needed_minutes,
-                )
+            max_needed_minutes = remaining_end_minutes[0]
+            logger.info(
+                "BATCH_BOOKING: Step 5 - Pre-scrolling tee sheet to latest needed time "
+                f"{time(max_needed_minutes // 60, max_needed_minutes % 60).strftime('%I:%M %p')}"
+            )
+            self._scroll_to_load_all_slots(
+                driver,
+                target_time=sorted_requests[-1].target_time,
+                fallback_window_minutes=sorted_requests[-1].fallback_window_minutes,
+                max_time_minutes_override=max_needed_minutes,
+            )
 
             # Step 6 - Pre-locate target slots using JavaScript
             # When execute_at is set, we scan the DOM NOW (before the booking
@@ -1094,28 +2548,26 @@ class WaldenGolfProvider(ReservationProvider):
                     "BATCH_BOOKING: Step 6 - Pre-locating target slots via JavaScript "
                     f"for {len(sorted_requests)} request(s)"
                 )
-                for req in sorted_requests:
-                    # Build a preliminary times_to_exclude using only the known
-                    # target times of other requests (booked_times is empty here).
-                    prelim_exclude: set[time] = set()
-                    req_minutes = req.target_time.hour * 60 + req.target_time.minute
-                    for later_time, _later_window, later_id in pending_booking_times:
-                        if later_id == req.booking_id:
-                            continue
-                        later_minutes = later_time.hour * 60 + later_time.minute
-                        if later_minutes > req_minutes:
-                            prelim_exclude.add(later_time)
-
-                    slot = self._find_target_slot_js(
-                        driver,
-                        req.target_time,
-                        req.num_players,
-                        req.fallback_window_minutes,
-                        req.tee_time_interval_minutes,
-                        prelim_exclude,
+                specs: list[dict[str, Any]] = []
+                for req, prelim_exclude in zip(sorted_requests, later_target_times):
+                    # The preliminary times_to_exclude holds only the known
+                    # target times of later requests (booked_times is empty here).
+                    specs.append(
+                        {
+                            "bookingId": req.booking_id,
+                            "targetHour": req.target_time.hour,
+                            "targetMinute": req.target_time.minute,
+                            "minPlayers": req.num_players,
+                            "fallbackMinutes": req.fallback_window_minutes,
+                            "intervalMinutes": req.tee_time_interval_minutes,
+                            "excludeTimes": [{"h": t.hour, "m": t.minute} for t in prelim_exclude],
+                        }
                     )
+
+                prelocated_slots = self._find_target_slots_js_batch(driver, specs)
+                for req in sorted_requests:
+                    slot = prelocated_slots.get(req.booking_id)
                     if slot is not None:
-                        prelocated_slots[req.booking_id] = slot
                         slot_time = time(slot["hours"], slot["minutes"])
                         logger.info(
                             f"BATCH_BOOKING: Pre-located slot for booking_id={req.booking_id}: "
@@ -1175,18 +2627,7 @@ class WaldenGolfProvider(ReservationProvider):
             for i, req in enumerate(sorted_requests, 1):
                 # Calculate times to exclude: times already booked + times needed by later bookings
                 # This prevents a fallback slot from taking a time needed by a later booking
-                times_to_exclude = booked_times.copy()
-
-                # Add times that are within the fallback window of later bookings
-                for later_time, later_window, later_id in pending_booking_times:
-                    if later_id == req.booking_id:
-                        continue  # Skip current booking
-                    # Check if this later booking's target time could conflict
-                    later_minutes = later_time.hour * 60 + later_time.minute
-                    current_minutes = req.target_time.hour * 60 + req.target_time.minute
-                    # Only protect times for bookings that haven't been processed yet
-                    if later_minutes > current_minutes:
-                        times_to_exclude.add(later_time)
+                times_to_exclude = booked_times | later_target_times[i - 1]
 
                 # Every booking carries the target timestamp, not just the first.
                 # Giving it only to booking 1 made the whole batch's 6:30 gate
@@ -1249,64 +2690,29 @@ class WaldenGolfProvider(ReservationProvider):
                             "BATCH_BOOKING: Navigating back to tee time page for next booking"
                         )
                         driver.get(self.TEE_TIME_URL)
-                        wait.until(
-                            expected_conditions.presence_of_element_located(
-                                (By.CSS_SELECTOR, "form")
-                            )
-                        )
+                        wait.until(_FORM_PRESENT)
                         if not self._select_course_sync(driver, self.NORTHGATE_COURSE_NAME):
                             logger.warning("BATCH_BOOKING: Course re-selection failed")
                         if not self._select_date_sync(driver, target_date):
                             logger.error("BATCH_BOOKING: Date re-selection failed for next booking")
                             # Continue with remaining bookings but they will likely fail
-                        wait.until(
-                            expected_conditions.presence_of_element_located(
-                                (
-                                    By.CSS_SELECTOR,
-                                    DOM.SLOT_DISCOVERY.page_loaded,
-                                )
-                            )
-                        )
-
-                        remaining_needed_minutes = None
-                        for remaining_req in sorted_requests[i:]:
-                            remaining_minutes = (
-                                remaining_req.target_time.hour * 60
-                                + remaining_req.target_time.minute
-                            )
-                            remaining_end_minutes = min(
-                                24 * 60 - 1,
-                                remaining_minutes + remaining_req.fallback_window_minutes,
-                            )
-                            if (
-                                remaining_needed_minutes is None
-                                or remaining_end_minutes > remaining_needed_minutes
-                            ):
-                                remaining_needed_minutes = remaining_end_minutes
+                        wait.until(_TEE_SHEET_LOADED)
 
-                        if remaining_needed_minutes is not None:
-                            logger.info(
-                                "BATCH_BOOKING: Pre-scrolling tee sheet for remaining bookings to "
-                                f"{time(remaining_needed_minutes // 60, remaining_needed_minutes % 60).strftime('%I:%M %p')}"
-                            )
-                            self._scroll_to_load_all_slots(
-                                driver,
-                                target_time=sorted_requests[-1].target_time,
-                                fallback_window_minutes=sorted_requests[-1].fallback_window_minutes,
-                                max_time_minutes_override=remaining_needed_minutes,
-                            )
+                        remaining_needed_minutes = remaining_end_minutes[i]
+                        logger.info(
+                            "BATCH_BOOKING: Pre-scrolling tee sheet for remaining bookings to "
+                            f"{time(remaining_needed_minutes // 60, remaining_needed_minutes % 60).strftime('%I:%M %p')}"
+                        )
+                        self._scroll_to_load_all_slots(
+                            driver,
+                            target_time=sorted_requests[-1].target_time,
+                            fallback_window_minutes=sorted_requests[-1].fallback_window_minutes,
+                            max_time_minutes_override=remaining_needed_minutes,
+                        )
 
                 except Exception as e:
                     logger.error(f"BATCH_BOOKING: Booking {i}/{len(sorted_requests)} ERROR - {e}")
-                    results.append(
-                        BatchBookingItemResult(
-                            booking_id=req.booking_id,
-                            result=BookingResult(
-                                success=False,
-                                error_message=f"Booking error: {str(e)}",
-                            ),
-                        )
-                    )
+                    results.append(self._failed_item(req.booking_id, f"Booking error: {str(e)}"))
                     total_failed += 1
 
             logger.info(
@@ -1323,16 +2729,12 @@ class WaldenGolfProvider(ReservationProvider):
         except TimeoutException as e:
             logger.error(f"BATCH_BOOKING: Timeout exception: {e}")
             self._capture_diagnostic_info(driver, "batch_booking_timeout")
+            recorded = {r.booking_id for r in results}
             for req in sorted_requests:
-                if not any(r.booking_id == req.booking_id for r in results):
+                if req.booking_id not in recorded:
+                    recorded.add(req.booking_id)
                     results.append(
-                        BatchBookingItemResult(
-                            booking_id=req.booking_id,
-                            result=BookingResult(
-                                success=False,
-                                error_message=f"Batch booking timeout: {str(e)}",
-                            ),
-                        )
+                        self._failed_item(req.booking_id, f"Batch booking timeout: {str(e)}")
                     )
                     total_failed += 1
             return BatchBookingResult(
@@ -1343,16 +2745,12 @@ class WaldenGolfProvider(ReservationProvider):
         except WebDriverException as e:
             logger.error(f"BATCH_BOOKING: WebDriver exception: {e}")
             self._capture_diagnostic_info(driver, "batch_booking_webdriver_error")
+            recorded = {r.booking_id for r in results}
             for req in sorted_requests:
-                if not any(r.booking_id == req.booking_id for r in results):
+                if req.booking_id not in recorded:
+                    recorded.add(req.booking_id)
                     results.append(
-                        BatchBookingItemResult(
-                            booking_id=req.booking_id,
-                            result=BookingResult(
-                                success=False,
-                                error_message=f"Batch booking error: {str(e)}",
-                            ),
-                        )
+                        self._failed_item(req.booking_id, f"Batch booking error: {str(e)}")
                     )
                     total_failed += 1
             return BatchBookingResult(
@@ -1361,8 +2759,16 @@ class WaldenGolfProvider(ReservationProvider):
                 total_failed=total_failed,
             )
         finally:
-            logger.info("BATCH_BOOKING: === BATCH BOOKING COMPLETE - Closing driver ===")
-            driver.quit()
+            logger.info("BATCH_BOOKING: === BATCH BOOKING COMPLETE - Releasing driver ===")
+            self._release_driver_later(driver)
+
+    @staticmethod
+    def _failed_item(booking_id: str, error_message: str) -> BatchBookingItemResult:
+        """A batch item result recording a booking that was not made."""
+        return BatchBookingItemResult(
+            booking_id=booking_id,
+            result=BookingResult(success=False, error_message=error_message),
+        )
 
     def _select_course_sync(self, driver: webdriver.Chrome, course_name: str) -> bool:
         """
@@ -1432,27 +2838,9 @@ class WaldenGolfProvider(ReservationProvider):
             True if checkbox dropdown was found and configured, False otherwise
         """
         try:
-            dropdown_trigger_selectors = [
-                "[class*='select'][class*='course']",
-                "div[class*='multiselect']",
-                "button[class*='dropdown']",
-                ".course-dropdown",
-                "[aria-label*='course' i]",
-                "[placeholder*='course' i]",
-            ]
-
-            dropdown_trigger = None
-            for selector in dropdown_trigger_selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in elements:
-                        if elem.is_displayed():
-                            dropdown_trigger = elem
-                            break
-                    if dropdown_trigger:
-                        break
-                except NoSuchElementException:
-                    continue
+            dropdown_trigger = self._first_displayed_by_priority(
+                driver, _COURSE_DROPDOWN_TRIGGER_SELECTORS
+            )
 
             if not dropdown_trigger:
                 try:
@@ -1469,67 +2857,33 @@ class WaldenGolfProvider(ReservationProvider):
                 logger.debug("No checkbox dropdown trigger found for course selection")
                 return False
 
+            shown_before = self._count_shown_course_options(driver)
             dropdown_trigger.click()
             logger.info("Opened course selection dropdown")
-            self.wait_strategy.simple_wait(fixed_duration=0.5, event_driven_duration=0.1)
-
-            checkbox_items = driver.find_elements(
-                By.CSS_SELECTOR,
-                "input[type='checkbox'], "
-                "li[class*='option'], "
-                "div[class*='option'], "
-                "label[class*='checkbox']",
+            self._wait_for_course_options(
+                driver, lambda shown: shown is None or shown > (shown_before or 0), "open"
             )
 
-            if not checkbox_items:
-                checkbox_items = driver.find_elements(
-                    By.XPATH,
-                    "//li[.//input[@type='checkbox']] | "
-                    "//div[contains(@class, 'option')] | "
-                    "//label[contains(@class, 'check')]",
-                )
-
-            target_found = False
-            deselect_found = False
-
-            for item in checkbox_items:
-                item_text = item.text.lower() if item.text else ""
-                if not item_text:
-                    try:
-                        item_text = (item.get_attribute("textContent") or "").lower()
-                    except Exception:
-                        continue
-
-                if target_course.lower() in item_text:
-                    target_found = True
-                    checkbox = self._find_checkbox_in_element(driver, item, target_course)
-                    if checkbox and not checkbox.is_selected():
-                        self._click_checkbox_or_label(driver, item, checkbox)
-                        logger.info(f"Checked '{target_course}' in course dropdown")
-                    elif checkbox and checkbox.is_selected():
-                        logger.info(f"'{target_course}' already checked")
-
-                elif course_to_deselect.lower() in item_text:
-                    deselect_found = True
-                    checkbox = self._find_checkbox_in_element(driver, item, course_to_deselect)
-                    if checkbox and checkbox.is_selected():
-                        self._click_checkbox_or_label(driver, item, checkbox)
-                        logger.info(f"Unchecked '{course_to_deselect}' in course dropdown")
-                    elif checkbox and not checkbox.is_selected():
-                        logger.info(f"'{course_to_deselect}' already unchecked")
+            configured = self._configure_course_checkboxes_js(
+                driver, target_course, course_to_deselect
+            )
+            if configured is None:
+                configured = self._configure_course_checkboxes(
+                    driver, target_course, course_to_deselect
+                )
+            target_found, deselect_found = configured
 
+            # A miss is an empty list rather than an exception, and whichever
+            # control is clicked, a failure falls through to a body click
+            close_buttons = driver.find_elements(By.CSS_SELECTOR, _COURSE_DROPDOWN_CLOSE_SELECTOR)
             try:
-                close_button = driver.find_element(
-                    By.CSS_SELECTOR, "[class*='close'], .x, button[aria-label='close']"
-                )
-                close_button.click()
-            except NoSuchElementException:
-                try:
-                    dropdown_trigger.click()
-                except Exception:
-                    driver.find_element(By.TAG_NAME, "body").click()
+                (close_buttons[0] if close_buttons else dropdown_trigger).click()
+            except WebDriverException:
+                driver.find_element(By.TAG_NAME, "body").click()
 
-            self.wait_strategy.simple_wait(fixed_duration=0.5, event_driven_duration=0.1)
+            self._wait_for_course_options(
+                driver, lambda shown: shown is None or shown <= (shown_before or 0), "close"
+            )
 
             if target_found:
                 logger.info(
@@ -1545,10 +2899,132 @@ class WaldenGolfProvider(ReservationProvider):
             logger.debug(f"Checkbox dropdown selection failed: {e}")
             return False
 
+    def _count_shown_course_options(self, driver: webdriver.Chrome) -> int | None:
+        """Number of rendered course options, or None if it cannot be read."""
+        try:
+            shown = driver.execute_script(
+                _JS_COUNT_SHOWN_COURSE_OPTIONS, _COURSE_OPTION_ITEM_SELECTOR
+            )
+        except WebDriverException:
+            return None
+        return shown if isinstance(shown, int) else None
+
+    def _wait_for_course_options(
+        self,
+        driver: webdriver.Chrome,
+        settled: Callable[[int | None], bool],
+        action: str,
+    ) -> None:
+        """Wait until the rendered course option count satisfies ``settled``."""
+        try:
+            WebDriverWait(
+                driver, _COURSE_DROPDOWN_WAIT_S, poll_frequency=_COURSE_DROPDOWN_POLL_S
+            ).until(lambda d: settled(self._count_shown_course_options(d)))
+        except TimeoutException:
+            logger.debug(
+                f"Course dropdown did not finish {action} within {_COURSE_DROPDOWN_WAIT_S}s"
+            )
+
+    def _configure_course_checkboxes_js(
+        self, driver: webdriver.Chrome, target_course: str, course_to_deselect: str
+    ) -> tuple[bool, bool] | None:
+        """
+        Check the target course and uncheck the other in one script call.
+
+        Returns (target_found, deselect_found), or None if the script cannot
+        run so the caller can fall back to the per-option walk.
+        """
+        try:
+            result = driver.execute_script(
+                _JS_CONFIGURE_COURSE_CHECKBOXES,
+                _COURSE_OPTION_ITEM_SELECTOR,
+                target_course,
+                course_to_deselect,
+                _COURSE_OPTION_ITEM_XPATH,
+            )
+        except WebDriverException as e:
+            logger.debug(f"Batched course checkbox configuration failed: {e}")
+            return None
+        if not isinstance(result, dict):
+            return None
+
+        if result.get("targetChecked"):
+            logger.info(f"Checked '{target_course}' in course dropdown")
+        elif result.get("targetAlready"):
+            logger.info(f"'{target_course}' already checked")
+        if result.get("deselectUnchecked"):
+            logger.info(f"Unchecked '{course_to_deselect}' in course dropdown")
+        elif result.get("deselectAlready"):
+            logger.info(f"'{course_to_deselect}' already unchecked")
+
+        return bool(result.get("targetFound")), bool(result.get("deselectFound"))
+
+    def _configure_course_checkboxes(
+        self, driver: webdriver.Chrome, target_course: str, course_to_deselect: str
+    ) -> tuple[bool, bool]:
+        """
+        Check the target course and uncheck the other, one option at a time.
+
+        Returns (target_found, deselect_found).
+        """
+        checkbox_items = driver.find_elements(By.CSS_SELECTOR, _COURSE_OPTION_ITEM_SELECTOR)
+
+        if not checkbox_items:
+            checkbox_items = driver.find_elements(By.XPATH, _COURSE_OPTION_ITEM_XPATH)
+
+        target_found = False
+        deselect_found = False
+        target_lower = target_course.lower()
+        deselect_lower = course_to_deselect.lower()
+        sibling_lookups: dict[str, Any | None] = {}
+
+        for item in checkbox_items:
+            item_text = (item.text or "").lower()
+            if not item_text:
+                try:
+                    item_text = (item.get_attribute("textContent") or "").lower()
+                except Exception:
+                    continue
+
+            if target_lower in item_text:
+                target_found = True
+                checkbox = self._find_checkbox_in_element(
+                    driver, item, target_course, sibling_lookups
+                )
+                if checkbox and not checkbox.is_selected():
+                    self._click_checkbox_or_label(driver, item, checkbox)
+                    logger.info(f"Checked '{target_course}' in course dropdown")
+                elif checkbox and checkbox.is_selected():
+                    logger.info(f"'{target_course}' already checked")
+
+            elif deselect_lower in item_text:
+                deselect_found = True
+                checkbox = self._find_checkbox_in_element(
+                    driver, item, course_to_deselect, sibling_lookups
+                )
+                if checkbox and checkbox.is_selected():
+                    self._click_checkbox_or_label(driver, item, checkbox)
+                    logger.info(f"Unchecked '{course_to_deselect}' in course dropdown")
+                elif checkbox and not checkbox.is_selected():
+                    logger.info(f"'{course_to_deselect}' already unchecked")
+
+        return target_found, deselect_found
+
     def _find_checkbox_in_element(
-        self, driver: webdriver.Chrome, container: Any, course_name: str
+        self,
+        driver: webdriver.Chrome,
+        container: Any,
+        course_name: str,
+        sibling_lookups: dict[str, Any | None] | None = None,
     ) -> Any | None:
-        """Find the checkbox input within a container element."""
+        """
+        Find the checkbox input within a container element.
+
+        The last resort is a document-wide search for a checkbox beside the
+        course label, whose answer does not depend on the container. Pass the
+        same ``sibling_lookups`` dict for every option of one dropdown so that
+        search runs at most once per course name.
+        """
         try:
             return container.find_element(By.CSS_SELECTOR, "input[type='checkbox']")
         except NoSuchElementException:
@@ -1559,8 +3035,12 @@ class WaldenGolfProvider(ReservationProvider):
         except NoSuchElementException:
             pass
 
+        if sibling_lookups is not None and course_name in sibling_lookups:
+            return sibling_lookups[course_name]
+
+        checkbox = None
         try:
-            return driver.find_element(
+            checkbox = driver.find_element(
                 By.XPATH,
                 f"//input[@type='checkbox'][following-sibling::*[contains(text(), '{course_name}')] "
                 f"or preceding-sibling::*[contains(text(), '{course_name}')]]",
@@ -1568,10 +3048,24 @@ class WaldenGolfProvider(ReservationProvider):
         except NoSuchElementException:
             pass
 
-        return None
+        if sibling_lookups is not None:
+            sibling_lookups[course_name] = checkbox
+        return checkbox
+
+    def _body_text(self, driver: webdriver.Chrome) -> str:
+        """
+        Get the rendered text of <body>, or "" if it cannot be read.
+
+        The body's innerText comes back in one script call; the element lookup
+        plus ``.text`` read (two round-trips) is the fallback.
+        """
+        try:
+            body_text = driver.execute_script(_JS_BODY_TEXT)
+            if isinstance(body_text, str) and body_text.strip():
+                return body_text
+        except Exception:
+            pass
 
-    def _get_visible_page_text(self, driver: webdriver.Chrome) -> str:
-        """Get visible text from the page (prefer <body>.text over raw HTML source)."""
         try:
             body = driver.find_element(By.TAG_NAME, "body")
             body_text = getattr(body, "text", "")
@@ -1580,7 +3074,23 @@ class WaldenGolfProvider(ReservationProvider):
         except Exception:
             pass
 
-        page_source = getattr(driver, "page_source", "")
+        return ""
+
+    def _get_visible_page_text(self, driver: webdriver.Chrome) -> str:
+        """
+        Get visible text from the page (prefer <body> text over raw HTML source).
+
+        The body text is a fraction of the size of page_source, which is only
+        the fallback. Returns "" if neither can be read.
+        """
+        body_text = self._body_text(driver)
+        if body_text:
+            return body_text
+
+        try:
+            page_source = getattr(driver, "page_source", "")
+        except WebDriverException:
+            return ""
         return page_source if isinstance(page_source, str) else ""
 
     def _container_message_text(self, element: Any) -> str:
@@ -1607,32 +3117,21 @@ class WaldenGolfProvider(ReservationProvider):
 
         return (getattr(element, "text", "") or "").strip()
 
-    def _extract_booking_error_message(self, driver: webdriver.Chrome) -> str | None:
-        """Extract user-visible booking error text from common alert/message containers."""
+    def _extract_booking_error_message(
+        self, driver: webdriver.Chrome, page_text: str | None = None
+    ) -> str | None:
+        """
+        Extract user-visible booking error text from common alert/message containers.
+
+        page_text is the visible text already read from this page, if any; the
+        fallback snippet is taken from it instead of reading the page again.
+        """
         selectors = DOM.ERROR_MESSAGES.containers
 
         try:
-            messages: list[str] = []
-            for sel in selectors:
-                try:
-                    for el in driver.find_elements(By.CSS_SELECTOR, sel)[:10]:
-                        try:
-                            if (el.get_attribute("aria-hidden") or "").lower() == "true":
-                                continue
-                        except Exception:
-                            pass
-
-                        try:
-                            if not el.is_displayed():
-                                continue
-                        except Exception:
-                            pass
-
-                        text = self._container_message_text(el)
-                        if text:
-                            messages.append(text)
-                except Exception:
-                    continue
+            messages = self._visible_message_texts_js(driver, selectors)
+            if messages is None:
+                messages = self._visible_message_texts(driver, selectors)
 
             if messages:
                 unique: list[str] = []
@@ -1645,7 +3144,7 @@ class WaldenGolfProvider(ReservationProvider):
             pass
 
         # Fallback: provide a short snippet of visible text if it contains likely failure words.
-        visible_text = self._get_visible_page_text(driver)
+        visible_text = page_text if page_text is not None else self._get_visible_page_text(driver)
         visible_lower = visible_text.lower()
         if any(word in visible_lower for word in ("error", "unable", "failed", "unavailable")):
             snippet = " ".join(visible_text.split())
@@ -1653,6 +3152,61 @@ class WaldenGolfProvider(ReservationProvider):
 
         return None
 
+    def _visible_message_texts_js(
+        self, driver: webdriver.Chrome, selectors: Sequence[str]
+    ) -> list[str] | None:
+        """Message text of every displayed container, read in one script call.
+
+        Returns None if the script cannot run, so the caller can fall back to
+        the per-element walk.
+        """
+        try:
+            containers = driver.execute_script(_JS_VISIBLE_MESSAGE_CONTAINERS, list(selectors))
+        except WebDriverException as e:
+            logger.debug(f"Batched message container read failed: {e}")
+            return None
+        if not isinstance(containers, list):
+            return None
+
+        messages: list[str] = []
+        for container in containers:
+            if not isinstance(container, dict):
+                continue
+            markup = container.get("html")
+            text = container_message_text(markup) if isinstance(markup, str) and markup else ""
+            if not text:
+                text = str(container.get("text") or "").strip()
+            if text:
+                messages.append(text)
+        return messages
+
+    def _visible_message_texts(
+        self, driver: webdriver.Chrome, selectors: Sequence[str]
+    ) -> list[str]:
+        """Message text of every displayed container, one element at a time."""
+        messages: list[str] = []
+        for sel in selectors:
+            try:
+                for el in driver.find_elements(By.CSS_SELECTOR, sel)[:10]:
+                    try:
+                        if (el.get_attribute("aria-hidden") or "").lower() == "true":
+                            continue
+                    except Exception:
+                        pass
+
+                    try:
+                        if not el.is_displayed():
+                            continue
+                    except Exception:
+                        pass
+
+                    text = self._container_message_text(el)
+                    if text:
+                        messages.append(text)
+            except Exception:
+                continue
+        return messages
+
     def _click_checkbox_or_label(
         self, driver: webdriver.Chrome, container: Any, checkbox: Any
     ) -> None:
@@ -1677,7 +3231,7 @@ class WaldenGolfProvider(ReservationProvider):
             pass
 
         try:
-            driver.execute_script("arguments[0].click();", checkbox)
+            driver.execute_script(_JS_CLICK, checkbox)
         except Exception as e:
             logger.warning(f"Failed to click checkbox: {e}")
 
@@ -1694,25 +3248,20 @@ class WaldenGolfProvider(ReservationProvider):
         Returns:
             True if course was selected, False otherwise
         """
-        course_dropdown_selectors = [
-            "select[id*='course']",
-            "select[name*='course']",
-            "select[id*='Course']",
-            "select[name*='Course']",
-            "select.course-select",
-            "#courseSelect",
-        ]
+        if not driver.find_elements(By.CSS_SELECTOR, _COURSE_SELECT_ANY):
+            return False
 
-        for selector in course_dropdown_selectors:
+        course_name_lower = course_name.lower()
+        for selector in _COURSE_SELECT_SELECTORS:
             try:
                 course_select = driver.find_element(By.CSS_SELECTOR, selector)
                 select = Select(course_select)
 
                 for option in select.options:
-                    if course_name.lower() in option.text.lower():
+                    if course_name_lower in option.text.lower():
                         select.select_by_visible_text(option.text)
                         logger.info(f"Selected course: {option.text} using selector: {selector}")
-                        wait = WebDriverWait(driver, 10)
+                        wait = WebDriverWait(driver, 10, poll_frequency=_BOOKING_POLL_S)
                         try:
                             wait.until(expected_conditions.staleness_of(course_select))
                         except TimeoutException:
@@ -1739,32 +3288,26 @@ class WaldenGolfProvider(ReservationProvider):
             True if the correct course is verified, False otherwise
         """
         try:
-            page_text = driver.find_element(By.TAG_NAME, "body").text.lower()
             course_name_lower = course_name.lower()
 
-            if course_name_lower in page_text:
+            try:
+                in_page_text = driver.execute_script(_JS_BODY_TEXT_CONTAINS, course_name_lower)
+            except WebDriverException as e:
+                logger.debug(f"Course text check failed, reading body text: {e}")
+                in_page_text = None
+            if not isinstance(in_page_text, bool):
+                in_page_text = course_name_lower in self._body_text(driver).lower()
+
+            if in_page_text:
                 logger.debug(f"Found '{course_name}' in page text")
                 return True
 
-            course_indicators = [
-                f"h1:contains('{course_name}')",
-                f"h2:contains('{course_name}')",
-                f".course-name:contains('{course_name}')",
-                f"[class*='course']:contains('{course_name}')",
-            ]
-
-            for indicator in course_indicators:
-                try:
-                    elements = driver.find_elements(
-                        By.XPATH,
-                        f"//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', "
-                        f"'abcdefghijklmnopqrstuvwxyz'), '{course_name_lower}')]",
-                    )
-                    if elements:
-                        logger.debug(f"Found course indicator element for '{course_name}'")
-                        return True
-                except NoSuchElementException:
-                    continue
+            try:
+                if driver.execute_script(_JS_DOCUMENT_TEXT_CONTAINS, course_name_lower) is True:
+                    logger.debug(f"Found course indicator element for '{course_name}'")
+                    return True
+            except WebDriverException as e:
+                logger.debug(f"Course text search failed: {e}")
 
             try:
                 selected_options = driver.find_elements(
@@ -1802,43 +3345,31 @@ class WaldenGolfProvider(ReservationProvider):
         Returns:
             True if date was successfully selected, False otherwise.
         """
+        self._invalidate_slot_items(driver)
         day_name = target_date.strftime("%A")
         date_str = target_date.strftime("%m/%d/%Y")
         date_str_alt = target_date.strftime("%Y-%m-%d")
         logger.info(f"BOOKING_DEBUG: Selecting date {target_date} ({day_name})")
 
-        date_input_selectors = [
-            "input[type='text'][id*='date']",
-            "input[type='date']",
-            "input[id*='date']",
-            "input[name*='date']",
-            "input[class*='date']",
-            "input[placeholder*='date' i]",
-            "input[placeholder*='mm/dd' i]",
-            ".datepicker input",
-            "[data-date] input",
-        ]
+        # The priority walk costs a failed lookup per selector on the real tee
+        # sheet, which has no date input; one grouped lookup skips it.
+        has_date_input = bool(driver.find_elements(By.CSS_SELECTOR, _DATE_INPUT_ANY))
 
-        for selector in date_input_selectors:
+        for selector in _DATE_INPUT_SELECTORS if has_date_input else ():
             try:
                 date_input = driver.find_element(By.CSS_SELECTOR, selector)
                 input_type = date_input.get_attribute("type")
 
-                date_input.clear()
-                if input_type == "date":
-                    date_input.send_keys(date_str_alt)
-                else:
-                    date_input.send_keys(date_str)
+                self._fill_input(
+                    driver, date_input, date_str_alt if input_type == "date" else date_str
+                )
                 logger.info(f"BOOKING_DEBUG: Entered date {date_str} using selector: {selector}")
 
-                wait = WebDriverWait(driver, 5)
+                wait = WebDriverWait(driver, 5, poll_frequency=_BOOKING_POLL_S)
                 try:
                     search_button = wait.until(
                         expected_conditions.element_to_be_clickable(
-                            (
-                                By.CSS_SELECTOR,
-                                "button[type='submit'], input[type='submit'], button.search, .btn-search",
-                            )
+                            (By.CSS_SELECTOR, _DATE_SUBMIT_BUTTON_SELECTOR)
                         )
                     )
                     search_button.click()
@@ -1875,28 +3406,15 @@ class WaldenGolfProvider(ReservationProvider):
             True if date was selected successfully, False otherwise.
         """
         try:
-            calendar_triggers = driver.find_elements(
-                By.CSS_SELECTOR,
-                ".calendar-trigger, .datepicker-trigger, [class*='calendar'], "
-                "button[aria-label*='calendar' i], .ui-datepicker-trigger, "
-                "span.icon-calendar, i.fa-calendar",
-            )
+            calendar_triggers = driver.find_elements(By.CSS_SELECTOR, _CALENDAR_TRIGGER_SELECTOR)
 
             if calendar_triggers:
                 calendar_triggers[0].click()
                 logger.info("BOOKING_DEBUG: Clicked calendar trigger")
 
-                wait = WebDriverWait(driver, 5)
+                wait = WebDriverWait(driver, 5, poll_frequency=_BOOKING_POLL_S)
                 try:
-                    wait.until(
-                        expected_conditions.presence_of_element_located(
-                            (
-                                By.CSS_SELECTOR,
-                                ".ui-datepicker, .datepicker, [class*='calendar-popup'], "
-                                ".ui-datepicker-calendar, select[class*='month'], select[class*='year']",
-                            )
-                        )
-                    )
+                    wait.until(_CALENDAR_POPUP_PRESENT)
                     logger.info("BOOKING_DEBUG: Calendar popup appeared")
 
                     # Navigate to the correct month/year if needed
@@ -1904,53 +3422,39 @@ class WaldenGolfProvider(ReservationProvider):
                         logger.warning(
                             f"BOOKING_DEBUG: Failed to navigate calendar to {target_date.strftime('%B %Y')}"
                         )
+                        # The calendar may have changed under a long-lived
+                        # provider; look for its selects again next time
+                        self._calendar_uses_dropdowns = None
                         return False
 
-                    # Now select the day
+                    # Now select the day. One in-page query matches and filters the
+                    # candidate cells, instead of an XPath union through Selenium
+                    # plus three round-trips per candidate to check visibility,
+                    # enablement and other-month classes.
                     day_str = str(target_date.day)
-                    day_elements = driver.find_elements(
-                        By.XPATH,
-                        f"//td[@data-date='{target_date.day}'] | "
-                        f"//a[text()='{day_str}'] | "
-                        f"//td[contains(@class, 'day') and text()='{day_str}'] | "
-                        f"//td[normalize-space(text())='{day_str}']",
-                    )
-
-                    logger.info(
-                        f"BOOKING_DEBUG: Found {len(day_elements)} day elements for day {day_str}"
+                    day_el = driver.execute_script(
+                        _JS_FIND_CALENDAR_DAY,
+                        day_str,
+                        list(DOM.DATE_SELECTION.other_month_classes),
                     )
 
-                    for day_el in day_elements:
-                        if day_el.is_displayed() and day_el.is_enabled():
-                            # Avoid clicking on days from adjacent months (often grayed out)
-                            day_class = day_el.get_attribute("class") or ""
-                            if "ui-datepicker-other-month" in day_class or "disabled" in day_class:
-                                logger.debug(
-                                    f"BOOKING_DEBUG: Skipping day element with class: {day_class}"
-                                )
-                                continue
-
-                            day_el.click()
-                            logger.info(
-                                f"BOOKING_DEBUG: Selected day {day_str} from calendar for date {target_date}"
+                    if day_el:
+                        day_el.click()
+                        logger.info(
+                            f"BOOKING_DEBUG: Selected day {day_str} from calendar for date {target_date}"
+                        )
+                        # Wait for page to reload after date selection
+                        self.wait_strategy.wait_after_action(driver, fixed_duration=2.0)
+                        # Wait for tee time slots to appear
+                        try:
+                            WebDriverWait(driver, 10, poll_frequency=_BOOKING_POLL_S).until(
+                                _TEE_TIMES_PRESENT
                             )
-                            # Wait for page to reload after date selection
-                            self.wait_strategy.wait_after_action(driver, fixed_duration=2.0)
-                            # Wait for tee time slots to appear
-                            try:
-                                WebDriverWait(driver, 10).until(
-                                    expected_conditions.presence_of_element_located(
-                                        (
-                                            By.CSS_SELECTOR,
-                                            DOM.DATE_SELECTION.tee_time_presence,
-                                        )
-                                    )
-                                )
-                            except TimeoutException:
-                                logger.debug(
-                                    "BOOKING_DEBUG: Tee time slots not found after calendar selection"
-                                )
-                            return True
+                        except TimeoutException:
+                            logger.debug(
+                                "BOOKING_DEBUG: Tee time slots not found after calendar selection"
+                            )
+                        return True
 
                     logger.warning(
                         f"BOOKING_DEBUG: No clickable day element found for day {day_str}"
@@ -1987,23 +3491,30 @@ class WaldenGolfProvider(ReservationProvider):
         logger.info(f"BOOKING_DEBUG: Navigating calendar to {target_month_name} {target_year}")
 
         # Strategy 1: Try month/year dropdown selects
+        # Set when the probe ran and found no selects. That is only recorded
+        # once the calendar is seen drawn: a popup probed before it renders
+        # has no selects either.
+        found_no_dropdowns = False
         try:
             # Look for month dropdown - try various selectors
-            month_selects = driver.find_elements(
-                By.CSS_SELECTOR,
-                "select.ui-datepicker-month, select[class*='month'], "
-                "select[data-handler='selectMonth'], select[name*='month']",
-            )
-            year_selects = driver.find_elements(
-                By.CSS_SELECTOR,
-                "select.ui-datepicker-year, select[class*='year'], "
-                "select[data-handler='selectYear'], select[name*='year']",
-            )
+            month_selects: list[WebElement] = []
+            year_selects: list[WebElement] = []
+            if self._calendar_uses_dropdowns is not False:
+                month_selects = driver.find_elements(
+                    By.CSS_SELECTOR, _CALENDAR_MONTH_SELECT_SELECTOR
+                )
+                year_selects = driver.find_elements(By.CSS_SELECTOR, _CALENDAR_YEAR_SELECT_SELECTOR)
+                if month_selects and year_selects:
+                    self._calendar_uses_dropdowns = True
+                else:
+                    found_no_dropdowns = True
 
             if month_selects and year_selects:
                 logger.info("BOOKING_DEBUG: Found month/year dropdowns, using select strategy")
 
                 # Select year first
+                marker = self._calendar_redraw_marker(driver)
+                year_before = year_selects[0].get_attribute("value")
                 year_select = Select(year_selects[0])
                 try:
                     year_select.select_by_value(str(target_year))
@@ -2015,9 +3526,17 @@ class WaldenGolfProvider(ReservationProvider):
                     except Exception as e:
                         logger.warning(f"BOOKING_DEBUG: Could not select year: {e}")
 
-                self.wait_strategy.simple_wait(fixed_duration=0.3, event_driven_duration=0.1)
+                if self._calendar_select_moved(year_selects[0], year_before):
+                    self._wait_for_calendar_redraw(driver, marker, 0.3, 0.1)
+                    # The redraw replaces the month select along with the grid
+                    month_selects = (
+                        driver.find_elements(By.CSS_SELECTOR, _CALENDAR_MONTH_SELECT_SELECTOR)
+                        or month_selects
+                    )
+                    marker = self._calendar_redraw_marker(driver)
 
                 # Select month (0-indexed in some implementations, 1-indexed in others)
+                month_before = month_selects[0].get_attribute("value")
                 month_select = Select(month_selects[0])
                 try:
                     # Try 0-indexed first (JavaScript Date style)
@@ -2048,7 +3567,8 @@ class WaldenGolfProvider(ReservationProvider):
                             except Exception as e:
                                 logger.warning(f"BOOKING_DEBUG: Could not select month: {e}")
 
-                self.wait_strategy.simple_wait(fixed_duration=0.5, event_driven_duration=0.2)
+                if self._calendar_select_moved(month_selects[0], month_before):
+                    self._wait_for_calendar_redraw(driver, marker, 0.5, 0.2)
                 return True
 
         except Exception as e:
@@ -2064,6 +3584,9 @@ class WaldenGolfProvider(ReservationProvider):
                 # Assume we need to navigate - try clicking next
                 current_month = datetime.now().month
                 current_year = datetime.now().year
+            elif found_no_dropdowns:
+                # The header was read, so the calendar is drawn and has no selects
+                self._calendar_uses_dropdowns = False
 
             logger.info(
                 f"BOOKING_DEBUG: Calendar currently showing {current_month}/{current_year}, "
@@ -2110,47 +3633,43 @@ class WaldenGolfProvider(ReservationProvider):
                 direction = "prev"
                 months_diff = abs(months_diff)
 
-            nav_button = None
-            for selector in nav_selectors:
-                try:
-                    buttons = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for btn in buttons:
-                        if btn.is_displayed() and btn.is_enabled():
-                            nav_button = btn
-                            logger.info(
-                                f"BOOKING_DEBUG: Found {direction} nav button with selector: {selector}"
-                            )
-                            break
-                    if nav_button:
-                        break
-                except Exception:
-                    continue
+            stepped = self._step_calendar_months_js(driver, nav_selectors, months_diff)
+            if stepped is not None:
+                if stepped < months_diff:
+                    logger.warning(
+                        f"BOOKING_DEBUG: Calendar stopped after {stepped}/{months_diff} "
+                        f"{direction} steps"
+                    )
+                    return False
+                logger.info(
+                    f"BOOKING_DEBUG: Navigated {months_diff} months {direction} to reach "
+                    f"{target_month_name} {target_year}"
+                )
+                return True
 
-            if not nav_button:
+            # One script picks the first displayed arrow in selector order, in
+            # place of is_displayed/is_enabled round-trips per candidate
+            nav_button = self._first_displayed_by_priority(driver, nav_selectors)
+            if not nav_button or not nav_button.is_enabled():
                 logger.warning(f"BOOKING_DEBUG: Could not find {direction} navigation button")
                 return False
+            logger.info(f"BOOKING_DEBUG: Found {direction} nav button")
 
             # Click navigation button for each month we need to move
             for i in range(months_diff):
                 try:
                     # Re-find the button each time as DOM may update
-                    for selector in nav_selectors:
-                        try:
-                            buttons = driver.find_elements(By.CSS_SELECTOR, selector)
-                            for btn in buttons:
-                                if btn.is_displayed() and btn.is_enabled():
-                                    nav_button = btn
-                                    break
-                            if nav_button:
-                                break
-                        except Exception:
-                            continue
+                    if i:
+                        nav_button = (
+                            self._first_displayed_by_priority(driver, nav_selectors) or nav_button
+                        )
 
+                    marker = self._calendar_redraw_marker(driver)
                     nav_button.click()
                     logger.debug(
                         f"BOOKING_DEBUG: Clicked {direction} button ({i + 1}/{months_diff})"
                     )
-                    self.wait_strategy.simple_wait(fixed_duration=0.3, event_driven_duration=0.1)
+                    self._wait_for_calendar_redraw(driver, marker, 0.3, 0.1)
                 except Exception as e:
                     logger.warning(f"BOOKING_DEBUG: Error clicking nav button: {e}")
                     return False
@@ -2166,6 +3685,80 @@ class WaldenGolfProvider(ReservationProvider):
 
         return False
 
+    def _step_calendar_months_js(
+        self, driver: webdriver.Chrome, nav_selectors: Sequence[str], steps: int
+    ) -> int | None:
+        """
+        Click a calendar nav arrow ``steps`` times in one async script.
+
+        Returns the number of clicks made, or None if the script cannot run so
+        the caller can fall back to clicking from Python. See
+        _JS_STEP_CALENDAR_MONTHS.
+        """
+        try:
+            raw = driver.execute_async_script(
+                _JS_STEP_CALENDAR_MONTHS,
+                list(nav_selectors),
+                steps,
+                _CALENDAR_DAY_CELL_SELECTOR,
+                int(_CALENDAR_REDRAW_WAIT_S * 1000),
+                _CALENDAR_NAV_PAUSE_MS,
+            )
+        except WebDriverException as e:
+            logger.debug(f"BOOKING_DEBUG: In-page calendar stepping failed: {e}")
+            return None
+        if not isinstance(raw, dict):
+            return None
+        steps_made = raw.get("steps")
+        if not isinstance(steps_made, int):
+            return None
+        if raw.get("error"):
+            logger.debug(f"BOOKING_DEBUG: In-page calendar stepping stopped: {raw['error']}")
+        return steps_made
+
+    def _calendar_redraw_marker(self, driver: webdriver.Chrome) -> WebElement | None:
+        """A day cell of the calendar as currently drawn, or None if none is found."""
+        cells = driver.find_elements(By.CSS_SELECTOR, _CALENDAR_DAY_CELL_SELECTOR)
+        return cells[0] if cells else None
+
+    def _calendar_select_moved(self, select_element: Any, before: str | None) -> bool:
+        """
+        Whether a month/year select changed value, and so redrew the calendar.
+
+        Re-selecting the current value fires no change and redraws nothing, so
+        there is nothing to wait for. A select that has gone stale was replaced
+        by the redraw itself.
+        """
+        try:
+            return bool(select_element.get_attribute("value") != before)
+        except StaleElementReferenceException:
+            return True
+
+    def _wait_for_calendar_redraw(
+        self,
+        driver: webdriver.Chrome,
+        marker: WebElement | None,
+        fixed_duration: float,
+        event_driven_duration: float,
+    ) -> None:
+        """
+        Wait for the calendar to redraw after a month or year change.
+
+        The redraw detaches ``marker``, a day cell read before the change.
+        Without a marker there is nothing to watch, so the fixed pause applies.
+        """
+        if marker is None:
+            self.wait_strategy.simple_wait(
+                fixed_duration=fixed_duration, event_driven_duration=event_driven_duration
+            )
+            return
+        try:
+            WebDriverWait(
+                driver, _CALENDAR_REDRAW_WAIT_S, poll_frequency=_CALENDAR_REDRAW_POLL_S
+            ).until(expected_conditions.staleness_of(marker))
+        except TimeoutException:
+            logger.debug("BOOKING_DEBUG: Calendar day grid did not redraw")
+
     def _get_calendar_current_month(
         self, driver: webdriver.Chrome
     ) -> tuple[int | None, int | None]:
@@ -2176,15 +3769,19 @@ class WaldenGolfProvider(ReservationProvider):
             Tuple of (month, year) as integers, or (None, None) if cannot determine
         """
         try:
-            # Try to read from month/year dropdowns
-            month_selects = driver.find_elements(
-                By.CSS_SELECTOR,
-                "select.ui-datepicker-month, select[class*='month']",
-            )
-            year_selects = driver.find_elements(
-                By.CSS_SELECTOR,
-                "select.ui-datepicker-year, select[class*='year']",
-            )
+            # Try to read from month/year dropdowns, unless the calendar is
+            # already known not to have them
+            month_selects: list[WebElement] = []
+            year_selects: list[WebElement] = []
+            if self._calendar_uses_dropdowns is not False:
+                month_selects = driver.find_elements(
+                    By.CSS_SELECTOR,
+                    "select.ui-datepicker-month, select[class*='month']",
+                )
+                year_selects = driver.find_elements(
+                    By.CSS_SELECTOR,
+                    "select.ui-datepicker-year, select[class*='year']",
+                )
 
             if month_selects and year_selects:
                 month_select = Select(month_selects[0])
@@ -2205,28 +3802,16 @@ class WaldenGolfProvider(ReservationProvider):
                     return month_int, int(year_val)
 
             # Try to read from header text (e.g., "January 2026" or "Jan 2026")
-            header_selectors = [
-                ".ui-datepicker-title",
-                ".datepicker-title",
-                "[class*='calendar-header']",
-                "[class*='datepicker-header']",
-            ]
-
-            for selector in header_selectors:
+            for header in driver.find_elements(By.CSS_SELECTOR, _CALENDAR_HEADER_SELECTOR):
                 try:
-                    headers = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for header in headers:
-                        text = header.text.strip()
-                        if text:
-                            # Try to parse "January 2026" or "Jan 2026"
-                            for fmt in ["%B %Y", "%b %Y"]:
-                                try:
-                                    parsed = datetime.strptime(text, fmt)
-                                    return parsed.month, parsed.year
-                                except ValueError:
-                                    continue
-                except Exception:
+                    text = header.text.strip()
+                except StaleElementReferenceException:
                     continue
+                match = _CALENDAR_HEADER_PATTERN.match(text)
+                if match:
+                    month = _MONTH_NUMBERS.get(match.group(1).lower())
+                    if month is not None:
+                        return month, int(match.group(2))
 
         except Exception as e:
             logger.debug(f"BOOKING_DEBUG: Error getting current calendar month: {e}")
@@ -2241,6 +3826,7 @@ class WaldenGolfProvider(ReservationProvider):
             True if date was selected successfully, False otherwise.
         """
         day_name = target_date.strftime("%A")
+        day_name_lower = day_name.lower()
         date_str = target_date.strftime("%m/%d")
         logger.debug(f"BOOKING_DEBUG: Looking for day tab for {day_name} ({date_str})")
 
@@ -2253,10 +3839,11 @@ class WaldenGolfProvider(ReservationProvider):
             logger.debug(f"BOOKING_DEBUG: Found {len(day_tabs)} potential day tabs")
 
             for i, tab in enumerate(day_tabs):
-                tab_text = tab.text.lower()
+                raw_tab_text = tab.text
+                tab_text = raw_tab_text.lower()
                 logger.debug(f"BOOKING_DEBUG: Tab {i}: text='{tab_text}'")
-                if day_name.lower() in tab_text or date_str in tab.text:
-                    wait = WebDriverWait(driver, 10)
+                if day_name_lower in tab_text or date_str in raw_tab_text:
+                    wait = WebDriverWait(driver, 10, poll_frequency=_BOOKING_POLL_S)
                     try:
                         wait.until(expected_conditions.element_to_be_clickable(tab))
                         tab.click()
@@ -2330,8 +3917,12 @@ class WaldenGolfProvider(ReservationProvider):
             # matches the tee sheet's time period filter (ALL/MORNING/AFTERNOON/
             # AVAILABLE), which comes first in the DOM. Taking that first match
             # is how a live booking failed with "Could not find radio input".
+            # The selectors stay separate queries rather than one union: their order
+            # is the preference order, and a document-order union would put the
+            # time period filter ahead of .reservation-players again.
             button_group = None
             decoy_group = None
+            radio_input = None
             radio_selector = DOM.PLAYER_COUNT.radio_input_template.format(value=num_players)
             for selector in DOM.PLAYER_COUNT.button_group:
                 candidates = search_context.find_elements(By.CSS_SELECTOR, selector)
@@ -2339,8 +3930,10 @@ class WaldenGolfProvider(ReservationProvider):
                     logger.debug(f"BOOKING_DEBUG: Button group not found with selector: {selector}")
                     continue
                 for candidate in candidates:
-                    if candidate.find_elements(By.CSS_SELECTOR, radio_selector):
+                    radios = candidate.find_elements(By.CSS_SELECTOR, radio_selector)
+                    if radios:
                         button_group = candidate
+                        radio_input = radios[0]
                         logger.info(
                             f"BOOKING_DEBUG: Found player button group with selector: {selector}"
                         )
@@ -2360,14 +3953,9 @@ class WaldenGolfProvider(ReservationProvider):
                 button_group = decoy_group
 
             if button_group:
-                # Find the button with the correct value
-                # The button contains a radio input with the value we want
-                try:
-                    # Find the radio input with the correct value
-                    radio_input = button_group.find_element(
-                        By.CSS_SELECTOR,
-                        DOM.PLAYER_COUNT.radio_input_template.format(value=num_players),
-                    )
+                # The button contains the radio input found during the group scan;
+                # a decoy group has none, so it goes straight to the label strategy.
+                if radio_input is not None:
                     # Get the parent div (the clickable button)
                     button_div = radio_input.find_element(
                         By.XPATH, DOM.PLAYER_COUNT.button_parent_xpath
@@ -2385,7 +3973,7 @@ class WaldenGolfProvider(ReservationProvider):
                         return False
 
                     # Click the button (execute_script requires the driver, not search_context)
-                    driver.execute_script("arguments[0].click();", button_div)
+                    driver.execute_script(_JS_CLICK, button_div)
                     logger.info(
                         f"BOOKING_DEBUG: Clicked player count button for {num_players} players"
                     )
@@ -2400,7 +3988,7 @@ class WaldenGolfProvider(ReservationProvider):
 
                     logger.debug(f"BOOKING_DEBUG: Successfully selected {num_players} players")
                     return True
-                except NoSuchElementException:
+                else:
                     logger.warning(
                         f"BOOKING_DEBUG: Could not find radio input for {num_players} players"
                     )
@@ -2427,7 +4015,7 @@ class WaldenGolfProvider(ReservationProvider):
                                 )
                                 return False
 
-                            driver.execute_script("arguments[0].click();", candidate)
+                            driver.execute_script(_JS_CLICK, candidate)
                             logger.info(
                                 f"BOOKING_DEBUG: Clicked player count button for {num_players} players"
                             )
@@ -2443,9 +4031,9 @@ class WaldenGolfProvider(ReservationProvider):
                                 f"BOOKING_DEBUG: Successfully selected {num_players} players"
                             )
                             return True
-                        except Exception:
+                        except WebDriverException:
                             continue
-                except Exception:
+                except WebDriverException:
                     pass
 
                 try:
@@ -2453,22 +4041,23 @@ class WaldenGolfProvider(ReservationProvider):
                     if group_html and len(group_html) > 2000:
                         group_html = group_html[:2000] + "... [truncated]"
                     logger.debug(f"BOOKING_DEBUG: Player button group HTML: {group_html}")
-                except Exception:
+                except WebDriverException:
                     pass
 
-            # Fallback: try dropdown selectors (scoped to search_context)
-            for selector in DOM.PLAYER_COUNT.dropdown_fallbacks:
+            # Fallback: try dropdown selectors (scoped to search_context). One union
+            # query returns [] instead of raising once per selector that misses.
+            player_selects = search_context.find_elements(
+                By.CSS_SELECTOR, ", ".join(DOM.PLAYER_COUNT.dropdown_fallbacks)
+            )
+            for player_select in player_selects:
                 try:
-                    player_select = search_context.find_element(By.CSS_SELECTOR, selector)
                     select = Select(player_select)
                     select.select_by_value(str(num_players))
-                    logger.info(f"Selected {num_players} players using selector: {selector}")
+                    logger.info(f"Selected {num_players} players using dropdown fallback")
                     self.wait_strategy.wait_after_action(driver, fixed_duration=0.5)
                     return True
-                except NoSuchElementException:
-                    continue
-                except Exception as e:
-                    logger.debug(f"Unexpected error trying selector {selector}: {e}")
+                except WebDriverException as e:
+                    logger.debug(f"Unexpected error using player dropdown: {e}")
                     continue
 
             logger.warning(
@@ -2477,10 +4066,80 @@ class WaldenGolfProvider(ReservationProvider):
             )
             return False
 
-        except Exception as e:
+        except InvalidArgumentException:
+            # Deterministic, so not worth the retry or the silent False
+            raise
+        except WebDriverException as e:
             logger.warning(f"Error selecting player count: {e}")
             return False
 
+    def _first_displayed_match(
+        self, search_context: Any, selectors: Sequence[str]
+    ) -> WebElement | None:
+        """
+        Return the first displayed element matching any of the CSS selectors.
+
+        Issues one find_elements call for the comma-joined union, which returns
+        [] rather than raising, instead of one find_element round-trip (and one
+        NoSuchElementException) per selector that misses. Matches come back in
+        document order, so callers that need a preference order between
+        selectors should split them into tiers and call this once per tier.
+        """
+        for element in search_context.find_elements(By.CSS_SELECTOR, ", ".join(selectors)):
+            try:
+                if element.is_displayed():
+                    return cast(WebElement, element)
+            except StaleElementReferenceException:
+                continue
+        return None
+
+    def _first_displayed_by_priority(
+        self, driver: webdriver.Chrome, selectors: Sequence[str]
+    ) -> WebElement | None:
+        """
+        Return the first displayed element of the earliest selector that has one.
+
+        Unlike _first_displayed_match, selector order wins over document order.
+        The whole search is one script call; if the script fails, each selector
+        is tried in turn with find_elements and is_displayed.
+        """
+        try:
+            found = driver.execute_script(_JS_FIRST_DISPLAYED_BY_PRIORITY, list(selectors))
+            return found if isinstance(found, WebElement) else None
+        except WebDriverException as e:
+            logger.debug(f"Priority selector script failed, searching per selector: {e}")
+        for selector in selectors:
+            for element in driver.find_elements(By.CSS_SELECTOR, selector):
+                try:
+                    if element.is_displayed():
+                        return element
+                except StaleElementReferenceException:
+                    continue
+        return None
+
+    def _wait_for_player_rows(self, context: Any, selector: str, expected: int) -> bool:
+        """
+        Poll until the booking form shows at least ``expected`` player rows.
+
+        Args:
+            context: Driver or element to search within
+            selector: CSS selector matching player rows
+            expected: Minimum number of rows to wait for
+
+        Returns:
+            True if the rows appeared before the timeout, False otherwise
+        """
+        try:
+            WebDriverWait(
+                context, _PLAYER_ROWS_TIMEOUT_S, poll_frequency=_PLAYER_ROWS_POLL_S
+            ).until(lambda c: len(c.find_elements(By.CSS_SELECTOR, selector)) >= expected)
+            return True
+        except WebDriverException:
+            logger.debug(
+                f"BOOKING_DEBUG: Timed out waiting for {expected} player rows ({selector})"
+            )
+            return False
+
     def _verify_player_rows_appeared(self, driver: webdriver.Chrome, expected_players: int) -> bool:
         """
         Verify that the expected number of player rows appeared after selecting player count.
@@ -2497,21 +4156,17 @@ class WaldenGolfProvider(ReservationProvider):
         """
         logger.debug(f"BOOKING_DEBUG: Verifying {expected_players} player rows appeared")
 
-        # Wait a bit for the DOM to update after player count selection
-        self.wait_strategy.wait_for_element(
-            driver,
-            (By.CSS_SELECTOR, DOM.PLAYER_COUNT.player_rows_wait),
-            fixed_duration=2.0,
-            timeout=5.0,
-        )
+        # Wait for the DOM to update after player count selection
+        self._wait_for_player_rows(driver, DOM.PLAYER_COUNT.player_rows_wait, expected_players)
 
-        for selector in DOM.PLAYER_COUNT.player_rows:
+        for selector in _remembered_first(DOM.PLAYER_COUNT.player_rows, self._player_row_selector):
             try:
                 player_rows = driver.find_elements(By.CSS_SELECTOR, selector)
                 if len(player_rows) >= expected_players:
                     logger.info(
                         f"BOOKING_DEBUG: Found {len(player_rows)} player rows using selector: {selector}"
                     )
+                    self._player_row_selector = selector
                     return True
                 elif len(player_rows) > 0:
                     logger.info(
@@ -2575,11 +4230,8 @@ class WaldenGolfProvider(ReservationProvider):
                 f"BOOKING_DEBUG: Starting TBD guest registration for {num_tbd_guests} guests"
             )
             # Wait for the player table to update after selecting player count
-            self.wait_strategy.wait_for_element(
-                search_context,
-                (By.CSS_SELECTOR, DOM.TBD_GUESTS.player_rows_wait),
-                fixed_duration=2.0,
-                timeout=5.0,
+            self._wait_for_player_rows(
+                search_context, DOM.TBD_GUESTS.player_rows_wait, num_tbd_guests + 1
             )
 
             tbd_buttons_added = 0
@@ -2592,10 +4244,21 @@ class WaldenGolfProvider(ReservationProvider):
                     f"BOOKING_DEBUG: Processing TBD guest {guest_index + 1}/{num_tbd_guests} (player {player_num})"
                 )
 
+                # One script finds this guest's row and clicks its TBD control; the
+                # lookups below only run if it clicks nothing or cannot run.
+                clicked = self._click_tbd_in_row_js(driver, search_context, guest_index)
+                if clicked:
+                    logger.info(f"Clicked TBD button for player {player_num} ({clicked})")
+                    tbd_buttons_added += 1
+                    self.wait_strategy.wait_after_action(driver, fixed_duration=1.0)
+                    continue
+
                 # Re-find player rows each iteration to avoid stale references
                 # Try multiple selectors for player rows as the DOM structure may vary
                 player_rows = []
-                for row_selector in DOM.TBD_GUESTS.player_rows:
+                for row_selector in _remembered_first(
+                    DOM.TBD_GUESTS.player_rows, self._player_row_selector
+                ):
                     player_rows = search_context.find_elements(By.CSS_SELECTOR, row_selector)
                     if len(player_rows) > 1:  # Need at least 2 rows (primary + guests)
                         logger.info(
@@ -2618,7 +4281,7 @@ class WaldenGolfProvider(ReservationProvider):
                                 logger.info(
                                     f"BOOKING_DEBUG: Table {i}: id={table_id}, class={table_class}"
                                 )
-                        except Exception:
+                        except WebDriverException:
                             pass
 
                 # Check if we have enough rows
@@ -2632,59 +4295,29 @@ class WaldenGolfProvider(ReservationProvider):
 
                 try:
                     # Look for the TBD button in this row using multiple strategies
-                    tbd_button = None
-
-                    # Strategy 1: CSS selectors for TBD button/link
-                    tbd_selectors = [
-                        "a[id*='tbd']",
-                        "span[id*='tbd']",
-                        "button[id*='tbd']",
-                        "[class*='btn-tbd']",
-                        "a[class*='tbd']",
-                        "span[class*='tbd']",
-                        "button[class*='tbd']",
-                        "a[id*='TBD']",
-                        "span[id*='TBD']",
-                        "button[id*='TBD']",
-                        "[class*='TBD']",
-                        # Common button patterns
-                        "a.ui-commandlink",
-                        "button.ui-button",
-                    ]
-
-                    for selector in tbd_selectors:
-                        try:
-                            tbd_button = row.find_element(By.CSS_SELECTOR, selector)
-                            if tbd_button and tbd_button.is_displayed():
-                                logger.info(f"Found TBD button using CSS: {selector}")
-                                break
-                            tbd_button = None
-                        except NoSuchElementException:
-                            continue
+                    # Strategy 1: CSS selectors for TBD button/link. TBD-specific
+                    # selectors first, generic command buttons only if none matched.
+                    tbd_button = self._first_displayed_match(
+                        row, DOM.TBD_GUESTS.tbd_button_css
+                    ) or self._first_displayed_match(row, DOM.TBD_GUESTS.tbd_button_generic_css)
+                    if tbd_button:
+                        logger.info("Found TBD button using CSS")
 
                     # Strategy 2: XPath text matching for "TBD" text
                     if not tbd_button:
-                        try:
-                            # Look for any clickable element containing "TBD" text
-                            tbd_button = row.find_element(
-                                By.XPATH,
-                                ".//a[contains(text(), 'TBD')] | "
-                                ".//span[contains(text(), 'TBD')] | "
-                                ".//button[contains(text(), 'TBD')] | "
-                                ".//*[contains(@title, 'TBD')] | "
-                                ".//*[contains(@aria-label, 'TBD')]",
-                            )
-                            if tbd_button and tbd_button.is_displayed():
+                        # Look for any clickable element containing "TBD" text
+                        tbd_matches = row.find_elements(By.XPATH, DOM.TBD_GUESTS.tbd_button_xpath)
+                        if tbd_matches:
+                            tbd_button = tbd_matches[0]
+                            if tbd_button.is_displayed():
                                 logger.info("Found TBD button using XPath text match")
-                        except NoSuchElementException:
-                            pass
 
                     # Strategy 3: Look for any link/button that might be the TBD action
                     if not tbd_button:
                         try:
                             # Find all clickable elements in the row
                             clickables = row.find_elements(
-                                By.CSS_SELECTOR, "a, button, span[onclick], div[onclick]"
+                                By.CSS_SELECTOR, DOM.TBD_GUESTS.clickable_elements
                             )
                             for elem in clickables:
                                 elem_text = elem.text.strip().lower()
@@ -2703,34 +4336,20 @@ class WaldenGolfProvider(ReservationProvider):
                                             f"text='{elem_text}', id='{elem_id}'"
                                         )
                                         break
-                        except Exception as e:
+                        except WebDriverException as e:
                             logger.debug(f"Clickable scan failed: {e}")
 
                     if tbd_button:
                         # Click the TBD button
-                        driver.execute_script("arguments[0].click();", tbd_button)
+                        driver.execute_script(_JS_CLICK, tbd_button)
                         logger.info(f"Clicked TBD button for player {player_num}")
                         tbd_buttons_added += 1
                         self.wait_strategy.wait_after_action(driver, fixed_duration=1.0)
                     else:
                         # If no TBD button, try to find the player name input and type "TBD"
-                        player_input = None
-                        input_selectors = [
-                            "input[id*='player_input']",
-                            "input[id*='player']",
-                            "input[name*='player']",
-                            "input[type='text']",
-                            "input.ui-autocomplete-input",
-                        ]
-
-                        for input_selector in input_selectors:
-                            try:
-                                player_input = row.find_element(By.CSS_SELECTOR, input_selector)
-                                if player_input and player_input.is_displayed():
-                                    break
-                                player_input = None
-                            except NoSuchElementException:
-                                continue
+                        player_input = self._first_displayed_match(
+                            row, DOM.TBD_GUESTS.player_name_inputs
+                        )
 
                         if player_input and not player_input.get_attribute("disabled"):
                             player_input.clear()
@@ -2745,7 +4364,7 @@ class WaldenGolfProvider(ReservationProvider):
                             # Log detailed element state for debugging
                             self._log_row_element_state(driver, row, player_num)
 
-                except Exception as e:
+                except WebDriverException as e:
                     logger.warning(
                         f"BOOKING_DEBUG: Error adding TBD guest for player {player_num}: {e}"
                     )
@@ -2761,10 +4380,43 @@ class WaldenGolfProvider(ReservationProvider):
                 )
                 return False
 
-        except Exception as e:
+        except InvalidArgumentException:
+            # A malformed selector or argument fails the same way every time;
+            # surface it instead of reporting a quiet False that reads as "no slot".
+            raise
+        except WebDriverException as e:
             logger.error(f"Error adding TBD Registered Guests: {e}")
             return False
 
+    def _click_tbd_in_row_js(
+        self, driver: webdriver.Chrome, search_context: Any, guest_index: int
+    ) -> str | None:
+        """
+        Click the TBD control on a guest's player row in one script call.
+
+        Returns the strategy that found the control, or None if nothing was
+        clicked or the script cannot run. See _JS_CLICK_TBD_IN_ROW.
+        """
+        selectors = DOM.TBD_GUESTS
+        try:
+            result = driver.execute_script(
+                _JS_CLICK_TBD_IN_ROW,
+                None if search_context is driver else search_context,
+                _remembered_first(selectors.player_rows, self._player_row_selector),
+                guest_index,
+                ", ".join(selectors.tbd_button_css),
+                ", ".join(selectors.tbd_button_generic_css),
+                selectors.tbd_button_xpath,
+                selectors.clickable_elements,
+            )
+        except WebDriverException as e:
+            logger.debug(f"BOOKING_DEBUG: In-page TBD click failed: {e}")
+            return None
+        if not isinstance(result, dict):
+            return None
+        clicked = result.get("clicked")
+        return clicked if isinstance(clicked, str) and clicked else None
+
     def _find_and_book_time_slot_sync(
         self,
         driver: webdriver.Chrome,
@@ -3180,35 +4832,24 @@ class WaldenGolfProvider(ReservationProvider):
             # The JS chain clicked Book Now but the page may still be processing
             try:
                 # Wait for either URL change or success indicators
-                wait = WebDriverWait(driver, 5)
+                wait = WebDriverWait(driver, 5, poll_frequency=_BOOKING_POLL_S)
                 try:
                     # First check if URL changed (common for successful bookings)
-                    wait.until(
-                        lambda d: "confirmation" in d.current_url.lower()
-                        or "success" in d.current_url.lower()
-                        or "thank" in d.current_url.lower()
-                    )
+                    wait.until(lambda d: _SUCCESS_URL_PATTERN.search(d.current_url) is not None)
                 except TimeoutException:
                     # URL didn't change, try waiting for success text on page
                     try:
-                        wait.until(
-                            expected_conditions.presence_of_element_located(
-                                (
-                                    By.XPATH,
-                                    "//*[contains(text(), 'success') or "
-                                    "contains(text(), 'confirm') or "
-                                    "contains(text(), 'thank')]",
-                                )
-                            )
-                        )
+                        wait.until(_SUCCESS_TEXT_PRESENT)
                     except TimeoutException:
                         # No explicit success indicator, proceed with verification
                         pass
             except Exception as e:
                 logger.debug(f"FAST_BOOKING: Post-chain wait exception (non-fatal): {e}")
 
-            confirmation_number = self._extract_confirmation_number(driver)
-            if self._verify_booking_success(driver):
+            # One read of the outcome page serves all three checks below
+            page_text = self._get_visible_page_text(driver)
+            confirmation_number = self._extract_confirmation_number(driver, page_text)
+            if self._verify_booking_success(driver, page_text):
                 return BookingResult(
                     success=True,
                     booked_time=booked_time,
@@ -3219,7 +4860,7 @@ class WaldenGolfProvider(ReservationProvider):
             else:
                 # Fast chain reported success but verification failed
                 self._capture_diagnostic_info(driver, "fast_chain_verify_failed")
-                error_details = self._extract_booking_error_message(driver)
+                error_details = self._extract_booking_error_message(driver, page_text)
                 return BookingResult(
                     success=False,
                     error_message=(
@@ -3232,16 +4873,20 @@ class WaldenGolfProvider(ReservationProvider):
 
         # === EXISTING SLOW PATH (Python-based Selenium iteration) ===
 
+        self._invalidate_slot_items(driver)
+
         northgate_section = None
         try:
-            sections = driver.find_elements(By.CSS_SELECTOR, DOM.SLOT_DISCOVERY.course_section)
-            for section in sections:
-                if self.NORTHGATE_COURSE_NAME.lower() in section.text.lower():
-                    northgate_section = section
-                    logger.info("BOOKING_DEBUG: Found Northgate course section for slot search")
-                    break
-        except NoSuchElementException:
-            pass
+            section = driver.execute_script(
+                _JS_FIRST_ELEMENT_WITH_TEXT,
+                DOM.SLOT_DISCOVERY.course_section,
+                self.NORTHGATE_COURSE_NAME_LC,
+            )
+            if isinstance(section, WebElement):
+                northgate_section = section
+                logger.info("BOOKING_DEBUG: Found Northgate course section for slot search")
+        except WebDriverException as e:
+            logger.debug(f"BOOKING_DEBUG: Course section lookup failed: {e}")
 
         search_context: Any
         if northgate_section:
@@ -3253,8 +4898,14 @@ class WaldenGolfProvider(ReservationProvider):
             )
             search_context = driver
 
+        # Only a single course's section is guaranteed to be in time order; the
+        # whole page may list another course's sheet first
         slots_with_capacity = self._find_empty_slots(
-            search_context, min_available_spots=num_players
+            search_context,
+            min_available_spots=num_players,
+            latest_minutes=(
+                target_minutes + fallback_window_minutes if northgate_section is not None else None
+            ),
         )
 
         if not slots_with_capacity:
@@ -3290,68 +4941,62 @@ class WaldenGolfProvider(ReservationProvider):
         min_time_minutes = max(0, target_minutes - fallback_window_minutes)
         max_time_minutes = min(24 * 60 - 1, target_minutes + fallback_window_minutes)
 
-        eligible_slots: list[tuple[time, Any]] = []
-        for slot_time, slot_element in slots_with_capacity:
-            slot_minutes = slot_time.hour * 60 + slot_time.minute
-            diff = abs(slot_minutes - target_minutes)
-            if diff > fallback_window_minutes:
-                continue
-            if diff % tee_time_interval_minutes != 0:
-                continue
-            eligible_slots.append((slot_time, slot_element))
-
-        if eligible_slots:
-            walden_course_name = "walden on lake conroe"
-            course_filtered_slots: list[tuple[time, Any]] = []
-            filtered_out_count = 0
-
-            # Even when we find a "Northgate" section, the DOM may still contain
-            # Walden slots. For safety, always reject slots that look like Walden.
-            # If the Northgate section is present, we use a non-strict filter that
-            # only rejects slots with explicit Walden indicators.
-            strict_course_check = northgate_section is None
-
-            for slot_time, slot_element in eligible_slots:
-                is_northgate = False
-                try:
-                    is_northgate = self._is_northgate_slot(
-                        slot_element,
-                        walden_course_name,
-                        strict=strict_course_check,
-                    )
-                except TypeError:
-                    is_northgate = self._is_northgate_slot(slot_element, walden_course_name)
+        # Rank the in-window, interval-aligned slots nearest-first using plain
+        # minute arithmetic. The course check below touches the DOM for every
+        # slot it inspects, so it runs in rank order and stops at the first
+        # acceptable slot instead of filtering every candidate up front. Each
+        # distance is computed once and out-of-window slots are dropped before
+        # sorting, so only eligible slots are sorted. The sort is stable, so
+        # equal distances keep the earlier tee time first.
+        slot_diffs = [
+            abs(slot_time.hour * 60 + slot_time.minute - target_minutes)
+            for slot_time, _ in slots_with_capacity
+        ]
+        ranked_slots: list[tuple[int, time, Any]] = sorted(
+            (
+                (diff, slot_time, element)
+                for diff, (slot_time, element) in zip(slot_diffs, slots_with_capacity, strict=True)
+                if diff <= fallback_window_minutes and diff % tee_time_interval_minutes == 0
+            ),
+            key=lambda candidate: candidate[0],
+        )
 
-                if is_northgate:
-                    course_filtered_slots.append((slot_time, slot_element))
-                else:
-                    filtered_out_count += 1
+        walden_course_name = "walden on lake conroe"
+        # Even when we find a "Northgate" section, the DOM may still contain
+        # Walden slots. For safety, always reject slots that look like Walden.
+        # If the Northgate section is present, we use a non-strict filter that
+        # only rejects slots with explicit Walden indicators.
+        strict_course_check = northgate_section is None
 
-            if filtered_out_count:
-                logger.info(
-                    f"BOOKING_DEBUG: Filtered {filtered_out_count} non-Northgate slots. "
-                    f"{len(course_filtered_slots)} Northgate slots remain."
+        def is_northgate(slot_element: Any) -> bool:
+            try:
+                return self._is_northgate_slot(
+                    slot_element,
+                    walden_course_name,
+                    strict=strict_course_check,
                 )
-            eligible_slots = course_filtered_slots
+            except TypeError:
+                return self._is_northgate_slot(slot_element, walden_course_name)
 
         logger.info(
             f"Found {len(slots_with_capacity)} slots with {num_players}+ available spots, "
-            f"{len(eligible_slots)} eligible within "
+            f"{len(ranked_slots)} eligible within "
             f"{time(min_time_minutes // 60, min_time_minutes % 60).strftime('%I:%M %p')}-"
             f"{time(max_time_minutes // 60, max_time_minutes % 60).strftime('%I:%M %p')} "
             f"at {tee_time_interval_minutes}-minute intervals"
         )
 
-        all_available_times = [t for t, _ in eligible_slots]
+        eligible_times = sorted(slot_time for _, slot_time, _ in ranked_slots)
         logger.info(
             f"BOOKING_DEBUG: Available times with {num_players}+ spots: "
-            f"{[t.strftime('%I:%M %p') for t in all_available_times[:10]]}"
-            f"{'...' if len(all_available_times) > 10 else ''}"
+            f"{[t.strftime('%I:%M %p') for t in eligible_times[:10]]}"
+            f"{'...' if len(eligible_times) > 10 else ''}"
         )
 
         exact_match = None
         best_slot = None
-        best_diff = float("inf")
+        best_diff = 0
+        filtered_out_count = 0
 
         # Log excluded times if any
         if times_to_exclude:
@@ -3360,17 +5005,7 @@ class WaldenGolfProvider(ReservationProvider):
                 f"{[t.strftime('%I:%M %p') for t in sorted(times_to_exclude)]}"
             )
 
-        for slot_time, slot_element in eligible_slots:
-            slot_minutes = slot_time.hour * 60 + slot_time.minute
-            diff = abs(slot_minutes - target_minutes)
-
-            if diff == 0:
-                exact_match = (slot_time, slot_element)
-                logger.info(
-                    f"BOOKING_DEBUG: Found exact match for requested time "
-                    f"{target_time.strftime('%I:%M %p')}"
-                )
-
+        for diff, slot_time, slot_element in ranked_slots:
             # When selecting fallback slots, skip times that are excluded
             # (e.g., times needed by other bookings in a batch)
             if slot_time in times_to_exclude and diff != 0:
@@ -3380,10 +5015,25 @@ class WaldenGolfProvider(ReservationProvider):
                 )
                 continue
 
-            # eligible_slots already enforces fallback window and interval alignment
-            if diff < best_diff:
-                best_diff = diff
-                best_slot = (slot_time, slot_element)
+            if not is_northgate(slot_element):
+                filtered_out_count += 1
+                continue
+
+            if diff == 0:
+                exact_match = (slot_time, slot_element)
+                logger.info(
+                    f"BOOKING_DEBUG: Found exact match for requested time "
+                    f"{target_time.strftime('%I:%M %p')}"
+                )
+            best_slot = (slot_time, slot_element)
+            best_diff = diff
+            break
+
+        if filtered_out_count:
+            logger.info(
+                f"BOOKING_DEBUG: Filtered {filtered_out_count} non-Northgate slots "
+                f"ahead of the selected slot"
+            )
 
         if exact_match:
             booked_time, reserve_element = exact_match
@@ -3397,7 +5047,7 @@ class WaldenGolfProvider(ReservationProvider):
 
         if best_slot:
             booked_time, reserve_element = best_slot
-            time_diff_minutes = int(best_diff)
+            time_diff_minutes = best_diff
             logger.warning(
                 f"BOOKING_DEBUG: Exact requested time {target_time.strftime('%I:%M %p')} "
                 f"not available with {num_players} spots. "
@@ -3433,7 +5083,12 @@ class WaldenGolfProvider(ReservationProvider):
             result.course_name = self.NORTHGATE_COURSE_NAME
             return result
         else:
-            all_times = [t.strftime("%I:%M %p") for t, _ in eligible_slots[:5]]
+            # Failure path only: course-check the remaining candidates to list them
+            all_times = [
+                slot_time.strftime("%I:%M %p")
+                for _, slot_time, slot_element in sorted(ranked_slots, key=lambda c: c[1])
+                if is_northgate(slot_element)
+            ][:5]
 
             # Extract event blocks that may be blocking the requested time window
             event_blocks = self._extract_event_blocks(
@@ -3572,6 +5227,35 @@ class WaldenGolfProvider(ReservationProvider):
         )
         return candidates[0] if candidates else None
 
+    def _find_target_slots_js_batch(
+        self, driver: webdriver.Chrome, specs: list[dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Find the best slot for several requests with one DOM scan.
+
+        Each spec carries bookingId, targetHour, targetMinute, minPlayers,
+        fallbackMinutes, intervalMinutes and excludeTimes ({h, m} dicts). Every
+        spec is ranked exactly as _rank_candidate_slots_js would rank it, but
+        against a single snapshot of the sheet and in one round trip.
+
+        Returns:
+            The best slot dict per booking id; requests with no suitable slot
+            are absent. Empty if the script fails.
+        """
+        if not specs:
+            return {}
+        try:
+            found = driver.execute_script(
+                _JS_FIND_TARGET_SLOTS_BATCH,
+                specs,
+                self.NORTHGATE_COURSE_INDEX,
+                self.MAX_PLAYERS,
+            )
+        except WebDriverException as e:
+            logger.warning(f"BATCH_BOOKING: Batched slot pre-location failed: {e}")
+            return {}
+        return found if isinstance(found, dict) else {}
+
     def _rank_candidate_slots_js(
         self,
         driver: webdriver.Chrome,
@@ -3618,121 +5302,9 @@ class WaldenGolfProvider(ReservationProvider):
 
         exclude_list = [{"h": t.hour, "m": t.minute} for t in times_to_exclude]
 
-        js_code = """
-        var targetHour = arguments[0];
-        var targetMinute = arguments[1];
-        var minPlayers = arguments[2];
-        var fallbackMinutes = arguments[3];
-        var intervalMinutes = arguments[4];
-        var excludeTimes = arguments[5];
-        var northgateIndex = arguments[6];
-        var maxPlayers = arguments[7];
-
-        var targetMinutes = targetHour * 60 + targetMinute;
-        var items = document.querySelectorAll('li.ui-datascroller-item');
-        var candidates = [];
-
-        // Build exclude set for O(1) lookup
-        var excludeSet = {};
-        for (var e = 0; e < excludeTimes.length; e++) {
-            excludeSet[excludeTimes[e].h * 60 + excludeTimes[e].m] = true;
-        }
-
-        for (var i = 0; i < items.length; i++) {
-            var item = items[i];
-            var itemHtml = item.innerHTML;
-
-            // Check course via element ID pattern: teeTimeCourses:X
-            // Northgate uses index "0", Walden uses index "1"
-            var courseMatch = itemHtml.match(/teeTimeCourses:(\\d+)/);
-            if (!courseMatch || courseMatch[1] !== northgateIndex) {
-                continue; // Skip slots without a course index or non-Northgate slots
-            }
-
-            // Extract time from label or text content
-            var label = item.querySelector('label');
-            var timeText = label ? label.textContent.trim() : '';
-            if (!timeText) {
-                var allText = item.textContent;
-                var timeMatch = allText.match(/(\\d{1,2}):(\\d{2})\\s*([AaPp][Mm])/);
-                if (timeMatch) {
-                    timeText = timeMatch[0];
-                }
-            }
-            if (!timeText) continue;
-
-            // Parse time
-            var tmatch = timeText.match(/(\\d{1,2}):(\\d{2})\\s*([AaPp][Mm])/i);
-            if (!tmatch) continue;
-            var h = parseInt(tmatch[1]);
-            var m = parseInt(tmatch[2]);
-            var ampm = tmatch[3].toUpperCase();
-            if (ampm === 'PM' && h !== 12) h += 12;
-            if (ampm === 'AM' && h === 12) h = 0;
-
-            var slotMinutes = h * 60 + m;
-            var diff = Math.abs(slotMinutes - targetMinutes);
-
-            // Check fallback window
-            if (diff > fallbackMinutes) continue;
-
-            // Check interval alignment
-            if (diff % intervalMinutes !== 0) continue;
-
-            // Check availability
-            var emptyDivs = item.querySelectorAll('div.Empty');
-            var availableSpans = item.querySelectorAll('span.custom-free-slot-span');
-            var isAvailable = false;
-            var availableCount = 0;
-
-            if (emptyDivs.length > 0) {
-                availableCount = maxPlayers;
-                isAvailable = (minPlayers <= maxPlayers);
-            } else if (availableSpans.length >= minPlayers) {
-                availableCount = availableSpans.length;
-                isAvailable = true;
-            }
-
-            if (!isAvailable) continue;
-
-            // Component id of the slot's Reserve link. The direct-HTTP path
-            // replays that component's PrimeFaces request, so it needs the id
-            // rather than the NodeList index the JS chain clicks by.
-            var reserveEl = item.querySelector("a[id*='reserve_button']") ||
-                item.querySelector('a.slot-link');
-
-            var slotInfo = {
-                timeStr: h + ':' + (m < 10 ? '0' : '') + m,
-                hours: h,
-                minutes: m,
-                index: i,
-                diff: diff,
-                available: availableCount,
-                isExact: (diff === 0),
-                reserveId: reserveEl ? reserveEl.id : null
-            };
-
-            // For fallback slots, skip excluded times. Never for the exact time
-            // asked for: that one is the booking, not a stand-in chosen for it.
-            if (diff !== 0 && excludeSet[slotMinutes]) continue;
-
-            candidates.push(slotInfo);
-        }
-
-        // Nearest to the requested time first, and on a tie the earlier tee
-        // time - the same order the single-slot search reached by scanning rows
-        // in time order and keeping the first strictly-closer one.
-        candidates.sort(function (a, b) {
-            if (a.diff !== b.diff) return a.diff - b.diff;
-            return (a.hours * 60 + a.minutes) - (b.hours * 60 + b.minutes);
-        });
-
-        return candidates;
-        """
-
         candidates: list[dict[str, Any]] = (
             driver.execute_script(
-                js_code,
+                _JS_RANK_CANDIDATE_SLOTS,
                 target_time.hour,
                 target_time.minute,
                 num_players,
@@ -3778,25 +5350,7 @@ class WaldenGolfProvider(ReservationProvider):
         Returns:
             True if the click was performed, False if the element was not found
         """
-        js_click = """
-        var items = document.querySelectorAll('li.ui-datascroller-item');
-        var item = items[arguments[0]];
-        if (!item) return false;
-
-        // Find the clickable element in priority order
-        var btn = item.querySelector("a[id*='reserve_button']");
-        if (!btn) {
-            var spans = item.querySelectorAll('span.custom-free-slot-span');
-            btn = spans.length > 0 ? spans[0] : null;
-        }
-        if (!btn) btn = item.querySelector("a.slot-link");
-        if (!btn) return false;
-
-        btn.scrollIntoView({block: 'center'});
-        btn.click();
-        return true;
-        """
-        result = driver.execute_script(js_click, slot_index)
+        result = driver.execute_script(_JS_CLICK_SLOT_BY_INDEX, slot_index)
         if result:
             logger.info(f"BOOKING_DEBUG: JS clicked Reserve at slot index {slot_index}")
         else:
@@ -4146,7 +5700,7 @@ class WaldenGolfProvider(ReservationProvider):
             popup = driver.find_element(By.CSS_SELECTOR, DOM.SLOT_BLOCKED.popup_visible)
             if popup.is_displayed():
                 # Extract popup text
-                popup_text = popup.text.lower() if popup.text else ""
+                popup_text = (popup.text or "").lower()
                 logger.warning(
                     f"BOOKING_DEBUG: Validation popup detected, text: {popup_text[:100]}"
                 )
@@ -4179,8 +5733,9 @@ class WaldenGolfProvider(ReservationProvider):
         """
         Wait until the exact execute_at time with millisecond precision.
 
-        Uses coarse sleep for most of the wait, then a tight busy-wait loop
-        for the final 200ms to hit the target time as precisely as possible.
+        The CT wall-clock distance is measured once and turned into a
+        perf_counter deadline. One coarse sleep runs until 50ms out, short
+        sleeps until 2ms out, and a tight spin covers the last stretch.
 
         Args:
             execute_at: Datetime in CT timezone to wait until. May be naive
@@ -4202,14 +5757,15 @@ class WaldenGolfProvider(ReservationProvider):
             f"{execute_at.strftime('%H:%M:%S.%f')}"
         )
 
-        # Coarse sleep until 200ms before target
-        if wait_seconds > 0.2:
-            time_module.sleep(wait_seconds - 0.2)
+        # perf_counter is monotonic and cheap, unlike a timezone-aware now()
+        deadline = time_module.perf_counter() + wait_seconds
+        if wait_seconds > _PRECISION_COARSE_MARGIN_S:
+            time_module.sleep(wait_seconds - _PRECISION_COARSE_MARGIN_S)
 
-        # Precision busy-wait for the final ~200ms
-        # Sub-millisecond sleep reduces CPU pressure with negligible precision loss
-        while CTDateTime.to_naive_ct(CTDateTime.now()) < execute_at:
-            time_module.sleep(0.0001)
+        while deadline - time_module.perf_counter() > _PRECISION_SPIN_MARGIN_S:
+            time_module.sleep(_PRECISION_SHORT_SLEEP_S)
+        while time_module.perf_counter() < deadline:
+            pass
 
         logger.info("BATCH_BOOKING: Precision wait complete - GO!")
 
@@ -4236,6 +5792,8 @@ class WaldenGolfProvider(ReservationProvider):
             target_time: The target tee time being searched for
             fallback_window_minutes: The fallback window in minutes
         """
+        # Scrolling appends slot items, so an earlier list would be short
+        self._invalidate_slot_items(driver)
         max_scroll_attempts = 50
         no_change_threshold = 3
         no_change_count = 0
@@ -4317,7 +5875,10 @@ class WaldenGolfProvider(ReservationProvider):
         )
 
     def _find_empty_slots(
-        self, search_context: Any, min_available_spots: int | None = None
+        self,
+        search_context: Any,
+        min_available_spots: int | None = None,
+        latest_minutes: int | None = None,
     ) -> list[tuple[time, Any]]:
         """
         Find time slots that have at least min_available_spots available.
@@ -4337,6 +5898,11 @@ class WaldenGolfProvider(ReservationProvider):
         Args:
             search_context: The WebDriver element to search within
             min_available_spots: Minimum number of available spots required (default MAX_PLAYERS)
+            latest_minutes: If given, stop at the first slot later than this many minutes
+                past midnight. Within one course's section slots come back in
+                chronological order, so nothing after it can be nearer the target. That
+                slot is still returned, so an empty result keeps meaning "no slot with
+                enough spots on this date".
 
         Returns:
             List of (time, clickable_element) tuples for slots with enough spots
@@ -4347,73 +5913,69 @@ class WaldenGolfProvider(ReservationProvider):
         completely_empty_count = 0
         partial_slots_count = 0
 
+        # One in-page walk classifies every slot and returns the clickable element
+        # for those with enough spots, instead of 3-6 WebDriver round-trips per
+        # slot item. execute_script lives on the driver, so an element context is
+        # passed in as the root to search under.
+        if isinstance(search_context, WebElement):
+            driver, root = search_context.parent, search_context
+        else:
+            driver, root = search_context, None
+
         try:
-            # Find all time slot list items
-            slot_items = search_context.find_elements(
-                By.CSS_SELECTOR, DOM.SLOT_DISCOVERY.slot_items
+            scan = driver.execute_script(
+                _JS_ENUMERATE_SLOTS,
+                root,
+                DOM.SLOT_DISCOVERY.slot_items,
+                DOM.SLOT_DISCOVERY.empty_slot,
+                list(DOM.SLOT_DISCOVERY.reserve_buttons),
+                DOM.SLOT_DISCOVERY.available_span,
+                min_available_spots,
+                self.MAX_PLAYERS,
             )
+        except WebDriverException as e:
+            logger.warning(f"Could not enumerate slot items: {e}")
+            scan = None
+
+        if not isinstance(scan, dict):
+            scan = {"total": 0, "slots": []}
+
+        logger.info(f"Found {scan.get('total', 0)} time slot items")
+
+        # f-strings format eagerly, so the per-slot debug lines are gated on the
+        # level being enabled rather than paying a strftime per slot in production
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        for slot in scan.get("slots") or []:
+            slot_time = self._parse_slot_time_texts(
+                slot.get("labelText") or "",
+                slot.get("text") or "",
+                slot.get("timeFragments") or [],
+            )
+            if not slot_time:
+                continue
 
-            logger.info(f"Found {len(slot_items)} time slot items")
-
-            for slot_item in slot_items:
-                try:
-                    # First check for completely empty slots (class="Empty" with reserve_button)
-                    # These have all MAX_PLAYERS spots available
-                    empty_divs = slot_item.find_elements(
-                        By.CSS_SELECTOR, DOM.SLOT_DISCOVERY.empty_slot
+            empty_slots.append((slot_time, slot["clickable"]))
+            if slot.get("isEmpty"):
+                completely_empty_count += 1
+                if debug_enabled:
+                    logger.debug(f"Found completely empty slot at {slot_time.strftime('%I:%M %p')}")
+            else:
+                partial_slots_count += 1
+                if debug_enabled:
+                    logger.debug(
+                        f"Found partial slot at {slot_time.strftime('%I:%M %p')} "
+                        f"with {slot.get('available')} available spots"
                     )
 
-                    if empty_divs:
-                        # This is a completely empty slot - all MAX_PLAYERS spots available
-                        if min_available_spots <= self.MAX_PLAYERS:
-                            slot_time = self._extract_time_from_slot_item(slot_item)
-                            if slot_time:
-                                # Find the reserve button or the Available link
-                                reserve_btn = None
-                                for btn_sel in DOM.SLOT_DISCOVERY.reserve_buttons:
-                                    try:
-                                        reserve_btn = slot_item.find_element(
-                                            By.CSS_SELECTOR, btn_sel
-                                        )
-                                        break
-                                    except NoSuchElementException:
-                                        continue
-                                if reserve_btn is None:
-                                    reserve_btn = slot_item
-
-                                empty_slots.append((slot_time, reserve_btn))
-                                completely_empty_count += 1
-                                logger.debug(
-                                    f"Found completely empty slot at {slot_time.strftime('%I:%M %p')}"
-                                )
-                        continue
-
-                    # Check for partially filled slots (class="Reserved" with Available spans)
-                    available_spans = slot_item.find_elements(
-                        By.CSS_SELECTOR, DOM.SLOT_DISCOVERY.available_span
+            if latest_minutes is not None and (
+                slot_time.hour * 60 + slot_time.minute > latest_minutes
+            ):
+                if debug_enabled:
+                    logger.debug(
+                        f"Stopping slot scan at {slot_time.strftime('%I:%M %p')}, "
+                        f"past the latest acceptable time"
                     )
-                    num_available = len(available_spans)
-
-                    if num_available >= min_available_spots:
-                        # This slot has enough available spots
-                        slot_time = self._extract_time_from_slot_item(slot_item)
-
-                        if slot_time:
-                            # Get the first Available span as the clickable element
-                            clickable = available_spans[0] if available_spans else slot_item
-                            empty_slots.append((slot_time, clickable))
-                            partial_slots_count += 1
-                            logger.debug(
-                                f"Found partial slot at {slot_time.strftime('%I:%M %p')} "
-                                f"with {num_available} available spots"
-                            )
-
-                except Exception as e:
-                    logger.debug(f"Could not process slot item: {e}")
-                    continue
-
-        except NoSuchElementException:
-            logger.debug("No slot items found")
+                break
 
         empty_slots.sort(key=lambda x: x[0])
         logger.info(
@@ -4422,11 +5984,60 @@ class WaldenGolfProvider(ReservationProvider):
         )
         return empty_slots
 
+    def _get_slot_items(self, search_context: Any) -> list[Any]:
+        """
+        Return the tee sheet's slot <li> items under search_context.
+
+        A failed booking attempt walks the sheet up to three more times (event
+        blocks, disabled-slot reasons, the requested slot's bookers); the list
+        is queried once and shared until _invalidate_slot_items() runs for the
+        driver search_context belongs to.
+        """
+        driver = _owning_driver(search_context)
+        cached = self._slot_items.get(driver)
+        if cached is not None and cached[0] is search_context:
+            return cached[1]
+        items: list[Any] = search_context.find_elements(
+            By.CSS_SELECTOR, DOM.SLOT_DISCOVERY.slot_items
+        )
+        self._slot_items[driver] = (search_context, items)
+        return items
+
+    def _invalidate_slot_items(self, driver: webdriver.Chrome) -> None:
+        """Forget a driver's cached slot items after anything that can re-render its sheet."""
+        self._slot_items.pop(driver, None)
+
+    def _parse_slot_time_texts(
+        self, label_text: str, slot_text: str, fragments: Sequence[str]
+    ) -> time | None:
+        """
+        Parse a slot's time from text already read out of the page.
+
+        Tries the <label> text, then the first 12-hour time in the slot's text,
+        then the first span/div fragment that parses as a time.
+        """
+        if label_text:
+            parsed = self._parse_time(label_text)
+            if parsed:
+                return parsed
+
+        match = _SLOT_TIME_PATTERN.search(slot_text)
+        if match:
+            return self._parse_time(match.group(1))
+
+        for fragment in fragments:
+            parsed = self._parse_time(fragment)
+            if parsed:
+                return parsed
+        return None
+
     def _extract_time_from_slot_item(self, slot_item: Any) -> time | None:
         """
         Extract the time from a time slot list item.
 
         The time is typically in a <label> element or in the slot's text content.
+        Both are covered by one read of the item's textContent, rather than a
+        label lookup followed by a .text round-trip per span and div.
 
         Args:
             slot_item: The <li> element containing the time slot
@@ -4435,37 +6046,20 @@ class WaldenGolfProvider(ReservationProvider):
             The parsed time, or None if not found
         """
         try:
-            # Try to find a label element with the time
-            try:
-                time_label = slot_item.find_element(By.TAG_NAME, "label")
-                time_text = time_label.text.strip()
-                if time_text:
-                    parsed = self._parse_time(time_text)
-                    if parsed:
-                        return parsed
-            except NoSuchElementException:
-                pass
+            slot_text = slot_item.get_attribute("textContent") or ""
+        except WebDriverException as e:
+            logger.debug(f"Error extracting time from slot item: {e}")
+            return None
 
-            # Try to find time in the slot's text content
-            slot_text = slot_item.text
-            # Look for time pattern like "07:46 AM" or "1:30 PM"
-            time_pattern = r"\b(\d{1,2}:\d{2}\s*[AaPp][Mm])\b"
-            match = re.search(time_pattern, slot_text)
-            if match:
-                return self._parse_time(match.group(1))
-
-            # Try to find time in any span or div
-            for tag in ["span", "div"]:
-                elements = slot_item.find_elements(By.TAG_NAME, tag)
-                for elem in elements:
-                    text = elem.text.strip()
-                    if text:
-                        parsed = self._parse_time(text)
-                        if parsed:
-                            return parsed
+        # Look for time pattern like "07:46 AM" or "1:30 PM"
+        match = _SLOT_TIME_PATTERN.search(slot_text)
+        if match:
+            return self._parse_time(match.group(1))
 
-        except Exception as e:
-            logger.debug(f"Error extracting time from slot item: {e}")
+        # Sheets rendered with 24-hour times carry no AM/PM suffix
+        match = _SLOT_TIME_24H_PATTERN.search(slot_text)
+        if match:
+            return self._parse_time(match.group(0))
 
         return None
 
@@ -4481,10 +6075,7 @@ class WaldenGolfProvider(ReservationProvider):
             The slot item element if found, None otherwise
         """
         try:
-            slot_items = search_context.find_elements(
-                By.CSS_SELECTOR, DOM.SLOT_DISCOVERY.slot_items
-            )
-            for slot_item in slot_items:
+            for slot_item in self._get_slot_items(search_context):
                 slot_time = self._extract_time_from_slot_item(slot_item)
                 if slot_time and slot_time == target_time:
                     return slot_item
@@ -4506,7 +6097,7 @@ class WaldenGolfProvider(ReservationProvider):
         Returns:
             The course index ("0" or "1") if found, None otherwise.
         """
-        match = re.search(r"teeTimeCourses:(\d+)", element_id)
+        match = _COURSE_INDEX_PATTERN.search(element_id)
         if match:
             return match.group(1)
         return None
@@ -4617,15 +6208,14 @@ class WaldenGolfProvider(ReservationProvider):
                     lines = [line.strip() for line in div_text.split("\n") if line.strip()]
                     for line in lines:
                         if line and "Available" not in line and "Reserve" not in line:
-                            if re.match(r"^[A-Za-z]", line) and "," in line:
+                            if _BOOKER_LINE_PATTERN.match(line) and "," in line:
                                 bookers.append(line)
 
             if not bookers:
                 slot_text = slot_item.text
                 # Match names like "O'Donnell, Deborah", "mcghee, mike", "Garrett, Steve"
                 # Handles apostrophes, lowercase names, and multi-part first names
-                name_pattern = r"([A-Za-z][A-Za-z']+,\s*[A-Za-z][A-Za-z' ]*)"
-                matches = re.findall(name_pattern, slot_text)
+                matches = _BOOKER_NAME_PATTERN.findall(slot_text)
                 # Filter out non-name matches like "Available" or "Reserve"
                 for match in matches:
                     if "Available" not in match and "Reserve" not in match:
@@ -4637,7 +6227,7 @@ class WaldenGolfProvider(ReservationProvider):
                     span_text = span.text.strip()
                     if span_text and "Available" not in span_text and "Reserve" not in span_text:
                         # Match names with apostrophes and lowercase (e.g., "O'Donnell,", "mcghee,")
-                        if re.match(r"^[A-Za-z][A-Za-z']+,", span_text):
+                        if _BOOKER_SPAN_PATTERN.match(span_text):
                             bookers.append(span_text)
 
         except Exception as e:
@@ -4696,22 +6286,15 @@ class WaldenGolfProvider(ReservationProvider):
         min_time_minutes = max(0, target_minutes - fallback_window_minutes)
         max_time_minutes = min(24 * 60 - 1, target_minutes + fallback_window_minutes)
 
-        # Pattern to match time ranges like "08:26 AM-10:42 AM" or "9:00 AM - 11:00 AM"
-        time_range_pattern = re.compile(
-            r"(\d{1,2}:\d{2}\s*[AaPp][Mm])\s*-\s*(\d{1,2}:\d{2}\s*[AaPp][Mm])"
-        )
-
         try:
-            slot_items = search_context.find_elements(By.CSS_SELECTOR, "li.ui-datascroller-item")
-
-            for slot_item in slot_items:
+            for slot_item in self._get_slot_items(search_context):
                 try:
                     slot_text = slot_item.text.strip()
                     if not slot_text:
                         continue
 
                     # Check if this is an event block (contains a time range)
-                    time_range_match = time_range_pattern.search(slot_text)
+                    time_range_match = _TIME_RANGE_PATTERN.search(slot_text)
                     if not time_range_match:
                         continue
 
@@ -4822,14 +6405,8 @@ class WaldenGolfProvider(ReservationProvider):
         min_time_minutes = max(0, target_minutes - fallback_window_minutes)
         max_time_minutes = min(24 * 60 - 1, target_minutes + fallback_window_minutes)
 
-        time_pattern = re.compile(r"(\d{1,2}):(\d{2})\s*([AaPp][Mm])")
-
         try:
-            slot_items = search_context.find_elements(
-                By.CSS_SELECTOR, DOM.SLOT_DISCOVERY.slot_items
-            )
-
-            for slot_item in slot_items:
+            for slot_item in self._get_slot_items(search_context):
                 try:
                     headings = slot_item.find_elements(
                         By.CSS_SELECTOR, DOM.DISABLED_SLOT.reason_heading
@@ -4850,7 +6427,7 @@ class WaldenGolfProvider(ReservationProvider):
                     slot_time = None
                     labels = slot_item.find_elements(By.CSS_SELECTOR, DOM.DISABLED_SLOT.time_label)
                     for label in labels:
-                        match = time_pattern.search(label.text.strip())
+                        match = _TIME_PARTS_PATTERN.search(label.text.strip())
                         if match:
                             hour = int(match.group(1))
                             minute = int(match.group(2))
@@ -4954,6 +6531,100 @@ class WaldenGolfProvider(ReservationProvider):
         Returns:
             List of (time, element) tuples for available slots
         """
+        available_slots = self._collect_available_spans(search_context)
+        if available_slots is None:
+            available_slots = self._collect_available_spans_per_element(search_context)
+
+        if not available_slots:
+            logger.info("No div-based slots found, trying table-based layout fallback")
+            # Reserve buttons and Available links in one query; both read their
+            # time from the same table row cell
+            try:
+                table_controls = search_context.find_elements(
+                    By.XPATH,
+                    f"{DOM.SLOT_DISCOVERY.reserve_buttons_xpath}"
+                    f" | {DOM.SLOT_DISCOVERY.available_links_xpath}",
+                )
+            except WebDriverException as e:
+                logger.debug(f"Table-based slot lookup failed: {e}")
+                table_controls = []
+
+            for control in table_controls:
+                try:
+                    row = control.find_element(By.XPATH, DOM.SLOT_DISCOVERY.row_ancestor_xpath)
+                    time_cell = row.find_element(
+                        By.CSS_SELECTOR, DOM.SLOT_DISCOVERY.table_time_cell
+                    )
+                    time_text = time_cell.text.strip()
+
+                    slot_time = self._parse_time(time_text)
+                    if slot_time:
+                        available_slots.append((slot_time, control))
+
+                except (NoSuchElementException, ValueError) as e:
+                    logger.debug(f"Could not parse table slot: {e}")
+                    continue
+
+        available_slots.sort(key=lambda x: x[0])
+        logger.info(f"Total available slots found: {len(available_slots)}")
+        return available_slots
+
+    def _collect_available_spans(self, search_context: Any) -> list[tuple[time, Any]] | None:
+        """
+        Collect div-based available slots with one in-page scan.
+
+        Args:
+            search_context: The driver or element to search within
+
+        Returns:
+            List of (time, element) tuples, or None if the scan could not run
+            and the caller should fall back to per-element lookups
+        """
+        if isinstance(search_context, WebElement):
+            driver, root = search_context.parent, search_context
+        else:
+            driver, root = search_context, None
+
+        try:
+            scan = driver.execute_script(
+                _JS_COLLECT_AVAILABLE_SPANS,
+                root,
+                DOM.SLOT_DISCOVERY.available_span,
+                list(_ROW_CONTAINER_CSS),
+                list(_CONTAINER_TIME_SELECTORS),
+                DOM.SLOT_DISCOVERY.available_link,
+            )
+        except WebDriverException as e:
+            logger.debug(f"Available span scan failed, using per-element lookups: {e}")
+            return None
+
+        if not isinstance(scan, dict):
+            return None
+
+        total = scan.get("total", 0)
+        if total:
+            logger.info(f"Found {total} available slot spans (div-based layout)")
+
+        available_slots: list[tuple[time, Any]] = []
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        for row in scan.get("rows") or []:
+            slot_time = self._parse_container_time_texts(
+                row.get("timeTexts") or [], row.get("text") or ""
+            )
+            if slot_time:
+                available_slots.append((slot_time, row.get("link")))
+                if debug_enabled:
+                    logger.debug(f"Found available slot at {slot_time.strftime('%I:%M %p')}")
+            else:
+                logger.debug("Could not extract time from row container")
+        return available_slots
+
+    def _collect_available_spans_per_element(self, search_context: Any) -> list[tuple[time, Any]]:
+        """
+        Collect div-based available slots one span at a time.
+
+        Fallback for when the in-page scan in _collect_available_spans cannot run.
+        """
         available_slots: list[tuple[time, Any]] = []
 
         available_spans = search_context.find_elements(
@@ -4993,58 +6664,9 @@ class WaldenGolfProvider(ReservationProvider):
                         logger.debug("Could not extract time from row container")
 
                 except (NoSuchElementException, ValueError) as e:
-                    logger.debug(f"Could not parse div-based slot: {e}")
-                    continue
-
-        if not available_slots:
-            logger.info("No div-based slots found, trying table-based layout fallback")
-            try:
-                reserve_buttons = search_context.find_elements(
-                    By.XPATH,
-                    ".//a[contains(text(), 'Reserve')] | .//button[contains(text(), 'Reserve')]",
-                )
-
-                for button in reserve_buttons:
-                    try:
-                        row = button.find_element(By.XPATH, "./ancestor::tr")
-                        time_cell = row.find_element(By.CSS_SELECTOR, "td:first-child, .time-cell")
-                        time_text = time_cell.text.strip()
-
-                        slot_time = self._parse_time(time_text)
-                        if slot_time:
-                            available_slots.append((slot_time, button))
-
-                    except (NoSuchElementException, ValueError) as e:
-                        logger.debug(f"Could not parse table slot: {e}")
-                        continue
-
-            except NoSuchElementException:
-                pass
-
-            try:
-                available_links = search_context.find_elements(
-                    By.XPATH, ".//a[contains(text(), 'Available')]"
-                )
-
-                for link in available_links:
-                    try:
-                        row = link.find_element(By.XPATH, "./ancestor::tr")
-                        time_cell = row.find_element(By.CSS_SELECTOR, "td:first-child, .time-cell")
-                        time_text = time_cell.text.strip()
-
-                        slot_time = self._parse_time(time_text)
-                        if slot_time:
-                            available_slots.append((slot_time, link))
-
-                    except (NoSuchElementException, ValueError) as e:
-                        logger.debug(f"Could not parse available link: {e}")
-                        continue
-
-            except NoSuchElementException:
-                pass
+                    logger.debug(f"Could not parse div-based slot: {e}")
+                    continue
 
-        available_slots.sort(key=lambda x: x[0])
-        logger.info(f"Total available slots found: {len(available_slots)}")
         return available_slots
 
     def _find_row_container(self, span: Any) -> Any | None:
@@ -5063,30 +6685,37 @@ class WaldenGolfProvider(ReservationProvider):
         Returns:
             The row container element, or None if not found
         """
-        row_container_selectors = [
-            "./ancestor::div[contains(@class, 'block-available')][1]",
-            "./ancestor::div[contains(@class, 'ui-grid-a') and contains(@class, 'full-width')][1]",
-            "./ancestor::div[contains(@class, 'teetime-row')][1]",
-        ]
+        try:
+            containers = span.find_elements(By.XPATH, _ROW_CONTAINER_XPATH)
+        except WebDriverException as e:
+            logger.debug(f"Row container lookup failed: {e}")
+            return None
+        return containers[0] if containers else None
 
-        for selector in row_container_selectors:
-            try:
-                container = span.find_element(By.XPATH, selector)
-                return container
-            except NoSuchElementException:
-                continue
+    def _parse_container_time_texts(self, time_texts: Sequence[str], text: str) -> time | None:
+        """
+        Parse a row container's time from text already read out of the page.
 
-        try:
-            current = span
-            for _ in range(10):
-                current = current.find_element(By.XPATH, "./..")
-                text_content = current.get_attribute("textContent") or ""
-
-                if re.search(r"\d{1,2}:\d{2}\s*[AP]M", text_content, re.IGNORECASE):
-                    return current
-        except (NoSuchElementException, Exception):
-            pass
+        Mirrors _extract_time_from_container: the first 12-hour, then 24-hour
+        time in textContent, then the dedicated time elements' texts.
+        """
+        time_match = _SLOT_TIME_PATTERN.search(text)
+        if time_match:
+            slot_time = self._parse_time(time_match.group(1))
+            if slot_time:
+                return slot_time
+
+        time_match_24h = _SLOT_TIME_24H_PATTERN.search(text)
+        if time_match_24h:
+            slot_time = self._parse_time(time_match_24h.group(0))
+            if slot_time:
+                return slot_time
 
+        for time_text in time_texts:
+            if time_text:
+                slot_time = self._parse_time(time_text)
+                if slot_time:
+                    return slot_time
         return None
 
     def _extract_time_from_container(self, container: Any) -> time | None:
@@ -5094,7 +6723,9 @@ class WaldenGolfProvider(ReservationProvider):
         Extract the tee time from a row container element.
 
         The time may be in a dedicated element or embedded in the container's text.
-        Uses textContent for more reliable extraction than element.text.
+        Uses textContent for more reliable extraction than element.text. The
+        text is read first: it almost always carries the time, and it costs one
+        round-trip where probing the time elements costs up to three.
 
         Args:
             container: The row container element
@@ -5103,12 +6734,15 @@ class WaldenGolfProvider(ReservationProvider):
             The parsed time, or None if extraction fails
         """
         try:
-            time_selectors = [
-                ".teetime-player-col-4",
-                "[class*='time']",
-                ".time-cell",
-            ]
-            for selector in time_selectors:
+            text_content = container.get_attribute("textContent") or container.text or ""
+            slot_time = self._parse_container_time_texts((), text_content)
+            if slot_time:
+                return slot_time
+        except Exception as e:
+            logger.debug(f"Error extracting time from container text: {e}")
+
+        try:
+            for selector in _CONTAINER_TIME_SELECTORS:
                 try:
                     time_element = container.find_element(By.CSS_SELECTOR, selector)
                     time_text = time_element.text.strip()
@@ -5121,23 +6755,6 @@ class WaldenGolfProvider(ReservationProvider):
         except Exception:
             pass
 
-        try:
-            text_content = container.get_attribute("textContent") or container.text or ""
-
-            time_match = re.search(r"\b(\d{1,2}:\d{2}\s*[AP]M)\b", text_content, re.IGNORECASE)
-            if time_match:
-                slot_time = self._parse_time(time_match.group(1))
-                if slot_time:
-                    return slot_time
-
-            time_match_24h = re.search(r"\b([01]?\d|2[0-3]):[0-5]\d\b", text_content)
-            if time_match_24h:
-                slot_time = self._parse_time(time_match_24h.group(0))
-                if slot_time:
-                    return slot_time
-        except Exception as e:
-            logger.debug(f"Error extracting time from container text: {e}")
-
         return None
 
     def _parse_time(self, time_text: str) -> time | None:
@@ -5157,15 +6774,21 @@ class WaldenGolfProvider(ReservationProvider):
         # Check for time range patterns (e.g., "08:26 AM-10:42 AM", "09:00 AM-09:00 AM")
         # These are tournament blocks or maintenance windows, not bookable slots
         # Skip them silently without logging a warning
-        if "-" in time_text and re.search(
-            r"\d{1,2}:\d{2}\s*[AP]M\s*-\s*\d{1,2}:\d{2}\s*[AP]M", time_text
-        ):
+        if "-" in time_text and _TIME_RANGE_PATTERN.search(time_text):
             logger.debug(f"Skipping time range string (tournament/event block): '{original_text}'")
             return None
 
-        formats = ["%I:%M %p", "%I:%M%p", "%H:%M"]
-
-        for fmt in formats:
+        fast = _TIME_FAST_PATTERN.fullmatch(time_text)
+        if fast:
+            hour, minute, meridiem = int(fast.group(1)), int(fast.group(2)), fast.group(3)
+            if minute < 60:
+                if meridiem is None:
+                    if hour < 24:
+                        return time(hour, minute)
+                elif 1 <= hour <= 12:
+                    return time(hour % 12 + (12 if meridiem == "PM" else 0), minute)
+
+        for fmt in _TIME_FORMATS:
             try:
                 parsed = datetime.strptime(time_text, fmt)
                 return parsed.time()
@@ -5181,18 +6804,44 @@ class WaldenGolfProvider(ReservationProvider):
         """
         Capture diagnostic information (screenshot and page source) on failure.
 
+        Only the two driver reads happen here - the driver is not thread-safe and
+        is usually quit right after a failure. Uploading or writing them is
+        handed to a background worker so it doesn't delay the failure result.
+
         Args:
             driver: The WebDriver instance
             context: Description of what operation failed
         """
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            screenshot_bytes = driver.get_screenshot_as_png()
+            html_text = driver.page_source
+        except Exception as e:
+            logger.warning(f"Failed to capture diagnostic info: {e}")
+            return
+
+        self._diagnostic_executor.submit(
+            self._persist_diagnostic_info, context, timestamp, screenshot_bytes, html_text
+        )
+
+    def _persist_diagnostic_info(
+        self, context: str, timestamp: str, screenshot_bytes: bytes, html_text: str
+    ) -> None:
+        """
+        Store captured diagnostics in GCS, falling back to /tmp.
+
+        Runs on the diagnostics worker thread.
+
+        Args:
+            context: Description of what operation failed
+            timestamp: Capture time, used in the artifact names
+            screenshot_bytes: PNG screenshot
+            html_text: Page source
+        """
+        try:
             bucket_name = os.getenv("DEBUG_ARTIFACTS_BUCKET")
 
             if bucket_name:
-                screenshot_bytes = driver.get_screenshot_as_png()
-                html_bytes = driver.page_source.encode("utf-8", errors="replace")
-
                 try:
                     screenshot_object = f"walden/{context}/{timestamp}/screenshot.png"
                     html_object = f"walden/{context}/{timestamp}/page.html"
@@ -5209,38 +6858,36 @@ class WaldenGolfProvider(ReservationProvider):
                         bucket_name=bucket_name,
                         object_name=html_object,
                         content_type="text/html; charset=utf-8",
-                        data=html_bytes,
+                        data=html_text.encode("utf-8", errors="replace"),
                     )
                     logger.info(f"Saved debug HTML to {html_uri}")
 
                 except Exception as upload_error:
-                    screenshot_path = f"/tmp/walden_debug_{context}_{timestamp}.png"
-                    html_path = f"/tmp/walden_debug_{context}_{timestamp}.html"
-
-                    driver.save_screenshot(screenshot_path)
-                    logger.info(f"Saved debug screenshot to {screenshot_path}")
-
-                    with open(html_path, "w", encoding="utf-8") as f:
-                        f.write(driver.page_source)
-                    logger.info(f"Saved debug HTML to {html_path}")
-
+                    self._write_diagnostic_files(context, timestamp, screenshot_bytes, html_text)
                     logger.warning(
                         f"Failed to upload diagnostic artifacts to GCS bucket '{bucket_name}': {upload_error}"
                     )
             else:
-                screenshot_path = f"/tmp/walden_debug_{context}_{timestamp}.png"
-                html_path = f"/tmp/walden_debug_{context}_{timestamp}.html"
-
-                driver.save_screenshot(screenshot_path)
-                logger.info(f"Saved debug screenshot to {screenshot_path}")
-
-                with open(html_path, "w", encoding="utf-8") as f:
-                    f.write(driver.page_source)
-                logger.info(f"Saved debug HTML to {html_path}")
+                self._write_diagnostic_files(context, timestamp, screenshot_bytes, html_text)
                 logger.info("DEBUG_ARTIFACTS_BUCKET not set; remote artifact upload disabled")
 
         except Exception as e:
-            logger.warning(f"Failed to capture diagnostic info: {e}")
+            logger.warning(f"Failed to save diagnostic info: {e}")
+
+    def _write_diagnostic_files(
+        self, context: str, timestamp: str, screenshot_bytes: bytes, html_text: str
+    ) -> None:
+        """Write captured diagnostics to /tmp."""
+        screenshot_path = f"/tmp/walden_debug_{context}_{timestamp}.png"
+        html_path = f"/tmp/walden_debug_{context}_{timestamp}.html"
+
+        with open(screenshot_path, "wb") as f:
+            f.write(screenshot_bytes)
+        logger.info(f"Saved debug screenshot to {screenshot_path}")
+
+        with open(html_path, "w", encoding="utf-8") as f:
+            f.write(html_text)
+        logger.info(f"Saved debug HTML to {html_path}")
 
     def _capture_refresh_artifact(self, chain_result: dict[str, Any], phase: str) -> None:
         """Record the refreshed tee sheet a failed Reserve was fired against.
@@ -5301,7 +6948,13 @@ class WaldenGolfProvider(ReservationProvider):
         """Upload bytes to GCS using ADC and the JSON upload API.
 
         Returns the gs:// URI for the uploaded object.
+
+        google.auth is imported here rather than at module level: it pulls in
+        its crypto stack on import, and only failure diagnostics ever need it.
         """
+        import google.auth
+        from google.auth.transport.requests import Request as GoogleAuthRequest
+
         credentials, _ = google.auth.default(  # type: ignore[no-untyped-call]
             scopes=["https://www.googleapis.com/auth/devstorage.read_write"]
         )
@@ -5422,25 +7075,21 @@ class WaldenGolfProvider(ReservationProvider):
         Returns:
             BookingResult with booking outcome
         """
+        # Clicking Reserve re-renders the sheet, so no cached slot item survives it
+        self._invalidate_slot_items(driver)
         try:
             logger.info(
                 f"BOOKING_DEBUG: Starting booking completion for time={booked_time}, "
                 f"players={num_players}, already_clicked={already_clicked}"
             )
 
-            wait = WebDriverWait(driver, 10)
+            wait = WebDriverWait(driver, 10, poll_frequency=_BOOKING_POLL_S)
 
             if not already_clicked:
-                # Scroll element into view with offset to account for sticky header
-                driver.execute_script(
-                    "arguments[0].scrollIntoView({block: 'center'});", reserve_element
-                )
-                self.wait_strategy.simple_wait(fixed_duration=0.5, event_driven_duration=0.1)
-
                 wait.until(expected_conditions.element_to_be_clickable(reserve_element))
 
-                # Use JavaScript click to bypass any overlay issues
-                driver.execute_script("arguments[0].click();", reserve_element)
+                # Scroll into view and use a JavaScript click to bypass any overlay issues
+                driver.execute_script(_JS_SCROLL_AND_CLICK, reserve_element)
                 logger.debug("BOOKING_DEBUG: Clicked Reserve button")
 
             # Check for blocked-slot popup BEFORE waiting for modal
@@ -5509,19 +7158,10 @@ class WaldenGolfProvider(ReservationProvider):
             try:
                 # Wait for the booking form to load
                 logger.debug("BOOKING_DEBUG: Looking for Book Now button")
-                self.wait_strategy.wait_for_element(
-                    driver,
-                    (
-                        By.CSS_SELECTOR,
-                        DOM.BOOKING_COMPLETION.book_now_wait,
-                    ),
-                    fixed_duration=2.0,
-                    timeout=10.0,
-                )
-
-                # Scroll down to make sure the Book Now button is visible
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                self.wait_strategy.simple_wait(fixed_duration=1.0, event_driven_duration=0.2)
+                try:
+                    wait.until(_BOOK_NOW_PRESENT)
+                except TimeoutException:
+                    logger.debug("BOOKING_DEBUG: Book Now button not present by ID yet")
 
                 # Look for "Book Now" link/button - it's an <a> element on Walden Golf
                 # Try to find by ID first (most reliable), then by text content
@@ -5544,20 +7184,16 @@ class WaldenGolfProvider(ReservationProvider):
                         )
                     )
 
-                button_id = confirm_button.get_attribute("id") or "no-id"
-                button_text = confirm_button.text[:50] if confirm_button.text else "no-text"
+                # Scroll to the button and use JavaScript click; the same call
+                # reports the button and the pre-click URL
+                clicked = driver.execute_script(_JS_SCROLL_AND_CLICK, confirm_button)
+                if not isinstance(clicked, dict):
+                    clicked = {}
                 logger.info(
-                    f"BOOKING_DEBUG: Found Book Now button: id='{button_id}', text='{button_text}'"
-                )
-
-                # Scroll to the button and use JavaScript click
-                driver.execute_script(
-                    "arguments[0].scrollIntoView({block: 'center'});", confirm_button
+                    f"BOOKING_DEBUG: Found Book Now button: id='{clicked.get('id') or 'no-id'}', "
+                    f"text='{clicked.get('text') or 'no-text'}'"
                 )
-                self.wait_strategy.simple_wait(fixed_duration=0.5, event_driven_duration=0.1)
-
-                current_url = driver.current_url
-                driver.execute_script("arguments[0].click();", confirm_button)
+                current_url = clicked.get("url") or driver.current_url
                 logger.debug("BOOKING_DEBUG: Clicked Book Now button")
 
                 try:
@@ -5570,14 +7206,7 @@ class WaldenGolfProvider(ReservationProvider):
                         "BOOKING_DEBUG: URL did not change, checking for success indicators"
                     )
                     try:
-                        wait.until(
-                            expected_conditions.presence_of_element_located(
-                                (
-                                    By.XPATH,
-                                    "//*[contains(text(), 'success') or contains(text(), 'confirm') or contains(text(), 'thank')]",
-                                )
-                            )
-                        )
+                        wait.until(_SUCCESS_TEXT_PRESENT)
                     except TimeoutException:
                         logger.debug(
                             "BOOKING_DEBUG: No success indicators found after clicking Book Now"
@@ -5586,11 +7215,13 @@ class WaldenGolfProvider(ReservationProvider):
             except TimeoutException:
                 logger.debug("BOOKING_DEBUG: No confirmation dialog found - booking may be direct")
 
-            confirmation_number = self._extract_confirmation_number(driver)
+            # One read of the outcome page serves all three checks below
+            page_text = self._get_visible_page_text(driver)
+            confirmation_number = self._extract_confirmation_number(driver, page_text)
             logger.debug(f"BOOKING_DEBUG: Extracted confirmation number: {confirmation_number}")
 
             logger.debug("BOOKING_DEBUG: Verifying booking success")
-            if self._verify_booking_success(driver):
+            if self._verify_booking_success(driver, page_text):
                 logger.debug("BOOKING_DEBUG: Booking verification PASSED")
                 return BookingResult(
                     success=True,
@@ -5601,7 +7232,7 @@ class WaldenGolfProvider(ReservationProvider):
             else:
                 logger.error("BOOKING_DEBUG: Booking verification FAILED")
                 self._capture_diagnostic_info(driver, "booking_verification_failed")
-                error_details = self._extract_booking_error_message(driver)
+                error_details = self._extract_booking_error_message(driver, page_text)
                 if error_details:
                     logger.error(f"BOOKING_DEBUG: Extracted booking error text: {error_details}")
                 return BookingResult(
@@ -5628,10 +7259,18 @@ class WaldenGolfProvider(ReservationProvider):
                 error_message=f"Booking error: {str(e)}",
             )
 
-    def _extract_confirmation_number(self, driver: webdriver.Chrome) -> str | None:
-        """Try to extract a confirmation number from the page after booking."""
+    def _extract_confirmation_number(
+        self, driver: webdriver.Chrome, page_text: str | None = None
+    ) -> str | None:
+        """
+        Try to extract a confirmation number from the page after booking.
+
+        page_text is the visible text already read from this page, if any.
+        """
         try:
-            return self._extract_confirmation_number_from_text(self._get_visible_page_text(driver))
+            if page_text is None:
+                page_text = self._get_visible_page_text(driver)
+            return self._extract_confirmation_number_from_text(page_text)
         except Exception as e:
             logger.debug(f"Could not extract confirmation number: {e}")
             return None
@@ -5643,41 +7282,38 @@ class WaldenGolfProvider(ReservationProvider):
         same extraction against its final partial response.
         """
         try:
-            page_text_lower = page_text.lower()
-
-            if (
-                "confirmation" in page_text_lower
-                or "booked" in page_text_lower
-                or "reserved" in page_text_lower
-            ):
-                # Require at least one digit to avoid matching DOM ids/classes (e.g. "DialogDIV")
-                patterns = [
-                    r"confirmation[:\s#]*([A-Z0-9-]*\d[A-Z0-9-]*)",
-                    r"booking[:\s#]*([A-Z0-9-]*\d[A-Z0-9-]*)",
-                    r"reference[:\s#]*([A-Z0-9-]*\d[A-Z0-9-]*)",
-                ]
-
-                for pattern in patterns:
-                    match = re.search(pattern, page_text, re.IGNORECASE)
-                    if match:
-                        return match.group(1)
+            if not _CONFIRMATION_CONTEXT_PATTERN.search(page_text):
+                return None
+
+            best: tuple[int, str] | None = None
+            for match in _CONFIRMATION_NUMBER_PATTERN.finditer(page_text):
+                rank = _CONFIRMATION_KEYWORDS.index(match.group(1).lower())
+                if rank == 0:
+                    return match.group(2)
+                if best is None or rank < best[0]:
+                    best = (rank, match.group(2))
+            if best is not None:
+                return best[1]
 
         except Exception as e:
             logger.debug(f"Could not extract confirmation number: {e}")
 
         return None
 
-    def _verify_booking_success(self, driver: webdriver.Chrome) -> bool:
+    def _verify_booking_success(
+        self, driver: webdriver.Chrome, page_text: str | None = None
+    ) -> bool:
         """
         Verify that the booking was successful by checking page content.
 
+        page_text is the visible text already read from this page, if any.
         Returns False if verification is ambiguous - we should not assume success
         without positive confirmation.
         """
         try:
-            return self._verify_booking_success_text(
-                self._get_visible_page_text(driver), driver.current_url
-            )
+            if page_text is None:
+                page_text = self._get_visible_page_text(driver)
+            return self._verify_booking_success_text(page_text, driver.current_url)
         except Exception as e:
             logger.error(f"BOOKING_DEBUG: Error verifying booking: {e}")
             return False
@@ -5744,42 +7380,20 @@ class WaldenGolfProvider(ReservationProvider):
         """
         try:
             logger.info(f"BOOKING_DEBUG: Verifying booking success. Source: {context}")
-            page_text = text.lower()
-
-            success_indicators = [
-                "successfully",
-                "confirmed",
-                "booked",
-                "reservation complete",
-                "thank you",
-                "your tee time",
-            ]
-
-            failure_indicators = [
-                "error",
-                "failed",
-                "unavailable",
-                "could not",
-                "unable to",
-                "already booked",
-                "no longer available",
-            ]
 
             # Check for failure indicators first
-            found_failures = []
-            for indicator in failure_indicators:
-                if indicator in page_text:
-                    found_failures.append(indicator)
+            found_failures = _matched_indicators(
+                _BOOKING_FAILURE_PATTERN, _BOOKING_FAILURE_INDICATORS, text
+            )
 
             if found_failures:
                 logger.error(f"BOOKING_DEBUG: Found failure indicator(s): {found_failures}")
                 return False, f"the response reported: {', '.join(found_failures)}"
 
             # Check for success indicators
-            found_successes = []
-            for indicator in success_indicators:
-                if indicator in page_text:
-                    found_successes.append(indicator)
+            found_successes = _matched_indicators(
+                _BOOKING_SUCCESS_PATTERN, _BOOKING_SUCCESS_INDICATORS, text
+            )
 
             if found_successes:
                 logger.debug(f"BOOKING_DEBUG: Found success indicator(s): {found_successes}")
@@ -5800,11 +7414,11 @@ class WaldenGolfProvider(ReservationProvider):
         Get all available tee times for a given date.
 
         This method runs the entire workflow in a background thread:
-        1. Creates a new WebDriver instance
+        1. Takes a pooled WebDriver instance (or creates one)
         2. Logs in to the member portal
         3. Navigates to the tee time page
         4. Retrieves available time slots
-        5. Closes the WebDriver
+        5. Returns the WebDriver to the pool
 
         Args:
             target_date: The date to check availability for
@@ -5815,30 +7429,24 @@ class WaldenGolfProvider(ReservationProvider):
         return await asyncio.to_thread(self._get_available_times_sync, target_date)
 
     def _get_available_times_sync(self, target_date: date) -> list[time]:
-        """Synchronous implementation with full driver lifecycle."""
-        driver = self._create_driver()
+        """Synchronous implementation on a pooled driver."""
+        driver = self._acquire_driver()
         try:
+            self._set_blocked_urls(driver, _MEDIA_URL_PATTERNS)
             if not self._perform_login(driver):
                 return []
 
             driver.get(self.TEE_TIME_URL)
 
-            wait = WebDriverWait(driver, 15)
-            wait.until(expected_conditions.presence_of_element_located((By.CSS_SELECTOR, "form")))
+            wait = self._page_wait(driver)
+            wait.until(_FORM_PRESENT)
 
             self._select_course_sync(driver, self.NORTHGATE_COURSE_NAME)
             if not self._select_date_sync(driver, target_date):
                 logger.error(f"Failed to select date {target_date} for availability check")
                 return []
 
-            wait.until(
-                expected_conditions.presence_of_element_located(
-                    (
-                        By.CSS_SELECTOR,
-                        DOM.SLOT_DISCOVERY.page_loaded,
-                    )
-                )
-            )
+            wait.until(_TEE_SHEET_LOADED)
 
             available_slots = self._find_available_slots(driver)
             return [slot_time for slot_time, _ in available_slots]
@@ -5847,7 +7455,7 @@ class WaldenGolfProvider(ReservationProvider):
             logger.error(f"Error getting available times: {e}")
             return []
         finally:
-            driver.quit()
+            self._release_driver_later(driver)
 
     async def cancel_booking(self, confirmation_number: str) -> bool:
         """
@@ -5870,15 +7478,16 @@ class WaldenGolfProvider(ReservationProvider):
 
     def _cancel_booking_sync(self, confirmation_number: str) -> bool:
         """
-        Synchronous cancellation implementation with full driver lifecycle.
+        Synchronous cancellation implementation on a pooled driver.
 
-        Creates driver, performs cancellation, and ensures cleanup in finally block.
+        Acquires a driver, performs cancellation, and returns the driver to the
+        pool in the finally block.
         Includes retry logic for transient failures (slow page loads, missed clicks).
         """
         max_retries = 3
         retry_delay = 2
 
-        driver = self._create_driver()
+        driver = self._acquire_driver()
         try:
             if not self._perform_login(driver):
                 logger.error("Failed to log in for cancellation")
@@ -5894,12 +7503,7 @@ class WaldenGolfProvider(ReservationProvider):
                     )
                     driver.get(self.DASHBOARD_URL)
 
-                    wait = WebDriverWait(driver, 15)
-                    wait.until(
-                        expected_conditions.presence_of_element_located(
-                            (By.CSS_SELECTOR, DOM.CANCELLATION.dashboard_presence)
-                        )
-                    )
+                    self._page_wait(driver).until(_DASHBOARD_PRESENT)
 
                     self.wait_strategy.wait_after_action(driver, fixed_duration=2.0)
 
@@ -5934,7 +7538,7 @@ class WaldenGolfProvider(ReservationProvider):
             logger.error(f"Cancellation WebDriver error: {e}")
             return False
         finally:
-            driver.quit()
+            self._release_driver_later(driver)
 
     def _find_and_cancel_reservation_sync(
         self, driver: webdriver.Chrome, confirmation_number: str
@@ -5966,44 +7570,21 @@ class WaldenGolfProvider(ReservationProvider):
             return False
 
         try:
-            reservation_rows = self._find_reservation_rows(driver)
-            logger.info(f"Found {len(reservation_rows)} potential reservation rows")
-
-            for row in reservation_rows:
-                try:
-                    if self._reservation_row_matches(row, target_date, target_time):
-                        logger.info(f"Found matching reservation row: {row.text[:100]}...")
-
-                        cancel_link = None
-                        try:
-                            cancel_link = row.find_element(
-                                By.CSS_SELECTOR,
-                                DOM.CANCELLATION.cancel_link,
-                            )
-                        except NoSuchElementException:
-                            cancel_links = row.find_elements(By.TAG_NAME, "a")
-                            for link in cancel_links:
-                                aria_label = link.get_attribute("aria-label")
-                                if aria_label and "cancel" in aria_label.lower():
-                                    cancel_link = link
-                                    break
-                                title = link.get_attribute("title")
-                                if title and "cancel" in title.lower():
-                                    cancel_link = link
-                                    break
-
-                        if cancel_link:
-                            logger.info("Clicking cancel button...")
-                            cancel_link.click()
-
-                            return self._confirm_cancellation_sync(
-                                driver, display_date, display_time_12h
-                            )
-                        else:
-                            logger.warning("Cancel link not found in matching row")
+            found = self._find_reservation_to_cancel(driver, target_date, target_time)
+            if found is not None:
+                cancel_link = found.get("cancel")
+            else:
+                cancel_link = self._find_cancel_link_per_row(driver, target_date, target_time)
+                if cancel_link:
+                    try:
+                        driver.execute_script(_JS_MARK_CANCEL_PENDING, cancel_link)
+                    except WebDriverException as e:
+                        logger.debug(f"Could not tag the reservation row being cancelled: {e}")
 
-                except StaleElementReferenceException:
-                    continue
+            if cancel_link:
+                logger.info("Clicking cancel button...")
+                cancel_link.click()
+                return self._confirm_cancellation_sync(driver, display_date, display_time_12h)
 
             logger.warning(f"No matching reservation found for {confirmation_number}")
             return False
@@ -6012,6 +7593,77 @@ class WaldenGolfProvider(ReservationProvider):
             logger.error(f"Error finding reservation: {e}")
             return False
 
+    def _find_reservation_to_cancel(
+        self, driver: webdriver.Chrome, target_date: date, target_time: time
+    ) -> dict[str, Any] | None:
+        """Match the reservation and tag its row in one script call.
+
+        Returns:
+            The script's result, whose "cancel" is the matching row's cancel
+            control (None when no row matched), or None if the script could not
+            run and the caller should fall back to per-row lookups.
+        """
+        date_variations, time_pattern = _reservation_match_patterns(target_date, target_time)
+        try:
+            found = driver.execute_script(
+                _JS_FIND_RESERVATION_TO_CANCEL,
+                DOM.CANCELLATION.reservations_form,
+                DOM.CANCELLATION.reservation_rows,
+                DOM.CANCELLATION.cancel_link,
+                DOM.CANCELLATION.cancel_link_fallback,
+                list(date_variations),
+                time_pattern.pattern,
+            )
+        except WebDriverException as e:
+            logger.debug(f"Reservation lookup script failed, using per-row lookups: {e}")
+            return None
+        if not isinstance(found, dict):
+            return None
+
+        if found.get("formFound"):
+            logger.info("Found reservations form, scoping search to it")
+        else:
+            logger.warning("Reservations form not found, searching entire page")
+        logger.info(f"Found {found.get('rowCount', 0)} potential reservation rows")
+        for _ in range(found.get("missing") or 0):
+            logger.warning("Cancel link not found in matching row")
+        if found.get("cancel"):
+            logger.info(f"Found matching reservation row: {(found.get('text') or '')[:100]}...")
+        return found
+
+    def _find_cancel_link_per_row(
+        self, driver: webdriver.Chrome, target_date: date, target_time: time
+    ) -> Any | None:
+        """Locate the matching reservation's cancel control one row at a time.
+
+        Fallback for when the row scan script cannot run.
+        """
+        reservation_rows = self._find_reservation_rows(driver)
+        logger.info(f"Found {len(reservation_rows)} potential reservation rows")
+
+        for row in reservation_rows:
+            try:
+                row_text = row.text
+                if not self._reservation_text_matches(row_text, target_date, target_time):
+                    continue
+                logger.info(f"Found matching reservation row: {row_text[:100]}...")
+
+                # find_elements returns [] on a miss; the fallback matches the
+                # aria-label/title case-insensitively in the browser rather than
+                # reading both attributes of every link in the row
+                for selector in (
+                    DOM.CANCELLATION.cancel_link,
+                    DOM.CANCELLATION.cancel_link_fallback,
+                ):
+                    links = row.find_elements(By.CSS_SELECTOR, selector)
+                    if links:
+                        return links[0]
+
+                logger.warning("Cancel link not found in matching row")
+            except StaleElementReferenceException:
+                continue
+        return None
+
     def _find_reservation_rows(self, driver: webdriver.Chrome) -> list[Any]:
         """Return the rows of the member's reservations table.
 
@@ -6030,39 +7682,21 @@ class WaldenGolfProvider(ReservationProvider):
             logger.warning("Reservations form not found, searching entire page")
             return list(driver.find_elements(By.CSS_SELECTOR, DOM.CANCELLATION.reservation_rows))
 
-    def _reservation_row_matches(self, row: Any, target_date: date, target_time: time) -> bool:
-        """Report whether a reservations-table row is this tee time.
+    def _reservation_text_matches(
+        self, row_text: str, target_date: date, target_time: time
+    ) -> bool:
+        """Report whether a reservations-table row's text is this tee time.
 
         Both the date and the time have to match, in any of the formats the page
         has been seen to render them in.
         """
-        row_text = row.text
-        lowered = row_text.lower()
-
-        if "tee time" not in lowered:
+        if "tee time" not in row_text.lower():
             return False
 
-        date_variations = (
-            target_date.strftime("%m/%d/%Y"),
-            target_date.strftime("%m/%d/%y"),
-        )
+        date_variations, time_pattern = _reservation_match_patterns(target_date, target_time)
         if not any(variation in row_text for variation in date_variations):
             return False
-
-        time_variations = (
-            target_time.strftime("%I:%M %p").lstrip("0"),
-            target_time.strftime("%H:%M"),
-            target_time.strftime("%I:%M%p").lstrip("0"),
-            target_time.strftime("%I:%M %p"),
-        )
-        # The hour must not be preceded by another digit. A bare substring test
-        # lets a row rendering "12:08 PM" satisfy a search for "2:08 PM", which
-        # would report a tee time the member never booked as held - the exact
-        # false confirmation this whole check exists to rule out.
-        return any(
-            re.search(rf"(?<!\d){re.escape(variation)}", row_text, re.IGNORECASE)
-            for variation in time_variations
-        )
+        return time_pattern.search(row_text) is not None
 
     def _reservation_exists(
         self,
@@ -6100,20 +7734,14 @@ class WaldenGolfProvider(ReservationProvider):
                 booked_time.strftime("%I:%M %p"),
             )
             driver.get(self.DASHBOARD_URL)
-            WebDriverWait(driver, 15).until(
-                expected_conditions.presence_of_element_located(
-                    (By.CSS_SELECTOR, DOM.CANCELLATION.dashboard_presence)
-                )
-            )
+            self._page_wait(driver).until(_DASHBOARD_PRESENT)
             self.wait_strategy.wait_after_action(driver, fixed_duration=2.0)
 
-            for row in self._find_reservation_rows(driver):
-                try:
-                    if self._reservation_row_matches(row, target_date, booked_time):
-                        logger.info("RESERVATION_CHECK: Reservation found - %s", row.text[:100])
-                        return True
-                except StaleElementReferenceException:
-                    continue
+            _form_found, row_texts = self._reservation_row_texts(driver)
+            for row_text in row_texts:
+                if self._reservation_text_matches(row_text, target_date, booked_time):
+                    logger.info("RESERVATION_CHECK: Reservation found - %s", row_text[:100])
+                    return True
 
             logger.info("RESERVATION_CHECK: No reservation listed for this tee time")
             return False
@@ -6143,48 +7771,193 @@ class WaldenGolfProvider(ReservationProvider):
             True if cancellation was confirmed successfully, False otherwise
         """
         try:
-            self.wait_strategy.wait_after_action(driver, fixed_duration=1.0)
-
             try:
-                alert = driver.switch_to.alert
-                logger.info(f"Alert detected: {alert.text}")
-                alert.accept()
-                logger.info("Alert accepted")
-                self.wait_strategy.wait_after_action(driver, fixed_duration=1.0)
-                return self._verify_cancellation_success(driver, target_date, target_time)
-            except Exception:
-                pass
-
-            for selector in DOM.CANCELLATION.confirm_css:
-                try:
-                    confirm_btn = driver.find_element(By.CSS_SELECTOR, selector)
-                    if confirm_btn.is_displayed():
-                        logger.info(f"Found confirm button with CSS selector: {selector}")
-                        confirm_btn.click()
-                        self.wait_strategy.wait_after_action(driver, fixed_duration=1.0)
-                        return self._verify_cancellation_success(driver, target_date, target_time)
-                except NoSuchElementException:
-                    continue
-
-            for xpath in DOM.CANCELLATION.confirm_xpaths:
-                try:
-                    confirm_btn = driver.find_element(By.XPATH, xpath)
-                    if confirm_btn.is_displayed():
-                        logger.info(f"Found confirm button with XPath: {xpath}")
-                        confirm_btn.click()
-                        self.wait_strategy.wait_after_action(driver, fixed_duration=1.0)
-                        return self._verify_cancellation_success(driver, target_date, target_time)
-                except NoSuchElementException:
-                    continue
+                dialog = WebDriverWait(
+                    driver, _CANCEL_DIALOG_TIMEOUT_S, poll_frequency=_CANCEL_POLL_S
+                ).until(self._cancel_confirm_dialog)
+            except TimeoutException:
+                dialog = None
 
-            self.wait_strategy.wait_after_action(driver, fixed_duration=2.0)
+            if isinstance(dialog, Alert):
+                logger.info(f"Alert detected: {dialog.text}")
+                dialog.accept()
+                logger.info("Alert accepted")
+            elif dialog is not None:
+                dialog.click()
 
+            self._wait_for_cancellation_to_settle(driver)
             return self._verify_cancellation_success(driver, target_date, target_time)
 
         except Exception as e:
             logger.error(f"Error confirming cancellation: {e}")
             return False
 
+    def _cancel_confirm_dialog(self, driver: webdriver.Chrome) -> Any:
+        """
+        Wait predicate: the open alert or the displayed confirm button, else False.
+
+        The alert is checked first. A DOM query with one open would accept it
+        (the driver's unhandled-prompt behaviour) and the wait would then sit
+        out its timeout looking for a button that is never coming.
+        """
+        try:
+            return driver.switch_to.alert
+        except NoAlertPresentException:
+            pass
+
+        # One union query per selector kind rather than one find_element (and
+        # one NoSuchElementException) per selector that misses
+        confirm_btn = self._first_displayed_match(driver, DOM.CANCELLATION.confirm_css)
+        if confirm_btn is not None:
+            logger.info("Found confirm button with CSS selectors")
+            return confirm_btn
+        for candidate in driver.find_elements(By.XPATH, _CANCEL_CONFIRM_XPATH):
+            try:
+                if candidate.is_displayed():
+                    logger.info("Found confirm button with XPath")
+                    return candidate
+            except StaleElementReferenceException:
+                continue
+        return False
+
+    def _wait_for_cancellation_to_settle(self, driver: webdriver.Chrome) -> None:
+        """
+        Wait until the tagged reservation row is gone and the page has loaded.
+
+        Times out quietly: verification reads whatever the page shows by then,
+        as it did after the fixed waits this replaces.
+        """
+        try:
+            WebDriverWait(driver, _CANCEL_SETTLE_TIMEOUT_S, poll_frequency=_CANCEL_POLL_S).until(
+                lambda d: d.execute_script(_JS_CANCEL_SETTLED)
+            )
+        except TimeoutException:
+            logger.debug("Reservations page still pending after cancellation; verifying anyway")
+
+    def _cancellation_text_verdict(self, driver: webdriver.Chrome) -> bool | None:
+        """
+        Look for an explicit cancellation success or failure message.
+
+        The reservations form scopes the search when present. The phrases are
+        matched in the browser against the rendered text, so the page is not
+        serialized over the wire just to be scanned in Python.
+
+        Returns:
+            False on a failure message, True on a success message, None if neither
+            was found
+        """
+        result = None
+        try:
+            result = driver.execute_script(
+                _JS_CANCELLATION_VERDICT,
+                DOM.CANCELLATION.reservations_form,
+                _CANCELLATION_FAILURE_INDICATORS,
+                _CANCELLATION_SUCCESS_INDICATORS,
+            )
+        except WebDriverException as e:
+            logger.debug(f"Cancellation message script failed, reading the page instead: {e}")
+
+        if isinstance(result, dict):
+            form_found = bool(result.get("formFound"))
+            verdict = result.get("verdict")
+            indicator = result.get("indicator") or ""
+        else:
+            try:
+                reservations_form = driver.find_element(
+                    By.CSS_SELECTOR, DOM.CANCELLATION.reservations_form
+                )
+                reservations_text = reservations_form.text.lower()
+                form_found = True
+            except NoSuchElementException:
+                reservations_text = driver.page_source.lower()
+                form_found = False
+            verdict, indicator = "unknown", ""
+            failures = _matched_indicators(
+                _CANCELLATION_FAILURE_PATTERN, _CANCELLATION_FAILURE_INDICATORS, reservations_text
+            )
+            if failures:
+                verdict, indicator = "fail", failures[0]
+            else:
+                successes = _matched_indicators(
+                    _CANCELLATION_SUCCESS_PATTERN,
+                    _CANCELLATION_SUCCESS_INDICATORS,
+                    reservations_text,
+                )
+                if successes:
+                    verdict, indicator = "ok", successes[0]
+
+        if form_found:
+            logger.info("Scoped verification to reservations form")
+        else:
+            logger.warning("Reservations form not found, using full page for verification")
+
+        if verdict == "fail":
+            logger.warning(f"Cancellation failed - found '{indicator}' in reservations area")
+            return False
+        if verdict == "ok":
+            logger.info(f"Cancellation confirmed - found '{indicator}' in reservations area")
+            return True
+        return None
+
+    def _reservation_row_texts(self, driver: webdriver.Chrome) -> tuple[bool, list[str]]:
+        """
+        Rendered text of every reservations-table row.
+
+        One script returns all of them in one round-trip; per-row .text reads
+        are the fallback. Rows come from the reservations form when it is
+        present and from the whole page otherwise.
+
+        innerText rather than textContent: textContent runs adjacent cells
+        together ("08/08/20265:08 PM"), which would defeat the digit boundary
+        the time match relies on.
+
+        Returns:
+            Whether the reservations form was found, and the row texts
+        """
+        scan = None
+        try:
+            scan = driver.execute_script(
+                _JS_RESERVATION_ROW_TEXTS,
+                DOM.CANCELLATION.reservations_form,
+                DOM.CANCELLATION.reservation_rows,
+            )
+        except WebDriverException as e:
+            logger.debug(f"Reservation row scan failed, using per-row reads: {e}")
+        if isinstance(scan, dict):
+            return bool(scan.get("formFound")), [text or "" for text in scan.get("texts") or []]
+
+        try:
+            reservations_form = driver.find_element(
+                By.CSS_SELECTOR, DOM.CANCELLATION.reservations_form
+            )
+            rows = reservations_form.find_elements(
+                By.CSS_SELECTOR, DOM.CANCELLATION.reservation_rows
+            )
+            form_found = True
+        except NoSuchElementException:
+            rows = driver.find_elements(By.CSS_SELECTOR, DOM.CANCELLATION.reservation_rows)
+            form_found = False
+
+        texts = []
+        for row in rows:
+            try:
+                texts.append(row.text)
+            except StaleElementReferenceException:
+                continue
+        return form_found, texts
+
+    def _reservations_form_row_texts(self, driver: webdriver.Chrome) -> list[str] | None:
+        """
+        Lowercased text of each row in the reservations form.
+
+        Returns:
+            The row texts, or None if the reservations form is not on the page
+        """
+        form_found, row_texts = self._reservation_row_texts(driver)
+        if not form_found:
+            return None
+        return [row_text.lower() for row_text in row_texts]
+
     def _verify_cancellation_success(
         self,
         driver: webdriver.Chrome,
@@ -6207,64 +7980,21 @@ class WaldenGolfProvider(ReservationProvider):
         Returns:
             True if cancellation is confirmed successful, False otherwise
         """
-        # First, try to find the reservations form to scope our search
-        reservations_text = ""
-        try:
-            reservations_form = driver.find_element(
-                By.CSS_SELECTOR, DOM.CANCELLATION.reservations_form
-            )
-            reservations_text = reservations_form.text.lower()
-            logger.info("Scoped verification to reservations form")
-        except NoSuchElementException:
-            # Fall back to page source but log a warning
-            logger.warning("Reservations form not found, using full page for verification")
-            reservations_text = driver.page_source.lower()
-
-        # Check for explicit success messages (scoped to reservations area)
-        success_indicators = [
-            "cancelled successfully",
-            "canceled successfully",
-            "reservation cancelled",
-            "reservation canceled",
-            "successfully cancelled",
-            "successfully canceled",
-        ]
-
-        # Check for explicit failure messages
-        failure_indicators = [
-            "error cancelling",
-            "error canceling",
-            "failed to cancel",
-            "unable to cancel",
-            "cannot cancel",
-            "cancellation failed",
-        ]
-
-        # Check for failure indicators first
-        for indicator in failure_indicators:
-            if indicator in reservations_text:
-                logger.warning(f"Cancellation failed - found '{indicator}' in reservations area")
-                return False
-
-        # Check for success indicators
-        for indicator in success_indicators:
-            if indicator in reservations_text:
-                logger.info(f"Cancellation confirmed - found '{indicator}' in reservations area")
-                return True
+        verdict = self._cancellation_text_verdict(driver)
+        if verdict is not None:
+            return verdict
 
         # If we have target date/time, verify the reservation row is gone
         if target_date and target_time:
-            try:
-                reservations_form = driver.find_element(
-                    By.CSS_SELECTOR, DOM.CANCELLATION.reservations_form
-                )
-                rows = reservations_form.find_elements(By.CSS_SELECTOR, "table tbody tr")
-
-                for row in rows:
-                    row_text = row.text.lower()
+            row_texts = self._reservations_form_row_texts(driver)
+            if row_texts is None:
+                logger.warning("Could not verify reservation removal - form not found")
+            else:
+                date_lower, time_lower = target_date.lower(), target_time.lower()
+                for row_text in row_texts:
                     if "tee time" in row_text:
                         # Check if this row matches our cancelled reservation
-                        if target_date.lower() in row_text and target_time.lower() in row_text:
+                        if date_lower in row_text and time_lower in row_text:
                             logger.warning(
                                 f"Reservation row still present for {target_date} {target_time}"
                             )
@@ -6277,9 +8007,6 @@ class WaldenGolfProvider(ReservationProvider):
                 )
                 return True
 
-            except NoSuchElementException:
-                logger.warning("Could not verify reservation removal - form not found")
-
         # No positive confirmation found - fail-safe: return False
         logger.warning(
             "No explicit success confirmation found and could not verify row removal - "
@@ -6291,11 +8018,11 @@ class WaldenGolfProvider(ReservationProvider):
         """
         Close any resources.
 
-        Note: With the refactored design, each operation manages its own WebDriver
-        lifecycle, so there is nothing to clean up here. This method is kept for
-        interface compatibility.
+        Quits the idle pooled drivers. The drain is queued behind any release
+        still running on the cleanup worker, so a driver returned just before
+        close() is quit too.
         """
-        pass
+        await asyncio.wrap_future(self._cleanup_executor.submit(self._drain_driver_pool))
 
 
 class MockWaldenProvider(ReservationProvider):
@@ -6350,12 +8077,9 @@ class MockWaldenProvider(ReservationProvider):
         )
 
     async def get_available_times(self, target_date: date) -> list[time]:
-        base_time = datetime.combine(target_date, datetime.min.time().replace(hour=7))
-        times = []
-        for i in range(20):
-            slot_time = (base_time + timedelta(minutes=i * 8)).time()
-            times.append(slot_time)
-        return times
+        base_time = datetime.combine(target_date, time(hour=7))
+        step = timedelta(minutes=8)
+        return [(base_time + i * step).time() for i in range(20)]
 
     async def cancel_booking(self, confirmation_number: str) -> bool:
         return True
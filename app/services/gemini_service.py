@@ -50,6 +50,10 @@ GEMINI_RETRY_BASE_DELAY = 0.5
 GEMINI_REQUEST_TIMEOUT = 6.0
 GEMINI_TOTAL_BUDGET = 10.0
 
+# A 12-hour time whose AM/PM marker is glued to the digits or cut to one
+# letter: "8:58a", "8:58P", "8:58AM" (matched after upper-casing).
+_BARE_MERIDIEM_PATTERN = re.compile(r"(\d)([AP])M?$")
+
 
 def _convert_proto_to_dict(obj: Any) -> Any:
     """Recursively convert protobuf/proto-plus objects to plain Python types.
@@ -325,12 +329,7 @@ class GeminiService:
 
         # Try 12-hour formats with AM/PM
         # Normalize: "8:58a" -> "8:58 AM", "8:58AM" -> "8:58 AM", "8:58 am" -> "8:58 AM"
-        normalized = time_str.upper()
-        # Handle "8:58a" or "8:58p" (single letter suffix)
-        normalized = re.sub(r"(\d)A$", r"\1 AM", normalized)
-        normalized = re.sub(r"(\d)P$", r"\1 PM", normalized)
-        # Handle "8:58AM" or "8:58PM" (no space before AM/PM)
-        normalized = re.sub(r"(\d)(AM|PM)$", r"\1 \2", normalized)
+        normalized = _BARE_MERIDIEM_PATTERN.sub(r"\1 \2M", time_str.upper())
 
         for fmt in ("%I:%M %p", "%I:%M:%S %p"):
             try:
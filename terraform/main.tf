@@ -248,6 +248,11 @@ resource "google_cloud_run_v2_service" "teetime" {
         value = tostring(var.walden_fast_booking_immediate)
       }
 
+      env {
+        name  = "WALDEN_PARALLEL_BATCH_BOOKING"
+        value = tostring(var.walden_parallel_batch_booking)
+      }
+
       dynamic "env" {
         for_each = toset(local.runtime_secrets)
         content {
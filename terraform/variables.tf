@@ -221,6 +221,19 @@ variable "walden_fast_booking_immediate" {
   default     = true
 }
 
+variable "walden_parallel_batch_booking" {
+  description = <<-EOT
+    Whether a scheduled batch is split across several browser sessions (up to
+    the driver pool size, each taking a run of the requests) that book
+    concurrently, instead of one after another on a single session.
+
+    Off until tried against the live site: parallel sessions cannot see each
+    other's bookings when picking fallback slots.
+  EOT
+  type        = bool
+  default     = false
+}
+
 variable "debug_artifacts_bucket" {
   description = "GCS bucket name for debug artifacts (screenshots + HTML)"
   type        = string
@@ -5,6 +5,7 @@ These tests verify the mock provider used for testing and development
 when real credentials are not available.
 """
 
+import asyncio
 from datetime import date, time, timedelta
 
 import pytest
@@ -97,6 +98,36 @@ class TestMockWaldenProviderGetAvailableTimes:
         assert isinstance(result, list)
         assert len(result) > 0
 
+    @pytest.mark.asyncio
+    async def test_get_available_times_batch_bounds_concurrency(
+        self, mock_provider: MockWaldenProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Dates are looked up concurrently, never more than the bound at once."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_lookup(target_date: date) -> list[time]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return [time(7, target_date.day)]
+
+        monkeypatch.setattr(mock_provider, "get_available_times", fake_lookup)
+        dates = [date(2026, 5, day) for day in (1, 2, 3, 2, 4)]
+
+        result = await mock_provider.get_available_times_batch(dates, max_concurrency=2)
+
+        assert list(result) == [
+            date(2026, 5, 1),
+            date(2026, 5, 2),
+            date(2026, 5, 3),
+            date(2026, 5, 4),
+        ]
+        assert result[date(2026, 5, 3)] == [time(7, 3)]
+        assert peak == 2
+
     @pytest.mark.asyncio
     async def test_get_available_times_valid_times(self, mock_provider: MockWaldenProvider) -> None:
         """Test that returned times are valid time objects."""
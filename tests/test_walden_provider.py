@@ -7,13 +7,20 @@ against the actual Walden Golf website structure.
 
 import logging
 import os
+import re
 from datetime import date, time, timedelta
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, MagicMock, PropertyMock, patch
 
 import pytest
-from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import (
+    NoAlertPresentException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
 
 from app.config import settings
@@ -91,6 +98,76 @@ class TestWaldenProviderParseTime:
         assert result.hour == 7
         assert result.minute == 30
 
+    def test_parse_time_noon_and_midnight(self, provider: WaldenGolfProvider) -> None:
+        """Test the 12 AM/PM edges match strptime's %I semantics."""
+        assert provider._parse_time("12:42 PM") == time(12, 42)
+        assert provider._parse_time("12:05 AM") == time(0, 5)
+
+    def test_parse_time_out_of_range(self, provider: WaldenGolfProvider) -> None:
+        """Test that out-of-range hours and minutes are rejected."""
+        assert provider._parse_time("13:30 PM") is None
+        assert provider._parse_time("00:30 AM") is None
+        assert provider._parse_time("24:00") is None
+        assert provider._parse_time("07:60 AM") is None
+
+    def test_parse_time_range_returns_none(self, provider: WaldenGolfProvider) -> None:
+        """Test that event time ranges are not parsed as a single time."""
+        assert provider._parse_time("08:26 AM-10:42 AM") is None
+
+
+class TestWithRetry:
+    """Tests for the with_retry backoff."""
+
+    def test_backoff_is_capped_and_jittered(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Each delay is the capped exponential step scaled by the random jitter."""
+        import app.providers.walden_provider as walden_module
+
+        sleeps: list[float] = []
+        monkeypatch.setattr(walden_module.time_module, "sleep", sleeps.append)
+        monkeypatch.setattr(walden_module.random, "uniform", lambda lo, hi: hi)
+        calls = MagicMock(
+            side_effect=[StaleElementReferenceException(), StaleElementReferenceException(), "ok"],
+            __name__="book",
+        )
+
+        wrapped = walden_module.with_retry(
+            max_attempts=3, backoff_base=1.0, max_delay=1.5, jitter=0.5
+        )(calls)
+
+        assert wrapped() == "ok"
+        assert sleeps == [1.5, 2.25]
+
+    def test_timeout_is_not_retried_unless_opted_in(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A wait that timed out fails at once by default; a site listing it still retries."""
+        import app.providers.walden_provider as walden_module
+
+        monkeypatch.setattr(walden_module.time_module, "sleep", MagicMock())
+
+        default = MagicMock(side_effect=TimeoutException(), __name__="wait_for_modal")
+        with pytest.raises(TimeoutException):
+            walden_module.with_retry()(default)()
+        default.assert_called_once()
+
+        opted_in = MagicMock(side_effect=[TimeoutException(), "ok"], __name__="navigate")
+        retrying = walden_module.with_retry(
+            exceptions=(*walden_module.TRANSIENT_EXCEPTIONS, TimeoutException)
+        )
+        assert retrying(opted_in)() == "ok"
+
+    def test_non_transient_error_is_not_retried(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A missing element fails immediately instead of spending retry budget."""
+        import app.providers.walden_provider as walden_module
+
+        sleep = MagicMock()
+        monkeypatch.setattr(walden_module.time_module, "sleep", sleep)
+        calls = MagicMock(side_effect=NoSuchElementException(), __name__="find")
+
+        with pytest.raises(NoSuchElementException):
+            walden_module.with_retry()(calls)()
+
+        calls.assert_called_once()
+        sleep.assert_not_called()
+
 
 class TestWaldenProviderCredentials:
     """Tests for credentials validation."""
@@ -103,6 +180,298 @@ class TestWaldenProviderCredentials:
             assert "credentials not configured" in caplog.text.lower() or True
 
 
+class TestWaldenProviderSessionReuse:
+    """Tests for replaying a cached login session into new drivers."""
+
+    COOKIES = [{"name": "JSESSIONID", "value": "abc", "domain": "www.waldengolf.com"}]
+
+    @staticmethod
+    def _no_wait(monkeypatch: pytest.MonkeyPatch) -> None:
+        """Make the login form's explicit waits return immediately."""
+        import app.providers.walden_provider as walden_module
+
+        class DummyWait:
+            def __init__(self, *_args: object, **_kwargs: object) -> None:
+                pass
+
+            def until(self, *_args: object, **_kwargs: object) -> MagicMock:
+                return MagicMock()
+
+        monkeypatch.setattr(walden_module, "WebDriverWait", DummyWait)
+        monkeypatch.setattr(walden_module, "_BackoffWait", DummyWait)
+
+    def test_cached_session_skips_the_login_form(self, provider: WaldenGolfProvider) -> None:
+        """A fresh driver gets the cached cookies instead of a credential round."""
+        first = MagicMock()
+        first.get_cookies.return_value = self.COOKIES
+        provider._remember_session(first)
+
+        driver = MagicMock()
+        driver.current_url = WaldenGolfProvider.DASHBOARD_URL
+
+        assert provider._perform_login(driver) is True
+        driver.add_cookie.assert_called_once_with(self.COOKIES[0])
+        visited = [c.args[0] for c in driver.get.call_args_list]
+        assert WaldenGolfProvider.LOGIN_URL not in visited
+
+    def test_expired_session_logs_in_again(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Past its reuse window the cache is ignored."""
+        self._no_wait(monkeypatch)
+        provider._session_cookies = self.COOKIES
+        provider._session_expiry = 0.0
+
+        driver = MagicMock()
+        driver.current_url = WaldenGolfProvider.DASHBOARD_URL
+
+        assert provider._perform_login(driver) is True
+        driver.add_cookie.assert_not_called()
+        driver.get.assert_called_with(WaldenGolfProvider.LOGIN_URL)
+
+    def test_rejected_session_falls_back_to_login(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A replayed session that lands on the login page is dropped, not trusted."""
+        self._no_wait(monkeypatch)
+        first = MagicMock()
+        first.get_cookies.return_value = self.COOKIES
+        provider._remember_session(first)
+
+        driver = MagicMock()
+        driver.current_url = WaldenGolfProvider.LOGIN_URL
+
+        assert provider._restore_session(driver) is False
+        assert provider._session_cookies is None
+
+    def test_rejected_session_keeps_a_newer_one(self, provider: WaldenGolfProvider) -> None:
+        """A session another driver cached meanwhile survives this driver's rejection."""
+        first = MagicMock()
+        first.get_cookies.return_value = self.COOKIES
+        provider._remember_session(first)
+        newer = [{"name": "JSESSIONID", "value": "def", "domain": "www.waldengolf.com"}]
+
+        driver = MagicMock()
+        driver.current_url = WaldenGolfProvider.LOGIN_URL
+
+        def other_driver_logs_in(_cookie: object) -> None:
+            other = MagicMock()
+            other.get_cookies.return_value = newer
+            provider._remember_session(other)
+
+        driver.add_cookie.side_effect = other_driver_logs_in
+
+        assert provider._restore_session(driver) is False
+        assert provider._session_cookies is newer
+
+    def test_login_fills_credentials_in_one_command_each(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Credentials are set via script, not typed one keystroke per command."""
+        import app.providers.walden_provider as walden_module
+
+        self._no_wait(monkeypatch)
+        monkeypatch.setattr(settings, "walden_member_number", "12345")
+        monkeypatch.setattr(settings, "walden_password", "secret")
+        driver = MagicMock()
+        driver.current_url = WaldenGolfProvider.DASHBOARD_URL
+        password_input = driver.find_element.return_value
+
+        assert provider._perform_login(driver, reuse_session=False) is True
+
+        fills = [
+            c.args
+            for c in driver.execute_script.call_args_list
+            if c.args[0] == walden_module._JS_FILL_INPUT
+        ]
+        assert [args[2] for args in fills] == ["12345", "secret"]
+        assert fills[1][1] is password_input
+        password_input.send_keys.assert_not_called()
+
+    def test_credential_check_never_reuses_session(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """login() verifies credentials, so it always submits the form."""
+        driver = MagicMock()
+        monkeypatch.setattr(provider, "_create_driver", lambda: driver)
+        perform = MagicMock(return_value=True)
+        monkeypatch.setattr(provider, "_perform_login", perform)
+
+        provider._login_sync()
+
+        perform.assert_called_once_with(driver, reuse_session=False)
+
+
+class TestWaldenProviderCreateDriver:
+    """Tests for WebDriver construction in _create_driver."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_driver_path_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Each test resolves the driver path from scratch."""
+        import app.providers.walden_provider as walden_module
+
+        monkeypatch.setattr(walden_module, "_chromedriver_path", None)
+
+    def test_chromedriver_install_runs_once_per_process(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """ChromeDriverManager's network version check is paid once, not per driver."""
+        import app.providers.walden_provider as walden_module
+
+        monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+        manager_cls = MagicMock()
+        manager_cls.return_value.install.return_value = "/cache/chromedriver"
+        monkeypatch.setattr("webdriver_manager.chrome.ChromeDriverManager", manager_cls)
+        service_cls = MagicMock()
+        monkeypatch.setattr(walden_module, "Service", service_cls)
+        monkeypatch.setattr(walden_module.webdriver, "Chrome", MagicMock())
+
+        provider._create_driver()
+        provider._create_driver()
+
+        manager_cls.return_value.install.assert_called_once()
+        assert [c.args for c in service_cls.call_args_list] == [("/cache/chromedriver",)] * 2
+
+    def test_concurrent_first_callers_install_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Browsers started together by the pool share one install(), not one each."""
+        import threading
+
+        import app.providers.walden_provider as walden_module
+
+        monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+        callers = 4
+        barrier = threading.Barrier(callers)
+
+        def slow_install() -> str:
+            # Still installing while the other callers reach the lock
+            threading.Event().wait(0.05)
+            return "/cache/chromedriver"
+
+        manager_cls = MagicMock()
+        manager_cls.return_value.install.side_effect = slow_install
+        monkeypatch.setattr("webdriver_manager.chrome.ChromeDriverManager", manager_cls)
+        paths: list[str] = []
+
+        def resolve() -> None:
+            barrier.wait()
+            paths.append(walden_module._resolved_chromedriver_path())
+
+        threads = [threading.Thread(target=resolve) for _ in range(callers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        manager_cls.return_value.install.assert_called_once()
+        assert paths == ["/cache/chromedriver"] * callers
+
+    def test_navigation_returns_at_dom_content_loaded(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Page loads use the eager strategy and a bounded page-load timeout."""
+        import app.providers.walden_provider as walden_module
+
+        monkeypatch.setattr(walden_module, "_resolved_chromedriver_path", lambda: "/bin/cd")
+        monkeypatch.setattr(walden_module, "Service", MagicMock())
+        chrome_cls = MagicMock()
+        monkeypatch.setattr(walden_module.webdriver, "Chrome", chrome_cls)
+
+        driver = provider._create_driver()
+
+        assert chrome_cls.call_args.kwargs["options"].page_load_strategy == "eager"
+        driver.set_page_load_timeout.assert_called_once_with(walden_module._PAGE_LOAD_TIMEOUT_S)
+
+    def test_unexpected_prompts_are_accepted_not_raised(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A native confirm() is accepted by the driver instead of failing the next command."""
+        import app.providers.walden_provider as walden_module
+
+        monkeypatch.setattr(walden_module, "_resolved_chromedriver_path", lambda: "/bin/cd")
+        monkeypatch.setattr(walden_module, "Service", MagicMock())
+        chrome_cls = MagicMock()
+        monkeypatch.setattr(walden_module.webdriver, "Chrome", chrome_cls)
+
+        provider._create_driver()
+
+        options = chrome_cls.call_args.kwargs["options"]
+        assert options.to_capabilities()["unhandledPromptBehavior"] == "accept"
+
+    def test_trackers_and_photos_are_blocked_from_the_start(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Analytics, ad and photo requests are refused on every driver, before any navigation."""
+        import app.providers.walden_provider as walden_module
+
+        monkeypatch.setattr(walden_module, "_resolved_chromedriver_path", lambda: "/bin/cd")
+        monkeypatch.setattr(walden_module, "Service", MagicMock())
+        chrome_cls = MagicMock()
+        monkeypatch.setattr(walden_module.webdriver, "Chrome", chrome_cls)
+
+        driver = provider._create_driver()
+
+        driver.execute_cdp_cmd.assert_any_call(
+            "Network.setBlockedURLs", {"urls": list(walden_module._ALWAYS_BLOCKED_URL_PATTERNS)}
+        )
+        driver.get.assert_not_called()
+
+    def test_disables_chrome_features_the_flow_does_not_use(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Background networking, sync and extensions are switched off at launch."""
+        import app.providers.walden_provider as walden_module
+
+        monkeypatch.setattr(walden_module, "_resolved_chromedriver_path", lambda: "/bin/cd")
+        monkeypatch.setattr(walden_module, "Service", MagicMock())
+        chrome_cls = MagicMock()
+        monkeypatch.setattr(walden_module.webdriver, "Chrome", chrome_cls)
+
+        provider._create_driver()
+
+        arguments = chrome_cls.call_args.kwargs["options"].arguments
+        assert "--headless=new" in arguments
+        for arg in (
+            "--disable-extensions",
+            "--disable-background-networking",
+            "--disable-component-update",
+            "--no-first-run",
+        ):
+            assert arg in arguments
+
+    def test_heavy_optional_imports_are_deferred(self) -> None:
+        """Importing the provider loads neither webdriver_manager nor google.auth."""
+        import subprocess
+        import sys
+
+        probe = (
+            "import sys, app.providers.walden_provider; "
+            "print(any(m in sys.modules for m in ('webdriver_manager', 'google.auth')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", probe],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent.parent,
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_chromedriver_path_env_skips_manager(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """An existing CHROMEDRIVER_PATH is used without consulting the manager."""
+        import app.providers.walden_provider as walden_module
+
+        binary = tmp_path / "chromedriver"
+        binary.write_text("")
+        monkeypatch.setenv("CHROMEDRIVER_PATH", str(binary))
+        manager_cls = MagicMock()
+        monkeypatch.setattr("webdriver_manager.chrome.ChromeDriverManager", manager_cls)
+
+        assert walden_module._resolved_chromedriver_path() == str(binary)
+        manager_cls.assert_not_called()
+
+
 @pytest.mark.skipif(
     (not os.getenv("WALDEN_MEMBER_NUMBER") or not os.getenv("WALDEN_PASSWORD"))
     or os.getenv("RUN_WALDEN_INTEGRATION") != "1",
@@ -230,6 +599,19 @@ class TestWaldenProviderConfirmationExtraction:
         result = provider._extract_confirmation_number(mock_driver)
         assert result is None
 
+    def test_extract_confirmation_prefers_confirmation_keyword(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """A confirmation number wins over a booking number listed before it."""
+        text = "Reserved. Booking 2 players. Confirmation: XK-42"
+        assert provider._extract_confirmation_number_from_text(text) == "XK-42"
+
+    def test_extract_confirmation_requires_post_booking_wording(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """A reference number alone, without booked/reserved wording, is ignored."""
+        assert provider._extract_confirmation_number_from_text("Reference: 12345") is None
+
 
 class TestWaldenProviderFindAndBookTimeSlot:
     def test_filters_by_window_and_interval_and_selects_best_slot(
@@ -285,6 +667,79 @@ class TestWaldenProviderFindAndBookTimeSlot:
         assert result.success is True
         assert getattr(result, "booked_time") == time(8, 58)
 
+    def test_northgate_section_found_in_one_script_call(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The course section is located in-page rather than by reading each candidate's text."""
+        from selenium.webdriver.remote.webelement import WebElement
+
+        import app.providers.walden_provider as walden_module
+
+        section = MagicMock(spec=WebElement)
+        driver = MagicMock()
+
+        def execute_script(script: str, *args: object) -> object:
+            if script == walden_module._JS_FIRST_ELEMENT_WITH_TEXT:
+                assert args == (DOM.SLOT_DISCOVERY.course_section, "northgate")
+                return section
+            return MagicMock()
+
+        driver.execute_script.side_effect = execute_script
+        monkeypatch.setattr(provider, "_scroll_to_load_all_slots", MagicMock())
+        find_empty = MagicMock(return_value=[])
+        monkeypatch.setattr(provider, "_find_empty_slots", find_empty)
+        monkeypatch.setattr(provider, "_extract_event_blocks", MagicMock(return_value=[]))
+        monkeypatch.setattr(provider, "_extract_blocked_slot_reasons", MagicMock(return_value=[]))
+
+        provider._find_and_book_time_slot_sync(
+            driver,
+            target_time=time(8, 58),
+            num_players=4,
+            fallback_window_minutes=8,
+            tee_time_interval_minutes=8,
+        )
+
+        assert find_empty.call_args.args[0] is section
+        section.get_attribute.assert_not_called()
+
+    def test_course_check_stops_at_the_nearest_acceptable_slot(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Slots are ranked by distance before the per-slot DOM course check runs."""
+        monkeypatch.setattr(provider, "_scroll_to_load_all_slots", MagicMock())
+        far_early, near_late, exact = MagicMock(), MagicMock(), MagicMock()
+        monkeypatch.setattr(
+            provider,
+            "_find_empty_slots",
+            MagicMock(
+                return_value=[
+                    (time(8, 34), far_early),
+                    (time(8, 58), exact),
+                    (time(9, 6), near_late),
+                ]
+            ),
+        )
+        checked: list[MagicMock] = []
+
+        def is_northgate(el: MagicMock, *_args: object, **_kwargs: object) -> bool:
+            checked.append(el)
+            return True
+
+        monkeypatch.setattr(provider, "_is_northgate_slot", is_northgate)
+        complete = MagicMock(return_value=SimpleNamespace(success=True))
+        monkeypatch.setattr(provider, "_complete_booking_sync", complete)
+
+        provider._find_and_book_time_slot_sync(
+            MagicMock(),
+            target_time=time(8, 58),
+            num_players=4,
+            fallback_window_minutes=32,
+            tee_time_interval_minutes=8,
+        )
+
+        assert checked == [exact]
+        assert complete.call_args.args[2] == time(8, 58)
+
     def test_skip_scroll_does_not_scroll(
         self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -328,6 +783,184 @@ class TestWaldenProviderFindAndBookTimeSlot:
         scroll_mock.assert_not_called()
 
 
+class TestWaldenProviderFindEmptySlots:
+    """Tests for the single-pass slot enumeration in _find_empty_slots."""
+
+    def test_parses_slots_from_one_script_call(self, provider: WaldenGolfProvider) -> None:
+        """Every slot is classified in-page; Python only parses the returned text."""
+        driver = MagicMock()
+        reserve, span = MagicMock(), MagicMock()
+        driver.execute_script.return_value = {
+            "total": 5,
+            "slots": [
+                {
+                    "isEmpty": False,
+                    "available": 4,
+                    "clickable": span,
+                    "labelText": "",
+                    "text": "Northgate 09:06 AM Available",
+                    "timeFragments": [],
+                },
+                {
+                    "isEmpty": True,
+                    "available": 4,
+                    "clickable": reserve,
+                    "labelText": "08:58 AM",
+                    "text": "",
+                    "timeFragments": [],
+                },
+                {
+                    "isEmpty": True,
+                    "available": 4,
+                    "clickable": MagicMock(),
+                    "labelText": "",
+                    "text": "no time here",
+                    "timeFragments": [],
+                },
+            ],
+        }
+
+        slots = provider._find_empty_slots(driver, min_available_spots=4)
+
+        assert slots == [(time(8, 58), reserve), (time(9, 6), span)]
+        driver.execute_script.assert_called_once()
+        driver.find_elements.assert_not_called()
+
+    def test_element_context_runs_on_its_driver(self, provider: WaldenGolfProvider) -> None:
+        """A course-section element is passed as the root for its driver's script."""
+        from selenium.webdriver.remote.webelement import WebElement
+
+        section = MagicMock(spec=WebElement)
+        section.parent.execute_script.return_value = {"total": 0, "slots": []}
+
+        assert provider._find_empty_slots(section) == []
+        args = section.parent.execute_script.call_args.args
+        assert args[1] is section
+        assert args[6] == provider.MAX_PLAYERS  # min spots defaults to a full group
+
+    def test_slot_item_time_comes_from_one_text_read(self, provider: WaldenGolfProvider) -> None:
+        """The item's textContent is read once; no per-descendant lookups."""
+        item = MagicMock()
+        item.get_attribute.return_value = "\n  Northgate\n  07:46 AM\n  Available Reserve"
+
+        assert provider._extract_time_from_slot_item(item) == time(7, 46)
+        item.get_attribute.assert_called_once_with("textContent")
+        item.find_element.assert_not_called()
+        item.find_elements.assert_not_called()
+
+    def test_slot_item_time_accepts_24_hour_text(self, provider: WaldenGolfProvider) -> None:
+        """A sheet without AM/PM suffixes still yields the slot's time."""
+        item = MagicMock()
+        item.get_attribute.return_value = "Tee 14:06 Available"
+
+        assert provider._extract_time_from_slot_item(item) == time(14, 6)
+
+    def test_slot_item_time_survives_glued_text_content(self, provider: WaldenGolfProvider) -> None:
+        """textContent runs the label into the next element; the PM is still read."""
+        item = MagicMock()
+        item.get_attribute.return_value = "Northgate1:30 PMAvailableReserve"
+
+        assert provider._extract_time_from_slot_item(item) == time(13, 30)
+
+    def test_slot_item_24_hour_time_survives_glued_text_content(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """A 24-hour label glued to the next element's text is still found."""
+        item = MagicMock()
+        item.get_attribute.return_value = "Tee14:06Available"
+
+        assert provider._extract_time_from_slot_item(item) == time(14, 6)
+
+    def test_failure_diagnostics_share_one_slot_item_query(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """Event blocks and blocked reasons walk the same queried list of items."""
+        context = MagicMock()
+        context.find_elements.return_value = []
+
+        provider._extract_event_blocks(context, time(9, 0), 32)
+        provider._extract_blocked_slot_reasons(context, time(9, 0), 32)
+        provider._find_slot_by_time(context, time(9, 0))
+        assert context.find_elements.call_count == 1
+
+        provider._invalidate_slot_items(context)
+        provider._find_slot_by_time(context, time(9, 0))
+        assert context.find_elements.call_count == 2
+
+    def test_slot_items_are_cached_per_driver(self, provider: WaldenGolfProvider) -> None:
+        """Parallel sessions keep their own sheets; one invalidating leaves the other's."""
+        first, second = MagicMock(), MagicMock()
+        first.find_elements.return_value = []
+        second.find_elements.return_value = []
+
+        provider._find_slot_by_time(first, time(9, 0))
+        provider._find_slot_by_time(second, time(9, 0))
+        provider._invalidate_slot_items(second)
+        provider._find_slot_by_time(first, time(9, 0))
+        provider._find_slot_by_time(second, time(9, 0))
+
+        assert first.find_elements.call_count == 1
+        assert second.find_elements.call_count == 2
+
+    def test_script_failure_yields_no_slots(self, provider: WaldenGolfProvider) -> None:
+        """A WebDriver error during the scan reads as an empty sheet, not a crash."""
+        driver = MagicMock()
+        driver.execute_script.side_effect = WebDriverException("gone")
+
+        assert provider._find_empty_slots(driver, min_available_spots=2) == []
+
+    def test_stops_at_first_slot_past_latest_minutes(self, provider: WaldenGolfProvider) -> None:
+        """Parsing ends at the first slot past the window; that slot is kept."""
+        driver = MagicMock()
+
+        def slot(label: str) -> dict[str, object]:
+            return {
+                "isEmpty": True,
+                "available": 4,
+                "clickable": MagicMock(),
+                "labelText": label,
+                "text": "",
+                "timeFragments": [],
+            }
+
+        driver.execute_script.return_value = {
+            "total": 4,
+            "slots": [slot("08:50 AM"), slot("09:06 AM"), slot("09:14 AM"), slot("09:22 AM")],
+        }
+
+        slots = provider._find_empty_slots(driver, min_available_spots=4, latest_minutes=9 * 60)
+
+        assert [slot_time for slot_time, _ in slots] == [time(8, 50), time(9, 6)]
+
+    def test_per_slot_debug_lines_skipped_when_debug_disabled(
+        self, provider: WaldenGolfProvider, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """No per-slot message is built when DEBUG is off for the provider logger."""
+        import app.providers.walden_provider as walden_module
+
+        caplog.set_level(logging.INFO, logger=walden_module.logger.name)
+        driver = MagicMock()
+        driver.execute_script.return_value = {
+            "total": 1,
+            "slots": [
+                {
+                    "isEmpty": True,
+                    "available": 4,
+                    "clickable": MagicMock(),
+                    "labelText": "08:50 AM",
+                    "text": "",
+                    "timeFragments": [],
+                }
+            ],
+        }
+
+        with patch.object(walden_module.logger, "debug") as mock_debug:
+            slots = provider._find_empty_slots(driver, min_available_spots=4)
+
+        assert [slot_time for slot_time, _ in slots] == [time(8, 50)]
+        mock_debug.assert_not_called()
+
+
 class TestWaldenProviderScrollToLoadAllSlots:
     def test_stops_based_on_last_parsable_time_when_trailing_items_unparsable(
         self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
@@ -433,6 +1066,7 @@ class TestWaldenProviderBatchPreScroll:
                 return None
 
         monkeypatch.setattr(walden_module, "WebDriverWait", DummyWait)
+        monkeypatch.setattr(walden_module, "_BackoffWait", DummyWait)
         monkeypatch.setattr(
             walden_module,
             "expected_conditions",
@@ -441,7 +1075,7 @@ class TestWaldenProviderBatchPreScroll:
 
         driver = MagicMock()
         monkeypatch.setattr(provider, "_create_driver", lambda: driver)
-        monkeypatch.setattr(provider, "_perform_login", lambda *_: True)
+        monkeypatch.setattr(provider, "_perform_login", lambda *_a, **_kw: True)
         monkeypatch.setattr(provider, "_select_course_sync", lambda *_: True)
         monkeypatch.setattr(provider, "_select_date_sync", lambda *_: True)
 
@@ -482,9 +1116,61 @@ class TestWaldenProviderBatchPreScroll:
             for call in scroll_mock.mock_calls
         )
 
+    def test_each_prescroll_reaches_the_latest_remaining_window(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The cap shrinks to the widest window among the bookings still to make."""
+        import app.providers.walden_provider as walden_module
+        from app.providers.base import BatchBookingRequest
 
-class TestWaldenProviderBookingVerification:
-    """Tests for booking success verification logic."""
+        monkeypatch.setattr(settings, "walden_fast_booking_batch", False)
+        monkeypatch.setattr(walden_module, "WebDriverWait", MagicMock())
+        monkeypatch.setattr(provider, "_page_wait", lambda _d: MagicMock())
+        monkeypatch.setattr(provider, "_create_driver", lambda: MagicMock())
+        monkeypatch.setattr(provider, "_perform_login", lambda *_a, **_kw: True)
+        monkeypatch.setattr(provider, "_select_course_sync", lambda *_: True)
+        monkeypatch.setattr(provider, "_select_date_sync", lambda *_: True)
+        scroll_mock = MagicMock()
+        monkeypatch.setattr(provider, "_scroll_to_load_all_slots", scroll_mock)
+        monkeypatch.setattr(
+            provider,
+            "_find_and_book_time_slot_sync",
+            lambda _d, target_time, *_a, **_kw: SimpleNamespace(
+                success=True, booked_time=target_time, confirmation_number="X"
+            ),
+        )
+
+        provider._book_multiple_tee_times_sync(
+            target_date=date.today(),
+            requests=[
+                BatchBookingRequest(
+                    booking_id="a",
+                    target_time=time(8, 0),
+                    num_players=4,
+                    fallback_window_minutes=120,
+                ),
+                BatchBookingRequest(
+                    booking_id="b",
+                    target_time=time(8, 30),
+                    num_players=4,
+                    fallback_window_minutes=60,
+                ),
+                BatchBookingRequest(
+                    booking_id="c",
+                    target_time=time(8, 50),
+                    num_players=4,
+                    fallback_window_minutes=0,
+                ),
+            ],
+            execute_at=None,
+        )
+
+        caps = [c.kwargs.get("max_time_minutes_override") for c in scroll_mock.mock_calls]
+        assert caps == [10 * 60, 9 * 60 + 30, 8 * 60 + 50]
+
+
+class TestWaldenProviderBookingVerification:
+    """Tests for booking success verification logic."""
 
     def test_verify_success_with_successfully(self, provider: WaldenGolfProvider) -> None:
         """Test that 'successfully' indicator returns True."""
@@ -493,6 +1179,56 @@ class TestWaldenProviderBookingVerification:
         result = provider._verify_booking_success(mock_driver)
         assert result is True
 
+    def test_course_verification_reads_body_text_in_one_script_call(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """The course name is checked in-page; only a boolean comes back."""
+        import app.providers.walden_provider as walden_module
+
+        mock_driver = MagicMock()
+        mock_driver.execute_script.return_value = True
+
+        assert provider._verify_course_selection(mock_driver, "Northgate") is True
+        mock_driver.execute_script.assert_called_once_with(
+            walden_module._JS_BODY_TEXT_CONTAINS, "northgate"
+        )
+        mock_driver.find_element.assert_not_called()
+        mock_driver.find_elements.assert_not_called()
+
+    def test_course_verification_falls_back_to_body_text(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """If the in-page check cannot run, the body text is read and searched."""
+        import app.providers.walden_provider as walden_module
+
+        def execute_script(script: str, *_args: object) -> object:
+            if script == walden_module._JS_BODY_TEXT_CONTAINS:
+                raise WebDriverException("script error")
+            return "Tee Times\nNorthgate\n7:00 AM"
+
+        mock_driver = MagicMock()
+        mock_driver.execute_script.side_effect = execute_script
+
+        assert provider._verify_course_selection(mock_driver, "Northgate") is True
+        mock_driver.execute_script.assert_called_with(walden_module._JS_BODY_TEXT)
+
+    def test_course_verification_searches_hidden_text_in_one_script_call(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """A course named only in non-rendered text is found without an XPath scan."""
+        import app.providers.walden_provider as walden_module
+
+        mock_driver = MagicMock()
+        mock_driver.execute_script.side_effect = lambda script, *_a: (
+            script == walden_module._JS_DOCUMENT_TEXT_CONTAINS
+        )
+
+        assert provider._verify_course_selection(mock_driver, "Northgate") is True
+        mock_driver.execute_script.assert_called_with(
+            walden_module._JS_DOCUMENT_TEXT_CONTAINS, "northgate"
+        )
+        mock_driver.find_elements.assert_not_called()
+
     def test_verify_success_with_confirmed(self, provider: WaldenGolfProvider) -> None:
         """Test that 'confirmed' indicator returns True."""
         mock_driver = MagicMock()
@@ -534,6 +1270,38 @@ class TestWaldenProviderBookingVerification:
         result = provider._verify_booking_success(mock_driver)
         assert result is True
 
+    def test_verify_reads_body_text_in_one_script_call(self, provider: WaldenGolfProvider) -> None:
+        """Rendered body text comes from one script call; page_source is not fetched."""
+        mock_driver = MagicMock()
+        mock_driver.execute_script.return_value = "Your tee time was successfully booked!"
+        type(mock_driver).page_source = property(
+            lambda _self: pytest.fail("page_source should not be read")
+        )
+
+        assert provider._verify_booking_success(mock_driver) is True
+        mock_driver.find_element.assert_not_called()
+
+    def test_outcome_checks_use_the_text_they_are_given(self, provider: WaldenGolfProvider) -> None:
+        """Text read once after a booking serves every outcome check, with no re-read."""
+        mock_driver = MagicMock()
+        text = "Reservation confirmed. Confirmation #: ABC123"
+
+        assert provider._extract_confirmation_number(mock_driver, text) == "ABC123"
+        assert provider._verify_booking_success(mock_driver, text) is True
+        mock_driver.execute_script.assert_not_called()
+
+    def test_outcome_checks_read_the_page_each_time_without_text(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """Without text handed in, each check reads the page as it is now."""
+        mock_driver = MagicMock()
+        mock_driver.execute_script.return_value = "Reservation confirmed. Confirmation #: ABC123"
+        assert provider._verify_booking_success(mock_driver) is True
+
+        mock_driver.execute_script.return_value = "This time slot is unavailable."
+        assert provider._verify_booking_success(mock_driver) is False
+        assert mock_driver.execute_script.call_count == 2
+
     def test_verify_failure_with_unavailable(self, provider: WaldenGolfProvider) -> None:
         """Test that 'unavailable' indicator returns False."""
         mock_driver = MagicMock()
@@ -689,6 +1457,186 @@ class TestWaldenProviderCancellation:
         )
         assert result is True
 
+    def test_verify_cancellation_messages_checked_in_browser(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """The indicator scan runs as one script; page_source is never pulled."""
+        driver = MagicMock()
+        type(driver).page_source = property(lambda _self: pytest.fail("page_source read"))
+        driver.execute_script.return_value = {
+            "formFound": True,
+            "verdict": "fail",
+            "indicator": "unable to cancel",
+        }
+
+        assert provider._verify_cancellation_success(driver) is False
+        driver.find_element.assert_not_called()
+
+        driver.execute_script.return_value = {
+            "formFound": False,
+            "verdict": "ok",
+            "indicator": "reservation cancelled",
+        }
+        assert provider._verify_cancellation_success(driver) is True
+
+    def test_verify_row_removal_reads_form_rows_in_one_script_call(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """The removal check reuses the row scan instead of reading each row."""
+        driver = MagicMock()
+        driver.execute_script.side_effect = [
+            {"formFound": True, "verdict": "unknown", "indicator": ""},
+            {"formFound": True, "texts": ["12/20/2025 - Tee Time - 9:00 AM"]},
+        ]
+
+        assert (
+            provider._verify_cancellation_success(
+                driver, target_date="12/16/2025", target_time="3:22 PM"
+            )
+            is True
+        )
+        driver.find_element.assert_not_called()
+
+        driver.execute_script.side_effect = [
+            {"formFound": True, "verdict": "unknown", "indicator": ""},
+            {"formFound": False, "texts": []},
+        ]
+        assert (
+            provider._verify_cancellation_success(
+                driver, target_date="12/16/2025", target_time="3:22 PM"
+            )
+            is False
+        )
+
+    def test_cancel_matches_and_tags_the_row_in_one_script_call(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """Matching, tagging and the cancel control all come from a single script."""
+        import app.providers.walden_provider as walden_module
+
+        driver = MagicMock()
+        our_cancel = MagicMock()
+        driver.execute_script.return_value = {
+            "formFound": True,
+            "rowCount": 2,
+            "text": "12/16/2025 - Tee Time - 2:22 PM",
+            "cancel": our_cancel,
+            "missing": 0,
+        }
+
+        with patch.object(
+            provider, "_confirm_cancellation_sync", return_value=True
+        ) as mock_confirm:
+            assert provider._find_and_cancel_reservation_sync(driver, "2025-12-16_14:22") is True
+
+        driver.execute_script.assert_called_once()
+        script, *args = driver.execute_script.call_args.args
+        assert script == walden_module._JS_FIND_RESERVATION_TO_CANCEL
+        assert args[4] == ["12/16/2025", "12/16/25"]
+        assert re.search(args[5], "12/16/2025 Tee Time 2:22 PM", re.IGNORECASE)
+        assert not re.search(args[5], "12/16/2025 Tee Time 12:22 PM", re.IGNORECASE)
+        driver.find_elements.assert_not_called()
+        our_cancel.click.assert_called_once()
+        mock_confirm.assert_called_once_with(driver, "12/16/2025", "2:22 PM")
+
+    def test_cancel_without_a_matching_row_clicks_nothing(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """A scan with no match reports failure without falling back to per-row reads."""
+        driver = MagicMock()
+        driver.execute_script.return_value = {
+            "formFound": True,
+            "rowCount": 3,
+            "text": "",
+            "cancel": None,
+            "missing": 1,
+        }
+
+        with patch.object(provider, "_confirm_cancellation_sync") as mock_confirm:
+            assert provider._find_and_cancel_reservation_sync(driver, "2025-12-16_14:22") is False
+
+        driver.find_element.assert_not_called()
+        mock_confirm.assert_not_called()
+
+    def test_cancel_falls_back_to_per_row_lookups_when_scan_fails(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """A script error still finds the row through element lookups.
+
+        A labelled/titled cancel link is matched by one case-insensitive
+        selector query rather than by reading each link's attributes.
+        """
+        driver = MagicMock()
+        driver.execute_script.side_effect = WebDriverException("script blocked")
+        cancel_link = MagicMock()
+        row = MagicMock()
+        row.text = "12/16/2025 - Tee Time - 2:22 PM"
+        row.find_elements.side_effect = lambda _by, sel: (
+            [cancel_link] if sel == DOM.CANCELLATION.cancel_link_fallback else []
+        )
+        form = MagicMock()
+        form.find_elements.return_value = [row]
+        driver.find_element.return_value = form
+
+        with patch.object(provider, "_confirm_cancellation_sync", return_value=True):
+            assert provider._find_and_cancel_reservation_sync(driver, "2025-12-16_14:22") is True
+
+        cancel_link.click.assert_called_once()
+        cancel_link.get_attribute.assert_not_called()
+        assert row.find_elements.call_count == 2
+
+    def test_confirm_cancellation_accepts_alert_without_fixed_waits(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """An open alert is accepted straight away, then the page update is polled."""
+        from selenium.webdriver.common.alert import Alert
+
+        import app.providers.walden_provider as walden_module
+
+        provider.wait_strategy = MagicMock()
+        driver = MagicMock()
+        alert = MagicMock(spec=Alert)
+        driver.switch_to.alert = alert
+        driver.execute_script.side_effect = [False, True]
+
+        with (
+            patch("selenium.webdriver.support.wait.time.sleep"),
+            patch.object(provider, "_verify_cancellation_success", return_value=True),
+        ):
+            assert provider._confirm_cancellation_sync(driver, "12/16/2025", "2:22 PM") is True
+
+        alert.accept.assert_called_once()
+        driver.find_elements.assert_not_called()
+        assert driver.execute_script.call_count == 2
+        driver.execute_script.assert_called_with(walden_module._JS_CANCEL_SETTLED)
+        provider.wait_strategy.wait_after_action.assert_not_called()
+
+    def test_confirm_cancellation_queries_each_selector_kind_once(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """CSS and XPath confirm selectors are each tried as one union query."""
+        provider.wait_strategy = MagicMock()
+        driver = MagicMock()
+        type(driver.switch_to).alert = PropertyMock(side_effect=NoAlertPresentException())
+        hidden = MagicMock()
+        hidden.is_displayed.return_value = False
+        confirm = MagicMock()
+        confirm.is_displayed.return_value = True
+        driver.find_elements.side_effect = lambda by, _sel: (
+            [hidden, confirm] if by == By.XPATH else []
+        )
+
+        with patch.object(provider, "_verify_cancellation_success", return_value=True):
+            assert provider._confirm_cancellation_sync(driver, "12/16/2025", "2:22 PM") is True
+
+        assert driver.find_elements.call_args_list == [
+            ((By.CSS_SELECTOR, ", ".join(DOM.CANCELLATION.confirm_css)),),
+            ((By.XPATH, " | ".join(DOM.CANCELLATION.confirm_xpaths)),),
+        ]
+        driver.find_element.assert_not_called()
+        confirm.click.assert_called_once()
+        hidden.click.assert_not_called()
+
 
 class TestWaldenProviderCalendarNavigation:
     """Tests for calendar date selection and month navigation logic."""
@@ -771,6 +1719,37 @@ class TestWaldenProviderCalendarNavigation:
         assert month == 1  # January
         assert year == 2026
 
+    def test_calendar_headers_are_read_in_one_query(self, provider: WaldenGolfProvider) -> None:
+        """The header selectors go out as one grouped query, not one per selector."""
+        import app.providers.walden_provider as walden_module
+
+        mock_driver = MagicMock()
+        mock_driver.find_elements.side_effect = lambda by, selector: (
+            [MagicMock(text=""), MagicMock(text="March 2026")]
+            if selector == walden_module._CALENDAR_HEADER_SELECTOR
+            else []
+        )
+
+        assert provider._get_calendar_current_month(mock_driver) == (3, 2026)
+        queried = [c.args[1] for c in mock_driver.find_elements.call_args_list]
+        assert queried[-1] == walden_module._CALENDAR_HEADER_SELECTOR
+        assert len(queried) == 3
+
+    def test_calendar_header_parsing_skips_headers_that_are_not_a_month(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """Only "<month name> <year>" headers count, full or abbreviated, any case."""
+        import app.providers.walden_provider as walden_module
+
+        mock_driver = MagicMock()
+        mock_driver.find_elements.side_effect = lambda by, selector: (
+            [MagicMock(text="Week 2026"), MagicMock(text=" sep 2026 ")]
+            if selector == walden_module._CALENDAR_HEADER_SELECTOR
+            else []
+        )
+
+        assert provider._get_calendar_current_month(mock_driver) == (9, 2026)
+
     def test_get_calendar_current_month_returns_none_when_not_found(
         self, provider: WaldenGolfProvider
     ) -> None:
@@ -859,6 +1838,8 @@ class TestWaldenProviderCalendarNavigation:
             return []
 
         mock_driver.find_elements.side_effect = find_elements_side_effect
+        # No scripts: the arrow comes from the per-selector walk
+        mock_driver.execute_script.side_effect = WebDriverException("scripts unavailable")
 
         # Mock that we're on January 2026, need to go to February
         with patch.object(provider, "_get_calendar_current_month", return_value=(1, 2026)):
@@ -886,6 +1867,8 @@ class TestWaldenProviderCalendarNavigation:
             return []
 
         mock_driver.find_elements.side_effect = find_elements_side_effect
+        # No scripts: the arrow comes from the per-selector walk
+        mock_driver.execute_script.side_effect = WebDriverException("scripts unavailable")
 
         # Mock that we're on January 2026, need to go back to December 2025
         with patch.object(provider, "_get_calendar_current_month", return_value=(1, 2026)):
@@ -895,6 +1878,202 @@ class TestWaldenProviderCalendarNavigation:
             # Should have clicked prev once (Jan 2026 -> Dec 2025)
             assert mock_prev_button.click.call_count >= 1
 
+    def test_arrow_navigation_waits_for_the_grid_to_redraw(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """Each click waits for the old day grid to go stale rather than sleeping."""
+        from datetime import date
+
+        import app.providers.walden_provider as walden_module
+
+        provider.wait_strategy = MagicMock()
+        mock_driver = MagicMock()
+        next_button = MagicMock()
+        day_cell = MagicMock()
+        day_cell.is_enabled.side_effect = StaleElementReferenceException("redrawn")
+
+        def find_elements_side_effect(by, selector):
+            if selector == walden_module._CALENDAR_DAY_CELL_SELECTOR:
+                return [day_cell]
+            if "next" in selector.lower():
+                return [next_button]
+            return []
+
+        mock_driver.find_elements.side_effect = find_elements_side_effect
+        mock_driver.execute_script.side_effect = WebDriverException("scripts unavailable")
+
+        with patch.object(provider, "_get_calendar_current_month", return_value=(1, 2026)):
+            assert provider._navigate_calendar_to_month(mock_driver, date(2026, 3, 1)) is True
+
+        assert next_button.click.call_count == 2
+        assert day_cell.is_enabled.call_count == 2
+        provider.wait_strategy.simple_wait.assert_not_called()
+
+    def test_arrow_fallback_picks_the_button_in_one_script_call(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """Without the async stepper, the arrow is picked in-page, not per candidate."""
+        from datetime import date
+
+        from selenium.webdriver.remote.webelement import WebElement
+
+        import app.providers.walden_provider as walden_module
+
+        provider.wait_strategy = MagicMock()
+        mock_driver = MagicMock()
+        mock_driver.find_elements.return_value = []
+        mock_driver.execute_async_script.side_effect = WebDriverException("no async scripts")
+        next_button = MagicMock(spec=WebElement)
+        next_button.is_enabled.return_value = True
+        mock_driver.execute_script.return_value = next_button
+
+        with patch.object(provider, "_get_calendar_current_month", return_value=(1, 2026)):
+            assert provider._navigate_calendar_to_month(mock_driver, date(2026, 2, 1)) is True
+
+        next_button.click.assert_called_once()
+        assert mock_driver.execute_script.call_args.args[0] == (
+            walden_module._JS_FIRST_DISPLAYED_BY_PRIORITY
+        )
+        nav_queries = [
+            c for c in mock_driver.find_elements.call_args_list if "next" in c.args[1].lower()
+        ]
+        assert nav_queries == []
+
+    def test_dropdown_probe_is_skipped_once_the_calendar_has_none(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """After one calendar without month/year selects, later navigations skip the probe."""
+        from datetime import date
+
+        import app.providers.walden_provider as walden_module
+
+        mock_driver = MagicMock()
+        mock_driver.find_elements.return_value = []
+        mock_driver.execute_async_script.return_value = {"steps": 1, "error": None}
+        dropdown_selectors = {
+            walden_module._CALENDAR_MONTH_SELECT_SELECTOR,
+            walden_module._CALENDAR_YEAR_SELECT_SELECTOR,
+        }
+
+        def probes() -> int:
+            return sum(
+                c.args[1] in dropdown_selectors for c in mock_driver.find_elements.call_args_list
+            )
+
+        with patch.object(provider, "_get_calendar_current_month", return_value=(1, 2026)):
+            assert provider._navigate_calendar_to_month(mock_driver, date(2026, 2, 1)) is True
+            assert probes() == 2
+            assert provider._navigate_calendar_to_month(mock_driver, date(2026, 2, 1)) is True
+
+        assert probes() == 2
+        assert provider._calendar_uses_dropdowns is False
+
+    def test_no_dropdowns_is_not_recorded_before_the_calendar_draws(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """A probe that finds no selects on an undrawn popup leaves the flag open."""
+        from datetime import date
+
+        mock_driver = MagicMock()
+        mock_driver.find_elements.return_value = []
+        mock_driver.execute_async_script.return_value = {"steps": 1, "error": None}
+
+        with patch.object(provider, "_get_calendar_current_month", return_value=(None, None)):
+            provider._navigate_calendar_to_month(mock_driver, date(2099, 1, 1))
+
+        assert provider._calendar_uses_dropdowns is None
+
+    def test_failed_calendar_navigation_probes_for_dropdowns_again(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """A navigation failure forgets that the calendar had no selects."""
+        from datetime import date
+
+        provider._calendar_uses_dropdowns = False
+        mock_driver = MagicMock()
+        mock_driver.find_elements.return_value = [MagicMock()]
+
+        with patch.object(provider, "_navigate_calendar_to_month", return_value=False):
+            assert provider._select_date_via_calendar_sync(mock_driver, date(2026, 3, 7)) is False
+
+        assert provider._calendar_uses_dropdowns is None
+
+    def test_arrow_steps_run_in_one_async_script(self, provider: WaldenGolfProvider) -> None:
+        """All month steps are clicked in-page; no per-step lookups from Python."""
+        from datetime import date
+
+        import app.providers.walden_provider as walden_module
+
+        mock_driver = MagicMock()
+        mock_driver.find_elements.return_value = []
+        mock_driver.execute_async_script.return_value = {"steps": 3, "error": None}
+
+        with patch.object(provider, "_get_calendar_current_month", return_value=(1, 2026)):
+            assert provider._navigate_calendar_to_month(mock_driver, date(2026, 4, 1)) is True
+
+        args = mock_driver.execute_async_script.call_args.args
+        assert args[0] == walden_module._JS_STEP_CALENDAR_MONTHS
+        assert args[1][0] == "a.ui-datepicker-next"
+        assert args[2] == 3
+        nav_queries = [
+            c for c in mock_driver.find_elements.call_args_list if "next" in c.args[1].lower()
+        ]
+        assert nav_queries == []
+
+    def test_arrow_steps_that_stop_early_fail_navigation(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """A missing arrow partway through is reported, not retried from Python."""
+        from datetime import date
+
+        mock_driver = MagicMock()
+        mock_driver.find_elements.return_value = []
+        mock_driver.execute_async_script.return_value = {
+            "steps": 1,
+            "error": "no navigation button",
+        }
+
+        with patch.object(provider, "_get_calendar_current_month", return_value=(1, 2026)):
+            assert provider._navigate_calendar_to_month(mock_driver, date(2025, 11, 1)) is False
+
+        assert mock_driver.execute_async_script.call_args.args[1][0] == "a.ui-datepicker-prev"
+
+    def test_dropdowns_skip_the_wait_for_an_unchanged_year(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """Re-selecting the shown year redraws nothing, so only the month change is waited on."""
+        from datetime import date
+
+        import app.providers.walden_provider as walden_module
+
+        provider.wait_strategy = MagicMock()
+        mock_driver = MagicMock()
+        month_elem = MagicMock()
+        month_elem.get_attribute.side_effect = ["0", "1"]
+        year_elem = MagicMock()
+        year_elem.get_attribute.return_value = "2026"
+        day_cell = MagicMock()
+        day_cell.is_enabled.side_effect = StaleElementReferenceException("redrawn")
+
+        def find_elements_side_effect(by, selector):
+            if selector == walden_module._CALENDAR_MONTH_SELECT_SELECTOR:
+                return [month_elem]
+            if selector == walden_module._CALENDAR_YEAR_SELECT_SELECTOR:
+                return [year_elem]
+            if selector == walden_module._CALENDAR_DAY_CELL_SELECTOR:
+                return [day_cell]
+            return []
+
+        mock_driver.find_elements.side_effect = find_elements_side_effect
+
+        with patch("app.providers.walden_provider.Select"):
+            assert provider._navigate_calendar_to_month(mock_driver, date(2026, 2, 1)) is True
+
+        queried = [c.args[1] for c in mock_driver.find_elements.call_args_list]
+        assert queried.count(walden_module._CALENDAR_MONTH_SELECT_SELECTOR) == 1
+        day_cell.is_enabled.assert_called_once()
+        provider.wait_strategy.simple_wait.assert_not_called()
+
     def test_navigate_calendar_fails_when_no_nav_button(self, provider: WaldenGolfProvider) -> None:
         """Test that navigation fails when no navigation button found."""
         from datetime import date
@@ -974,6 +2153,7 @@ class TestWaldenProviderCalendarNavigation:
             return []
 
         mock_driver.find_elements.side_effect = find_elements_side_effect
+        mock_driver.execute_script.return_value = None  # no matching day cell
 
         with patch.object(
             provider, "_navigate_calendar_to_month", return_value=True
@@ -983,6 +2163,26 @@ class TestWaldenProviderCalendarNavigation:
 
             mock_navigate.assert_called_once_with(mock_driver, target_date)
 
+    def test_select_date_via_calendar_finds_day_in_one_query(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """The day cell is matched and filtered in-page, then clicked."""
+        from datetime import date
+
+        mock_driver = MagicMock()
+        mock_driver.find_elements.return_value = [MagicMock()]
+        day_cell = MagicMock()
+        mock_driver.execute_script.return_value = day_cell
+        provider.wait_strategy = MagicMock()
+
+        with patch.object(provider, "_navigate_calendar_to_month", return_value=True):
+            result = provider._select_date_via_calendar_sync(mock_driver, date(2026, 2, 7))
+
+        assert result is True
+        day_cell.click.assert_called_once()
+        assert mock_driver.execute_script.call_args.args[1] == "7"
+        mock_driver.find_elements.assert_called_once()  # only the calendar trigger lookup
+
 
 class TestWaldenProviderDateSelectionFailure:
     """Tests for booking failure when date selection fails."""
@@ -1009,11 +2209,29 @@ class TestWaldenProviderDateSelectionFailure:
                         assert "Failed to select date" in result.error_message
                         assert "02/01/2026" in result.error_message
 
-    def test_book_tee_time_proceeds_on_date_selection_success(
+    def test_date_input_walk_is_skipped_when_no_input_exists(
         self, provider: WaldenGolfProvider
     ) -> None:
-        """Test that booking proceeds when date selection succeeds."""
-        from datetime import date, time
+        """One grouped lookup rules out every date input before the calendar path."""
+        from datetime import date
+
+        mock_driver = MagicMock()
+        mock_driver.find_elements.return_value = []
+
+        with patch.object(
+            provider, "_select_date_via_calendar_sync", return_value=True
+        ) as mock_calendar:
+            assert provider._select_date_sync(mock_driver, date(2026, 2, 1)) is True
+
+        mock_calendar.assert_called_once()
+        mock_driver.find_element.assert_not_called()
+        mock_driver.find_elements.assert_called_once()
+
+    def test_book_tee_time_proceeds_on_date_selection_success(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """Test that booking proceeds when date selection succeeds."""
+        from datetime import date, time
 
         from app.providers.base import BookingResult
 
@@ -1149,9 +2367,34 @@ class TestPlayerCountModalScoping:
             result = provider._select_player_count_sync(mock_driver, 4)
 
         assert result is True
-        player_count_group.find_element.assert_called()
+        player_radio = player_count_group.find_elements.return_value[0]
+        clicked = mock_driver.execute_script.call_args.args[1]
+        assert clicked is player_radio.find_element.return_value
         time_period_filter.find_element.assert_not_called()
 
+    def test_select_player_count_reports_driver_errors_as_failure(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """A WebDriver fault during selection is a failed selection, not a crash."""
+        mock_driver = MagicMock()
+        mock_driver.find_elements.side_effect = WebDriverException("session hiccup")
+        provider.wait_strategy = MagicMock()
+
+        assert provider._select_player_count_sync(mock_driver, 4) is False
+
+    def test_select_player_count_surfaces_invalid_arguments(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """A malformed selector fails the same way every time, so it is raised."""
+        from selenium.common.exceptions import InvalidArgumentException
+
+        mock_driver = MagicMock()
+        mock_driver.find_elements.side_effect = InvalidArgumentException("bad selector")
+        provider.wait_strategy = MagicMock()
+
+        with pytest.raises(InvalidArgumentException):
+            provider._select_player_count_sync(mock_driver, 4)
+
     def test_complete_booking_passes_modal_as_context(self, provider: WaldenGolfProvider) -> None:
         """_complete_booking_sync captures modal element and passes it to player count selection."""
         mock_driver = MagicMock()
@@ -1160,66 +2403,881 @@ class TestPlayerCountModalScoping:
         mock_confirm_button = MagicMock()
         mock_confirm_button.text = "Book Now"
 
-        # Make the WebDriverWait return values for each .until() call:
-        # 1. element_to_be_clickable (reserve button check)
-        # 2. visibility_of_any_elements_located (modal detection - returns a list)
-        # 3+ any remaining calls (Book Now wait, url_changes, success indicators, etc.)
-        with (
-            patch("app.providers.walden_provider.WebDriverWait") as mock_wait_cls,
-            patch(
-                "app.providers.walden_provider.expected_conditions.visibility_of_any_elements_located"
-            ) as mock_visibility_any,
-        ):
-            mock_wait_instance = MagicMock()
-            mock_wait_cls.return_value = mock_wait_instance
-            modal_condition = mock_visibility_any.return_value
+        # Make the WebDriverWait return values for each .until() call:
+        # 1. element_to_be_clickable (reserve button check)
+        # 2. visibility_of_any_elements_located (modal detection - returns a list)
+        # 3+ any remaining calls (Book Now wait, url_changes, success indicators, etc.)
+        with (
+            patch("app.providers.walden_provider.WebDriverWait") as mock_wait_cls,
+            patch(
+                "app.providers.walden_provider.expected_conditions.visibility_of_any_elements_located"
+            ) as mock_visibility_any,
+        ):
+            mock_wait_instance = MagicMock()
+            mock_wait_cls.return_value = mock_wait_instance
+            modal_condition = mock_visibility_any.return_value
+
+            # Use a default return for .until() but make the second call return the modal.
+            # Asserting on the condition object (not just call order) is what catches a
+            # regression back to visibility_of_element_located, which silently passes
+            # since this mock doesn't otherwise care which predicate it was given.
+            call_count = [0]
+
+            def until_side_effect(condition, *args, **kwargs):
+                call_count[0] += 1
+                if call_count[0] == 1:
+                    return mock_reserve_element  # clickable check
+                elif call_count[0] == 2:
+                    assert condition == modal_condition
+                    return [mock_modal]  # modal detection (visible matches)
+                else:
+                    return mock_confirm_button  # all subsequent calls
+
+            mock_wait_instance.until.side_effect = until_side_effect
+
+            # Mock _select_player_count_sync to capture args and short-circuit
+            with patch.object(
+                provider, "_select_player_count_sync", return_value=False
+            ) as mock_select:
+                provider.wait_strategy = MagicMock()
+                # Also mock _capture_diagnostic_info to avoid side effects
+                # Mock _check_slot_blocked_popup to return False (no blocked popup)
+                with patch.object(provider, "_capture_diagnostic_info"):
+                    with patch.object(provider, "_check_slot_blocked_popup", return_value=False):
+                        result = provider._complete_booking_sync(
+                            mock_driver, mock_reserve_element, time(8, 26), 4
+                        )
+
+                # Player count selection was called (it returns False, so booking fails)
+                assert result.success is False
+                assert "Failed to select 4 players" in result.error_message
+
+                # The critical assertion: search_context was passed as the modal element
+                mock_select.assert_called_once()
+                call_kwargs = mock_select.call_args
+                assert call_kwargs.kwargs.get("search_context") is mock_modal
+
+                # Modal detection used the any-elements predicate (checks every
+                # match for visibility) with the booking modal locator, not just
+                # the first element in the DOM
+                mock_visibility_any.assert_called_once_with(
+                    (By.CSS_SELECTOR, DOM.BOOKING_MODAL.modal_container)
+                )
+
+
+class TestCompleteBookingClicks:
+    """Tests for the fused scroll+click round-trips in booking completion."""
+
+    def test_reserve_is_scrolled_and_clicked_in_one_call(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Reserve takes one execute_script, with no separate scroll or pause."""
+        import app.providers.walden_provider as walden_module
+
+        driver = MagicMock()
+        reserve = MagicMock()
+        provider.wait_strategy = MagicMock()
+        monkeypatch.setattr(provider, "_check_slot_blocked_popup", lambda _d: False)
+        monkeypatch.setattr(provider, "_select_player_count_sync", MagicMock(return_value=False))
+        monkeypatch.setattr(provider, "_capture_diagnostic_info", MagicMock())
+
+        with patch("app.providers.walden_provider.WebDriverWait") as mock_wait_cls:
+            mock_wait_cls.return_value.until.side_effect = [reserve, TimeoutException()]
+            provider._complete_booking_sync(driver, reserve, time(8, 26), 1)
+
+        driver.execute_script.assert_called_once_with(walden_module._JS_SCROLL_AND_CLICK, reserve)
+        mock_wait_cls.assert_called_once_with(
+            driver, 10, poll_frequency=walden_module._BOOKING_POLL_S
+        )
+
+    def test_book_now_url_comes_from_the_click_call(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The pre-click URL for the navigation wait is reported by the click script."""
+        import app.providers.walden_provider as walden_module
+
+        driver = MagicMock()
+        confirm = MagicMock()
+        driver.find_element.return_value = confirm
+        driver.execute_script.return_value = {
+            "id": "f:bookTeeTimeAction",
+            "text": "Book Now",
+            "url": "https://example.test/sheet",
+        }
+        provider.wait_strategy = MagicMock()
+        monkeypatch.setattr(provider, "_check_slot_blocked_popup", lambda _d: False)
+        monkeypatch.setattr(provider, "_select_player_count_sync", MagicMock(return_value=True))
+        monkeypatch.setattr(provider, "_verify_booking_success", lambda _d, _t=None: True)
+        monkeypatch.setattr(provider, "_extract_confirmation_number", lambda _d, _t=None: None)
+        monkeypatch.setattr(provider, "_get_visible_page_text", lambda _d: "")
+        url_changes = MagicMock()
+        monkeypatch.setattr(walden_module.expected_conditions, "url_changes", url_changes)
+
+        with patch("app.providers.walden_provider.WebDriverWait") as mock_wait_cls:
+            mock_wait_cls.return_value.until.side_effect = [TimeoutException(), confirm, True]
+            result = provider._complete_booking_sync(
+                driver, MagicMock(), time(8, 26), 1, already_clicked=True
+            )
+
+        assert result.success is True
+        driver.execute_script.assert_called_once_with(walden_module._JS_SCROLL_AND_CLICK, confirm)
+        url_changes.assert_called_once_with("https://example.test/sheet")
+
+    def test_booking_completion_keeps_its_retry(self) -> None:
+        """The retry stays on _complete_booking_sync, not on a helper it calls."""
+        assert hasattr(WaldenGolfProvider._complete_booking_sync, "__wrapped__")
+
+
+class TestDriverPool:
+    """Reuse of drivers across availability and cancellation calls."""
+
+    @staticmethod
+    def _flush_cleanup(provider: WaldenGolfProvider) -> None:
+        """Wait for every release queued on the cleanup worker so far."""
+        provider._cleanup_executor.submit(lambda: None).result()
+
+    def test_released_driver_is_reused_after_reset(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The second operation gets the first one's browser, cleared."""
+        driver = MagicMock()
+        create = MagicMock(return_value=driver)
+        monkeypatch.setattr(provider, "_create_driver", create)
+
+        first = provider._acquire_driver()
+        provider._release_driver(first)
+        second = provider._acquire_driver()
+
+        assert second is first
+        create.assert_called_once()
+        driver.delete_all_cookies.assert_called_once()
+        driver.get.assert_called_once_with("about:blank")
+        driver.quit.assert_not_called()
+
+    def test_dead_pooled_driver_is_replaced(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A browser that died while idle is quit, not handed out."""
+        dead = MagicMock()
+        type(dead).current_url = PropertyMock(side_effect=WebDriverException("gone"))
+        provider._release_driver(dead)
+        fresh = MagicMock()
+        monkeypatch.setattr(provider, "_create_driver", lambda: fresh)
+
+        assert provider._acquire_driver() is fresh
+        dead.quit.assert_called_once()
+
+    def test_failed_reset_or_full_pool_quits_driver(self, provider: WaldenGolfProvider) -> None:
+        """Only drivers that reset cleanly and fit in the pool are kept."""
+        import app.providers.walden_provider as walden_module
+
+        broken = MagicMock()
+        broken.get.side_effect = WebDriverException("unexpected alert")
+        provider._release_driver(broken)
+        broken.quit.assert_called_once()
+
+        kept = [MagicMock() for _ in range(walden_module._DRIVER_POOL_SIZE)]
+        for driver in kept:
+            provider._release_driver(driver)
+        extra = MagicMock()
+        provider._release_driver(extra)
+
+        extra.quit.assert_called_once()
+        for driver in kept:
+            driver.quit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_close_quits_idle_drivers(self, provider: WaldenGolfProvider) -> None:
+        """Pooled browsers do not outlive the provider."""
+        driver = MagicMock()
+        provider._release_driver(driver)
+
+        await provider.close()
+
+        driver.quit.assert_called_once()
+        assert provider._driver_pool.empty()
+
+    def test_availability_blocks_media_only_while_it_holds_the_driver(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Images and fonts are blocked for the check and unblocked on release."""
+        import app.providers.walden_provider as walden_module
+
+        driver = MagicMock()
+        monkeypatch.setattr(provider, "_create_driver", lambda: driver)
+
+        def login(d: MagicMock) -> bool:
+            d.execute_cdp_cmd.assert_called_with(
+                "Network.setBlockedURLs",
+                {
+                    "urls": [
+                        *walden_module._ALWAYS_BLOCKED_URL_PATTERNS,
+                        *walden_module._MEDIA_URL_PATTERNS,
+                    ]
+                },
+            )
+            return False
+
+        monkeypatch.setattr(provider, "_perform_login", login)
+
+        assert provider._get_available_times_sync(date(2026, 5, 1)) == []
+        self._flush_cleanup(provider)
+        driver.execute_cdp_cmd.assert_called_with(
+            "Network.setBlockedURLs", {"urls": list(walden_module._ALWAYS_BLOCKED_URL_PATTERNS)}
+        )
+
+    def test_page_wait_does_not_keep_its_driver_alive(self, provider: WaldenGolfProvider) -> None:
+        """A quit or discarded driver is not held onto by the provider's page waits."""
+        import gc
+        import weakref
+
+        driver = MagicMock()
+        provider._page_wait(driver).until(lambda _d: True)
+        driver_ref = weakref.ref(driver)
+
+        del driver
+        gc.collect()
+
+        assert driver_ref() is None
+
+    def test_released_or_quit_driver_drops_its_slot_items(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """Cached slot items hold their driver, so they go when the driver leaves the session."""
+        released, quit_ = MagicMock(), MagicMock()
+        for driver in (released, quit_):
+            driver.find_elements.return_value = [MagicMock(parent=driver)]
+            provider._get_slot_items(driver)
+
+        provider._release_driver(released)
+        provider._quit_driver(quit_)
+
+        assert provider._slot_items == {}
+
+    def test_page_wait_polls_faster_than_selenium_default(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A form that renders is noticed within one short poll, not half a second."""
+        import time as time_module
+
+        clock = [0.0]
+        sleeps: list[float] = []
+
+        def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        monkeypatch.setattr(time_module, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(time_module, "sleep", fake_sleep)
+        driver = MagicMock()
+        polls = MagicMock(side_effect=[NoSuchElementException(), False, driver])
+
+        assert provider._page_wait(driver).until(polls) is driver
+
+        assert [c.args for c in polls.call_args_list] == [(driver,)] * 3
+        assert sleeps == [0.05, 0.05]
+
+    def test_page_wait_times_out_after_its_limit(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A page that never renders raises TimeoutException once the limit has passed."""
+        import time as time_module
+
+        import app.providers.walden_provider as walden_module
+
+        clock = [0.0]
+
+        def fake_sleep(seconds: float) -> None:
+            clock[0] += seconds
+
+        monkeypatch.setattr(time_module, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(time_module, "sleep", fake_sleep)
+        polls = MagicMock(return_value=False)
+
+        with pytest.raises(TimeoutException, match="no form"):
+            provider._page_wait(MagicMock()).until(polls, "no form")
+
+        assert clock[0] == pytest.approx(walden_module._PAGE_WAIT_S)
+        # 20 polls at 50ms, 10 at 200ms, then 500ms ones to the limit, plus the last look
+        assert polls.call_count == 20 + 10 + 24 + 1
+
+    def test_page_wait_backs_off_on_a_slow_page(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Short polls for the first second, then longer ones while the page lags."""
+        import time as time_module
+
+        clock = [0.0]
+        sleeps: list[float] = []
+
+        def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        monkeypatch.setattr(time_module, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(time_module, "sleep", fake_sleep)
+
+        wait = provider._page_wait(MagicMock())
+        assert wait.until(lambda _d: clock[0] >= 4.0) is True
+
+        assert list(dict.fromkeys(sleeps)) == [0.05, 0.2, 0.5]
+        assert sum(1 for s in sleeps if s == 0.05) == pytest.approx(20, abs=1)
+
+    def test_cancel_returns_driver_to_pool(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Cancellation borrows a driver instead of quitting it afterwards."""
+        driver = MagicMock()
+        monkeypatch.setattr(provider, "_create_driver", lambda: driver)
+        monkeypatch.setattr(provider, "_perform_login", lambda *_: False)
+
+        assert provider._cancel_booking_sync("2025-12-16_14:22") is False
+
+        self._flush_cleanup(provider)
+        driver.quit.assert_not_called()
+        assert provider._acquire_driver() is driver
+
+    def test_booking_returns_driver_to_pool(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A booking reuses a pooled browser and hands it back afterwards."""
+        driver = MagicMock()
+        provider._release_driver(driver)
+        create = MagicMock()
+        monkeypatch.setattr(provider, "_create_driver", create)
+        monkeypatch.setattr(provider, "_perform_login", lambda *_: False)
+
+        result = provider._book_tee_time_sync(date(2026, 5, 1), time(8, 0), 4, 32)
+        self._flush_cleanup(provider)
+
+        assert result.success is False
+        create.assert_not_called()
+        driver.quit.assert_not_called()
+        assert provider._acquire_driver() is driver
+
+    def test_booking_returns_before_the_driver_is_reset(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Browser reset runs on the cleanup worker, not in the caller's latency."""
+        import threading
+
+        reset_started, let_reset_finish = threading.Event(), threading.Event()
+        driver = MagicMock()
+
+        def slow_reset() -> None:
+            reset_started.set()
+            let_reset_finish.wait(5)
+
+        driver.delete_all_cookies.side_effect = slow_reset
+        monkeypatch.setattr(provider, "_create_driver", lambda: driver)
+        monkeypatch.setattr(provider, "_perform_login", lambda *_: False)
+
+        provider._book_tee_time_sync(date(2026, 5, 1), time(8, 0), 4, 32)
+
+        assert reset_started.wait(5)
+        assert provider._driver_pool.empty()
+        let_reset_finish.set()
+        self._flush_cleanup(provider)
+        assert provider._acquire_driver() is driver
+
+    @pytest.mark.asyncio
+    async def test_close_quits_a_driver_released_just_before(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """The pool drain waits for pending releases instead of racing them."""
+        driver = MagicMock()
+        provider._release_driver_later(driver)
+
+        await provider.close()
+
+        driver.quit.assert_called_once()
+        assert provider._driver_pool.empty()
+
+    @pytest.mark.asyncio
+    async def test_warm_driver_pool_fills_pool_and_skips_failures(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Pre-starting tolerates a browser that will not launch."""
+        import app.providers.walden_provider as walden_module
+
+        started = MagicMock()
+        create = MagicMock(side_effect=[started, WebDriverException("no chrome")])
+        monkeypatch.setattr(provider, "_create_driver", create)
+        monkeypatch.setattr(walden_module, "_DRIVER_POOL_SIZE", 2)
+
+        await provider.warm_driver_pool()
+
+        assert create.call_count == 2
+        assert provider._driver_pool.qsize() == 1
+        assert provider._driver_pool.get_nowait() is started
+
+
+class TestDiagnosticCapture:
+    """Tests for failure diagnostics being persisted off the failure path."""
+
+    def test_capture_reads_driver_then_hands_off(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The driver is read synchronously; storing the artifacts is queued."""
+        executor = MagicMock()
+        monkeypatch.setattr(provider, "_diagnostic_executor", executor)
+        driver = MagicMock()
+        driver.get_screenshot_as_png.return_value = b"png"
+        driver.page_source = "<html></html>"
+
+        provider._capture_diagnostic_info(driver, "ctx")
+
+        executor.submit.assert_called_once_with(
+            provider._persist_diagnostic_info, "ctx", ANY, b"png", "<html></html>"
+        )
+
+    def test_capture_failure_queues_nothing(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A driver that can't be read is logged, not raised."""
+        executor = MagicMock()
+        monkeypatch.setattr(provider, "_diagnostic_executor", executor)
+        driver = MagicMock()
+        driver.get_screenshot_as_png.side_effect = WebDriverException("gone")
+
+        provider._capture_diagnostic_info(driver, "ctx")
+
+        executor.submit.assert_not_called()
+
+    def test_upload_failure_writes_captured_bytes_locally(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The /tmp fallback uses the captured data, never the (possibly quit) driver."""
+        monkeypatch.setenv("DEBUG_ARTIFACTS_BUCKET", "bucket")
+        monkeypatch.setattr(
+            provider, "_upload_bytes_to_gcs", MagicMock(side_effect=RuntimeError("no creds"))
+        )
+        write = MagicMock()
+        monkeypatch.setattr(provider, "_write_diagnostic_files", write)
+
+        provider._persist_diagnostic_info("ctx", "20260101_000000", b"png", "<html/>")
+
+        write.assert_called_once_with("ctx", "20260101_000000", b"png", "<html/>")
+
+    def test_write_diagnostic_files(self, provider: WaldenGolfProvider) -> None:
+        """Screenshot bytes and HTML text land in /tmp under the context name."""
+        context = f"unit_test_{os.getpid()}"
+        provider._write_diagnostic_files(context, "ts", b"\x89PNG", "<html/>")
+
+        png = Path(f"/tmp/walden_debug_{context}_ts.png")
+        html = Path(f"/tmp/walden_debug_{context}_ts.html")
+        try:
+            assert png.read_bytes() == b"\x89PNG"
+            assert html.read_text(encoding="utf-8") == "<html/>"
+        finally:
+            png.unlink(missing_ok=True)
+            html.unlink(missing_ok=True)
+
+
+class TestFirstDisplayedMatch:
+    """Tests for the union-selector element lookup used by TBD guest registration."""
+
+    def test_issues_one_union_query(self, provider: WaldenGolfProvider) -> None:
+        """All selectors go out in a single find_elements round-trip."""
+        context = MagicMock()
+        hidden, shown = MagicMock(), MagicMock()
+        hidden.is_displayed.return_value = False
+        shown.is_displayed.return_value = True
+        context.find_elements.return_value = [hidden, shown]
+
+        result = provider._first_displayed_match(context, ("a.x", "span.y"))
+
+        assert result is shown
+        context.find_elements.assert_called_once_with(By.CSS_SELECTOR, "a.x, span.y")
+
+    def test_returns_none_without_raising_when_nothing_matches(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """A miss is an empty list, not a NoSuchElementException per selector."""
+        context = MagicMock()
+        context.find_elements.return_value = []
+
+        assert provider._first_displayed_match(context, ("a.x",)) is None
+        context.find_element.assert_not_called()
+
+    def test_tbd_lookup_prefers_specific_selectors_over_generic_buttons(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """Generic command buttons are only consulted when no TBD control matched."""
+        driver = MagicMock()
+        provider.wait_strategy = MagicMock()
+        row = MagicMock()
+        tbd_link = MagicMock()
+        tbd_link.is_displayed.return_value = True
+
+        def row_find_elements(_by: str, selector: str) -> list[MagicMock]:
+            if selector == ", ".join(DOM.TBD_GUESTS.tbd_button_css):
+                return [tbd_link]
+            return [MagicMock()]
+
+        row.find_elements.side_effect = row_find_elements
+        driver.find_elements.return_value = [MagicMock(), row]
+        # The in-page click finds nothing, so the per-row lookups run
+        driver.execute_script.return_value = {"rows": 2, "clicked": None}
+
+        assert provider._add_tbd_registered_guests_sync(driver, 1) is True
+        driver.execute_script.assert_called_with("arguments[0].click();", tbd_link)
+        queried = [c.args[1] for c in row.find_elements.call_args_list]
+        assert ", ".join(DOM.TBD_GUESTS.tbd_button_generic_css) not in queried
+
+    def test_tbd_guests_are_clicked_in_page_without_row_lookups(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """Each guest's row lookup and TBD click is one script call."""
+        import app.providers.walden_provider as walden_module
+
+        driver = MagicMock()
+        provider.wait_strategy = MagicMock()
+        modal = MagicMock()
+        driver.execute_script.return_value = {"rows": 3, "clicked": "css"}
+
+        with patch.object(provider, "_wait_for_player_rows", return_value=True):
+            assert provider._add_tbd_registered_guests_sync(driver, 2, modal) is True
+
+        calls = driver.execute_script.call_args_list
+        assert [c.args[0] for c in calls] == [walden_module._JS_CLICK_TBD_IN_ROW] * 2
+        assert [(c.args[1], c.args[3]) for c in calls] == [(modal, 0), (modal, 1)]
+        modal.find_elements.assert_not_called()
+
+    def test_player_row_selector_that_matched_is_tried_first_next_time(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """Later bookings skip the selectors that missed on the first one."""
+        winner = DOM.PLAYER_COUNT.player_rows[2]
+        driver = MagicMock()
+        driver.find_elements.side_effect = lambda _by, selector: (
+            [MagicMock(), MagicMock()] if selector == winner else []
+        )
+
+        with patch.object(provider, "_wait_for_player_rows", return_value=True):
+            assert provider._verify_player_rows_appeared(driver, 2) is True
+            assert driver.find_elements.call_count == 3
+
+            driver.find_elements.reset_mock()
+            assert provider._verify_player_rows_appeared(driver, 2) is True
+
+        driver.find_elements.assert_called_once_with(By.CSS_SELECTOR, winner)
+
+    def test_player_row_selector_left_by_another_session_is_only_a_hint(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """A remembered selector that misses here still falls through to the rest."""
+        winner = DOM.PLAYER_COUNT.player_rows[2]
+        provider._player_row_selector = DOM.PLAYER_COUNT.player_rows[0]
+        driver = MagicMock()
+        driver.find_elements.side_effect = lambda _by, selector: (
+            [MagicMock(), MagicMock()] if selector == winner else []
+        )
+
+        with patch.object(provider, "_wait_for_player_rows", return_value=True):
+            assert provider._verify_player_rows_appeared(driver, 2) is True
+
+        assert provider._player_row_selector == winner
+
+    def test_player_rows_wait_returns_once_rows_appear(self, provider: WaldenGolfProvider) -> None:
+        """The row wait polls the count instead of sleeping a fixed interval."""
+        import app.providers.walden_provider as walden_module
+
+        driver = MagicMock()
+        driver.find_elements.side_effect = [[MagicMock()], [MagicMock(), MagicMock()]]
+
+        with patch("selenium.webdriver.support.wait.time.sleep") as mock_sleep:
+            assert provider._wait_for_player_rows(driver, "tr.player", 2) is True
+
+        assert driver.find_elements.call_count == 2
+        mock_sleep.assert_called_once_with(walden_module._PLAYER_ROWS_POLL_S)
+
+    def test_player_rows_wait_times_out_without_raising(self, provider: WaldenGolfProvider) -> None:
+        """A form that never renders enough rows reports False to the caller."""
+        driver = MagicMock()
+        with patch("app.providers.walden_provider.WebDriverWait") as mock_wait:
+            mock_wait.return_value.until.side_effect = TimeoutException()
+            assert provider._wait_for_player_rows(driver, "tr.player", 4) is False
+
+    def test_player_rows_wait_is_capped_at_the_old_fixed_pause(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """A form short of the expected rows costs no more than the 2s pause it replaced."""
+        driver = MagicMock()
+        with patch("app.providers.walden_provider.WebDriverWait") as mock_wait:
+            mock_wait.return_value.until.side_effect = TimeoutException()
+            provider._wait_for_player_rows(driver, "tr.player", 4)
+
+        assert mock_wait.call_args.args[1] <= 2.0
+
+    def test_priority_lookup_is_one_script_call(self, provider: WaldenGolfProvider) -> None:
+        """The course dropdown trigger search costs one round trip, not one per selector."""
+        from selenium.webdriver.remote.webelement import WebElement
+
+        import app.providers.walden_provider as walden_module
+
+        driver = MagicMock()
+        trigger = MagicMock(spec=WebElement)
+        driver.execute_script.return_value = trigger
+        selectors = walden_module._COURSE_DROPDOWN_TRIGGER_SELECTORS
+
+        assert provider._first_displayed_by_priority(driver, selectors) is trigger
+        driver.execute_script.assert_called_once_with(
+            walden_module._JS_FIRST_DISPLAYED_BY_PRIORITY, list(selectors)
+        )
+        driver.find_elements.assert_not_called()
+
+    def test_priority_lookup_falls_back_to_selector_order(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """If the script fails, earlier selectors still win over later ones."""
+        driver = MagicMock()
+        driver.execute_script.side_effect = WebDriverException("no js")
+        hidden, first, second = MagicMock(), MagicMock(), MagicMock()
+        hidden.is_displayed.return_value = False
+        driver.find_elements.side_effect = [[hidden], [first], [second]]
+
+        assert provider._first_displayed_by_priority(driver, ("a", "b", "c")) is first
+        assert driver.find_elements.call_count == 2
+
+
+class TestCourseCheckboxDropdown:
+    """Tests for configuring the course multi-select."""
+
+    def _driver(
+        self, configure_result: object, option_counts: list[int] | None = None
+    ) -> MagicMock:
+        """A driver whose trigger lookup finds a trigger and whose configure script returns."""
+        import app.providers.walden_provider as walden_module
+
+        driver = MagicMock()
+        trigger = MagicMock()
+        counts = iter(option_counts or [])
+
+        def execute_script(script: str, *args: object) -> object:
+            if script == walden_module._JS_FIRST_DISPLAYED_BY_PRIORITY:
+                return trigger
+            if script == walden_module._JS_COUNT_SHOWN_COURSE_OPTIONS:
+                return next(counts, None)
+            if script == walden_module._JS_CONFIGURE_COURSE_CHECKBOXES:
+                if isinstance(configure_result, Exception):
+                    raise configure_result
+                return configure_result
+            return None
+
+        driver.execute_script.side_effect = execute_script
+        return driver
+
+    def test_options_are_configured_in_one_script_call(self, provider: WaldenGolfProvider) -> None:
+        """No per-option lookups when the in-page configuration succeeds."""
+        import app.providers.walden_provider as walden_module
+
+        provider.wait_strategy = MagicMock()
+        driver = self._driver({"targetFound": True, "deselectFound": True, "targetChecked": True})
+
+        assert provider._select_course_via_checkbox_dropdown(
+            driver, "Northgate", "Walden on Lake Conroe"
+        )
+        queried = [c.args[1] for c in driver.find_elements.call_args_list]
+        assert queried == [walden_module._COURSE_DROPDOWN_CLOSE_SELECTOR]
+
+    def test_toggles_wait_on_rendered_options_instead_of_sleeping(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """Opening waits for more options than before; closing waits for them to go."""
+        provider.wait_strategy = MagicMock()
+        driver = self._driver(
+            {"targetFound": True, "deselectFound": True},
+            option_counts=[1, 1, 3, 3, 1],
+        )
+
+        with patch("selenium.webdriver.support.wait.time.sleep") as mock_sleep:
+            assert provider._select_course_via_checkbox_dropdown(
+                driver, "Northgate", "Walden on Lake Conroe"
+            )
+
+        assert mock_sleep.call_count == 2
+        provider.wait_strategy.simple_wait.assert_not_called()
+
+    def test_document_wide_checkbox_search_runs_once_per_course(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """Options without their own input share one sibling search per course name."""
+        driver = MagicMock()
+        sibling_checkbox = MagicMock()
+        driver.find_element.return_value = sibling_checkbox
+        option = MagicMock()
+        option.find_element.side_effect = NoSuchElementException()
+        lookups: dict[str, object] = {}
+
+        for _ in range(3):
+            found = provider._find_checkbox_in_element(driver, option, "Northgate", lookups)
+            assert found is sibling_checkbox
+
+        driver.find_element.assert_called_once()
+
+    def test_close_falls_back_to_the_trigger_without_an_exception(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """No close control closes the dropdown by toggling its trigger again."""
+        import app.providers.walden_provider as walden_module
+
+        provider.wait_strategy = MagicMock()
+        driver = self._driver({"targetFound": True, "deselectFound": True})
+        driver.find_elements.return_value = []
+
+        assert provider._select_course_via_checkbox_dropdown(
+            driver, "Northgate", "Walden on Lake Conroe"
+        )
+        trigger = driver.find_element.return_value
+        assert trigger.click.call_count == 2
+        queried = [c.args[1] for c in driver.find_elements.call_args_list]
+        assert walden_module._COURSE_DROPDOWN_CLOSE_SELECTOR in queried
+
+    def test_missing_target_reports_failure(self, provider: WaldenGolfProvider) -> None:
+        """A dropdown without the target course is not treated as configured."""
+        provider.wait_strategy = MagicMock()
+        driver = self._driver({"targetFound": False, "deselectFound": True})
+
+        assert not provider._select_course_via_checkbox_dropdown(
+            driver, "Northgate", "Walden on Lake Conroe"
+        )
+
+    def test_script_failure_falls_back_to_per_option_walk(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """The element-by-element walk still runs when the script cannot."""
+        import app.providers.walden_provider as walden_module
+
+        provider.wait_strategy = MagicMock()
+        driver = self._driver(WebDriverException("no js"))
+        option = MagicMock()
+        option.text = "Northgate"
+        option.find_element.return_value.is_selected.return_value = True
+        driver.find_elements.return_value = [option]
+
+        assert provider._select_course_via_checkbox_dropdown(
+            driver, "Northgate", "Walden on Lake Conroe"
+        )
+        driver.find_elements.assert_any_call(
+            By.CSS_SELECTOR, walden_module._COURSE_OPTION_ITEM_SELECTOR
+        )
+
+
+class TestFindRowContainer:
+    """Tests for locating an available slot span's row container."""
+
+    def test_issues_one_fused_ancestor_query(self, provider: WaldenGolfProvider) -> None:
+        """All container shapes are resolved by a single XPath round-trip."""
+        import app.providers.walden_provider as walden_module
+
+        span = MagicMock()
+        container = MagicMock()
+        span.find_elements.return_value = [container]
+
+        assert provider._find_row_container(span) is container
+        span.find_elements.assert_called_once_with(By.XPATH, walden_module._ROW_CONTAINER_XPATH)
+        span.find_element.assert_not_called()
+
+    def test_returns_none_when_no_container_matches(self, provider: WaldenGolfProvider) -> None:
+        """An unknown structure is a miss, not a walk up the parent chain."""
+        span = MagicMock()
+        span.find_elements.return_value = []
+
+        assert provider._find_row_container(span) is None
+        span.find_element.assert_not_called()
+
+    def test_returns_none_when_lookup_fails(self, provider: WaldenGolfProvider) -> None:
+        """A WebDriver error (e.g. a stale span) is treated as having no container."""
+        span = MagicMock()
+        span.find_elements.side_effect = WebDriverException("stale element")
+
+        assert provider._find_row_container(span) is None
+
+
+class TestWaldenProviderFindAvailableSlots:
+    """Tests for the batched Available-span scan in _find_available_slots."""
+
+    def test_collects_all_spans_in_one_script_call(self, provider: WaldenGolfProvider) -> None:
+        """Times and links come back from one in-page scan, sorted by time."""
+        driver = MagicMock()
+        late_link, early_link = MagicMock(), MagicMock()
+        driver.execute_script.return_value = {
+            "total": 3,
+            "rows": [
+                {"link": late_link, "timeTexts": [], "text": "09:10 AMAvailable"},
+                {"link": early_link, "timeTexts": ["07:46 AM"], "text": ""},
+                {"link": MagicMock(), "timeTexts": [], "text": "Available"},
+            ],
+        }
+
+        slots = provider._find_available_slots(driver)
+
+        assert slots == [(time(7, 46), early_link), (time(9, 10), late_link)]
+        driver.execute_script.assert_called_once()
+        driver.find_elements.assert_not_called()
+
+    def test_falls_back_to_per_element_lookups_when_script_fails(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """A failed scan falls back to resolving each span individually."""
+        driver = MagicMock()
+        driver.execute_script.side_effect = WebDriverException("script failed")
+        span, container, link = MagicMock(), MagicMock(), MagicMock()
+        span.find_elements.return_value = [container]
+        span.find_element.return_value = link
+        container.find_element.side_effect = NoSuchElementException("no time element")
+        container.get_attribute.return_value = "08:02 AM"
+        driver.find_elements.return_value = [span]
+
+        assert provider._find_available_slots(driver) == [(time(8, 2), link)]
+
+    def test_table_fallback_queries_reserve_and_available_together(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """With no div-based slots, one fused XPath finds both table control kinds."""
+        driver = MagicMock()
+        driver.execute_script.return_value = {"total": 0, "rows": []}
+        reserve, link = MagicMock(), MagicMock()
+        reserve.find_element.return_value.find_element.return_value.text = "09:06 AM"
+        link.find_element.return_value.find_element.return_value.text = "08:58 AM"
+        driver.find_elements.return_value = [reserve, link]
 
-            # Use a default return for .until() but make the second call return the modal.
-            # Asserting on the condition object (not just call order) is what catches a
-            # regression back to visibility_of_element_located, which silently passes
-            # since this mock doesn't otherwise care which predicate it was given.
-            call_count = [0]
+        slots = provider._find_available_slots(driver)
 
-            def until_side_effect(condition, *args, **kwargs):
-                call_count[0] += 1
-                if call_count[0] == 1:
-                    return mock_reserve_element  # clickable check
-                elif call_count[0] == 2:
-                    assert condition == modal_condition
-                    return [mock_modal]  # modal detection (visible matches)
-                else:
-                    return mock_confirm_button  # all subsequent calls
+        assert slots == [(time(8, 58), link), (time(9, 6), reserve)]
+        driver.find_elements.assert_called_once_with(
+            By.XPATH,
+            f"{DOM.SLOT_DISCOVERY.reserve_buttons_xpath}"
+            f" | {DOM.SLOT_DISCOVERY.available_links_xpath}",
+        )
 
-            mock_wait_instance.until.side_effect = until_side_effect
+    def test_container_time_texts_prefer_text_content(self, provider: WaldenGolfProvider) -> None:
+        """The row's textContent is parsed first; time elements are the fallback."""
+        assert provider._parse_container_time_texts(["07:30 AM"], "08:00 AM") == time(8, 0)
+        assert provider._parse_container_time_texts([""], "row 14:20 row") == time(14, 20)
+        assert provider._parse_container_time_texts(["07:30 AM"], "Available") == time(7, 30)
+        assert provider._parse_container_time_texts([], "Available") is None
 
-            # Mock _select_player_count_sync to capture args and short-circuit
-            with patch.object(
-                provider, "_select_player_count_sync", return_value=False
-            ) as mock_select:
-                provider.wait_strategy = MagicMock()
-                # Also mock _capture_diagnostic_info to avoid side effects
-                # Mock _check_slot_blocked_popup to return False (no blocked popup)
-                with patch.object(provider, "_capture_diagnostic_info"):
-                    with patch.object(provider, "_check_slot_blocked_popup", return_value=False):
-                        result = provider._complete_booking_sync(
-                            mock_driver, mock_reserve_element, time(8, 26), 4
-                        )
+    def test_extract_time_from_container_skips_probes_when_text_has_time(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """A time in textContent needs no time-element lookups."""
+        container = MagicMock()
+        container.get_attribute.return_value = "07:46 AMAvailable"
 
-                # Player count selection was called (it returns False, so booking fails)
-                assert result.success is False
-                assert "Failed to select 4 players" in result.error_message
+        assert provider._extract_time_from_container(container) == time(7, 46)
+        container.find_element.assert_not_called()
 
-                # The critical assertion: search_context was passed as the modal element
-                mock_select.assert_called_once()
-                call_kwargs = mock_select.call_args
-                assert call_kwargs.kwargs.get("search_context") is mock_modal
+    def test_extract_time_from_container_probes_time_elements_as_fallback(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """Without a time in textContent, the dedicated time elements are read."""
+        container = MagicMock()
+        container.get_attribute.return_value = "Available"
+        container.find_element.return_value.text = " 10:02 AM "
 
-                # Modal detection used the any-elements predicate (checks every
-                # match for visibility) with the booking modal locator, not just
-                # the first element in the DOM
-                mock_visibility_any.assert_called_once_with(
-                    (By.CSS_SELECTOR, DOM.BOOKING_MODAL.modal_container)
-                )
+        assert provider._extract_time_from_container(container) == time(10, 2)
 
 
 class TestWaldenProviderExtractEventBlocks:
@@ -1839,6 +3897,28 @@ class TestFindTargetSlotJS:
         northgate_index = call_args[0][7]
         assert northgate_index == "0"
 
+    def test_batch_scans_once_for_every_request(self, provider: WaldenGolfProvider) -> None:
+        """All pre-locations share one script call and come back keyed by booking id."""
+        import app.providers.walden_provider as walden_module
+
+        slot = {"hours": 8, "minutes": 42, "index": 3, "isExact": True}
+        mock_driver = MagicMock()
+        mock_driver.execute_script.return_value = {"a": slot}
+        specs = [{"bookingId": "a"}, {"bookingId": "b"}]
+
+        assert provider._find_target_slots_js_batch(mock_driver, specs) == {"a": slot}
+        mock_driver.execute_script.assert_called_once_with(
+            walden_module._JS_FIND_TARGET_SLOTS_BATCH, specs, "0", provider.MAX_PLAYERS
+        )
+
+    def test_batch_script_failure_prelocates_nothing(self, provider: WaldenGolfProvider) -> None:
+        """A failed scan leaves every request to re-scan at click time."""
+        mock_driver = MagicMock()
+        mock_driver.execute_script.side_effect = WebDriverException("boom")
+
+        assert provider._find_target_slots_js_batch(mock_driver, [{"bookingId": "a"}]) == {}
+        assert provider._find_target_slots_js_batch(mock_driver, []) == {}
+
 
 class TestClickSlotByIndexJS:
     """Tests for the JavaScript-based Reserve click method."""
@@ -1900,42 +3980,39 @@ class TestPrecisionWait:
     def test_calls_sleep_for_coarse_wait(
         self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        """Test that precision wait uses sleep for the coarse portion."""
+        """Test that precision wait sleeps most of the way and spins only at the end."""
         from datetime import datetime as real_datetime
         from unittest.mock import patch as mock_patch
         from zoneinfo import ZoneInfo
 
         import app.providers.walden_provider as walden_module
 
+        clock = [100.0]
         sleep_calls: list[float] = []
 
         def mock_sleep(seconds: float) -> None:
             sleep_calls.append(seconds)
+            clock[0] += seconds
 
-        monkeypatch.setattr(walden_module.time_module, "sleep", mock_sleep)
-
-        call_count = 0
+        def mock_perf_counter() -> float:
+            clock[0] += 0.0001
+            return clock[0]
 
-        def mock_now(tz=None):
-            nonlocal call_count
-            call_count += 1
-            if call_count <= 2:
-                # First calls: before execute_at (to trigger the wait)
-                return real_datetime(2026, 2, 12, 6, 29, 58, tzinfo=ZoneInfo("America/Chicago"))
-            # After sleep, return time past execute_at to exit busy-wait
-            return real_datetime(2026, 2, 12, 6, 30, 0, 1000, tzinfo=ZoneInfo("America/Chicago"))
+        monkeypatch.setattr(walden_module.time_module, "sleep", mock_sleep)
+        monkeypatch.setattr(walden_module.time_module, "perf_counter", mock_perf_counter)
 
         with mock_patch.object(CTDateTime, "now") as mock_ct_now:
-            mock_ct_now.side_effect = mock_now
-
+            mock_ct_now.return_value = real_datetime(
+                2026, 2, 12, 6, 29, 58, tzinfo=ZoneInfo("America/Chicago")
+            )
             execute_at = real_datetime(2026, 2, 12, 6, 30, 0)
             provider._precision_wait_until(execute_at)
 
-        # Should have called sleep once for coarse wait and micro-sleeps for busy-wait
-        assert len(sleep_calls) >= 1
-        assert sleep_calls[0] > 0  # coarse sleep is wait_seconds - 0.2
-        # Any subsequent sleep calls are the busy-wait 0.1ms micro-sleeps
-        assert all(s == 0.0001 for s in sleep_calls[1:])
+        # Now is read once; after that only the monotonic clock is consulted
+        mock_ct_now.assert_called_once()
+        assert sleep_calls[0] == pytest.approx(2.0 - walden_module._PRECISION_COARSE_MARGIN_S)
+        assert all(s == walden_module._PRECISION_SHORT_SLEEP_S for s in sleep_calls[1:])
+        assert clock[0] >= 102.0
 
 
 class TestFindAndBookFastJS:
@@ -2002,9 +4079,10 @@ class TestFindAndBookFastJS:
             5,
             4,  # driver, slot_index, num_players
         )
-        # Verify confirmation extraction and verification were called
-        provider._extract_confirmation_number.assert_called_once_with(mock_driver)
-        provider._verify_booking_success.assert_called_once_with(mock_driver)
+        # Verify confirmation extraction and verification were called on one page read
+        page_text = provider._extract_confirmation_number.call_args.args[1]
+        provider._extract_confirmation_number.assert_called_once_with(mock_driver, page_text)
+        provider._verify_booking_success.assert_called_once_with(mock_driver, page_text)
 
     def test_fast_js_returns_failure_when_no_slot(
         self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
@@ -2339,6 +4417,7 @@ class TestBatchBookingPreparation:
                 return None
 
         monkeypatch.setattr(walden_module, "WebDriverWait", DummyWait)
+        monkeypatch.setattr(walden_module, "_BackoffWait", DummyWait)
         monkeypatch.setattr(
             walden_module,
             "expected_conditions",
@@ -2347,7 +4426,7 @@ class TestBatchBookingPreparation:
 
         driver = MagicMock()
         monkeypatch.setattr(provider, "_create_driver", lambda: driver)
-        monkeypatch.setattr(provider, "_perform_login", lambda *_: True)
+        monkeypatch.setattr(provider, "_perform_login", lambda *_a, **_kw: True)
         monkeypatch.setattr(provider, "_select_course_sync", lambda *_: True)
 
         call_order: list[str] = []
@@ -2409,6 +4488,7 @@ class TestBatchBookingPreparation:
                 return None
 
         monkeypatch.setattr(walden_module, "WebDriverWait", DummyWait)
+        monkeypatch.setattr(walden_module, "_BackoffWait", DummyWait)
         monkeypatch.setattr(
             walden_module,
             "expected_conditions",
@@ -2417,7 +4497,7 @@ class TestBatchBookingPreparation:
 
         driver = MagicMock()
         monkeypatch.setattr(provider, "_create_driver", lambda: driver)
-        monkeypatch.setattr(provider, "_perform_login", lambda *_: True)
+        monkeypatch.setattr(provider, "_perform_login", lambda *_a, **_kw: True)
         monkeypatch.setattr(provider, "_select_course_sync", lambda *_: True)
         monkeypatch.setattr(provider, "_select_date_sync", lambda *_a, **_kw: True)
         monkeypatch.setattr(provider, "_scroll_to_load_all_slots", lambda *_a, **_kw: None)
@@ -2471,6 +4551,7 @@ class TestBatchBookingPreparation:
                 return None
 
         monkeypatch.setattr(walden_module, "WebDriverWait", DummyWait)
+        monkeypatch.setattr(walden_module, "_BackoffWait", DummyWait)
         monkeypatch.setattr(
             walden_module,
             "expected_conditions",
@@ -2479,7 +4560,7 @@ class TestBatchBookingPreparation:
 
         driver = MagicMock()
         monkeypatch.setattr(provider, "_create_driver", lambda: driver)
-        monkeypatch.setattr(provider, "_perform_login", lambda *_: True)
+        monkeypatch.setattr(provider, "_perform_login", lambda *_a, **_kw: True)
         monkeypatch.setattr(provider, "_select_course_sync", lambda *_: True)
         monkeypatch.setattr(provider, "_select_date_sync", lambda *_: True)
         monkeypatch.setattr(provider, "_scroll_to_load_all_slots", MagicMock())
@@ -2560,8 +4641,10 @@ class TestBatchBookingPreparation:
         an untimed batch must not pay for a pre-location pass.
         """
         monkeypatch.setattr(settings, "walden_fast_booking_batch", True)
-        prelocate = MagicMock(return_value=None)
-        self._run_batch(provider, monkeypatch, execute_at=None, find_target_slot_js=prelocate)
+        prelocate = MagicMock(return_value={})
+        self._run_batch(
+            provider, monkeypatch, execute_at=None, find_target_slots_js_batch=prelocate
+        )
 
         prelocate.assert_not_called()
 
@@ -2570,7 +4653,7 @@ class TestBatchBookingPreparation:
         provider: WaldenGolfProvider,
         monkeypatch: pytest.MonkeyPatch,
         execute_at: object,
-        find_target_slot_js: object = None,
+        find_target_slots_js_batch: object = None,
         precision_wait: object = None,
     ) -> list[bool]:
         """Drive one single-request batch and report the use_fast_js it passed."""
@@ -2585,6 +4668,7 @@ class TestBatchBookingPreparation:
                 return None
 
         monkeypatch.setattr(walden_module, "WebDriverWait", DummyWait)
+        monkeypatch.setattr(walden_module, "_BackoffWait", DummyWait)
         monkeypatch.setattr(
             walden_module,
             "expected_conditions",
@@ -2592,14 +4676,14 @@ class TestBatchBookingPreparation:
         )
 
         monkeypatch.setattr(provider, "_create_driver", lambda: MagicMock())
-        monkeypatch.setattr(provider, "_perform_login", lambda *_: True)
+        monkeypatch.setattr(provider, "_perform_login", lambda *_a, **_kw: True)
         monkeypatch.setattr(provider, "_select_course_sync", lambda *_: True)
         monkeypatch.setattr(provider, "_select_date_sync", lambda *_: True)
         monkeypatch.setattr(provider, "_scroll_to_load_all_slots", MagicMock())
         monkeypatch.setattr(
             provider,
-            "_find_target_slot_js",
-            find_target_slot_js or (lambda *_a, **_kw: None),
+            "_find_target_slots_js_batch",
+            find_target_slots_js_batch or (lambda *_a, **_kw: {}),
         )
         monkeypatch.setattr(provider, "_precision_wait_until", precision_wait or MagicMock())
 
@@ -2624,6 +4708,306 @@ class TestBatchBookingPreparation:
         )
         return fast_js_values
 
+    def test_each_booking_excludes_booked_and_strictly_later_targets(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Later targets are protected from earlier fallbacks; a tied target is not."""
+        from app.providers.base import BatchBookingRequest
+
+        monkeypatch.setattr(settings, "walden_fast_booking_batch", False)
+        monkeypatch.setattr(provider, "_page_wait", lambda _d: MagicMock())
+        monkeypatch.setattr(provider, "_create_driver", lambda: MagicMock())
+        monkeypatch.setattr(provider, "_perform_login", lambda *_a, **_kw: True)
+        monkeypatch.setattr(provider, "_select_course_sync", lambda *_: True)
+        monkeypatch.setattr(provider, "_select_date_sync", lambda *_: True)
+        monkeypatch.setattr(provider, "_scroll_to_load_all_slots", MagicMock())
+
+        excluded: list[set[time]] = []
+
+        def mock_find_and_book(
+            _driver: object, target_time: time, *_a: object, **kwargs: object
+        ) -> object:
+            excluded.append(set(kwargs["times_to_exclude"]))  # type: ignore[arg-type]
+            booked = time(target_time.hour, target_time.minute + 8)
+            return SimpleNamespace(success=True, booked_time=booked, confirmation_number="X")
+
+        monkeypatch.setattr(provider, "_find_and_book_time_slot_sync", mock_find_and_book)
+
+        provider._book_multiple_tee_times_sync(
+            target_date=date.today() + timedelta(days=7),
+            requests=[
+                BatchBookingRequest(booking_id="c", target_time=time(9, 0), num_players=4),
+                BatchBookingRequest(booking_id="a", target_time=time(8, 0), num_players=4),
+                BatchBookingRequest(booking_id="b", target_time=time(8, 0), num_players=2),
+            ],
+            execute_at=None,
+        )
+
+        assert excluded == [
+            {time(9, 0)},
+            {time(8, 8), time(9, 0)},
+            {time(8, 8)},
+        ]
+
+    def test_driver_error_fails_each_unrecorded_request_once(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Bookings already recorded keep their result; the rest fail exactly once."""
+        from app.providers.base import BatchBookingRequest
+
+        monkeypatch.setattr(settings, "walden_fast_booking_batch", False)
+        monkeypatch.setattr(provider, "_page_wait", lambda _d: MagicMock())
+        monkeypatch.setattr(provider, "_create_driver", lambda: MagicMock())
+        monkeypatch.setattr(provider, "_perform_login", lambda *_a, **_kw: True)
+        monkeypatch.setattr(provider, "_select_course_sync", lambda *_: True)
+        monkeypatch.setattr(provider, "_select_date_sync", lambda *_: True)
+        monkeypatch.setattr(provider, "_scroll_to_load_all_slots", MagicMock())
+        monkeypatch.setattr(provider, "_capture_diagnostic_info", MagicMock())
+
+        def mock_find_and_book(
+            _driver: object, target_time: time, *_a: object, **_kw: object
+        ) -> object:
+            if target_time == time(8, 0):
+                return SimpleNamespace(
+                    success=True, booked_time=target_time, confirmation_number="X"
+                )
+            raise WebDriverException("session lost")
+
+        monkeypatch.setattr(provider, "_find_and_book_time_slot_sync", mock_find_and_book)
+
+        batch = provider._book_multiple_tee_times_sync(
+            target_date=date.today() + timedelta(days=7),
+            requests=[
+                BatchBookingRequest(booking_id="a", target_time=time(8, 0), num_players=4),
+                BatchBookingRequest(booking_id="b", target_time=time(8, 10), num_players=4),
+                BatchBookingRequest(booking_id="c", target_time=time(8, 20), num_players=4),
+            ],
+            execute_at=None,
+        )
+
+        assert [r.booking_id for r in batch.results] == ["a", "b", "c"]
+        assert [r.result.success for r in batch.results] == [True, False, False]
+        assert (batch.total_succeeded, batch.total_failed) == (1, 2)
+
+    def test_empty_prelocation_does_not_end_a_timed_batch(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Before 6:30 the sheet shows no availability, so nothing pre-located is normal.
+
+        The batch must still wait for the window and attempt every booking,
+        where the click-time re-scan finds the slots once they are enabled.
+        """
+        from datetime import datetime
+
+        monkeypatch.setattr(settings, "walden_fast_booking_batch", True)
+        prelocate = MagicMock(return_value={})
+        fast_js_values = self._run_batch(
+            provider,
+            monkeypatch,
+            execute_at=datetime(2026, 2, 19, 6, 30, 0),
+            find_target_slots_js_batch=prelocate,
+        )
+
+        prelocate.assert_called_once()
+        assert fast_js_values == [True]
+
+    @pytest.mark.asyncio
+    async def test_parallel_batch_runs_one_session_per_request(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Each request gets its own session, holding back the others' targets; failures stay local."""
+        from app.providers.base import BatchBookingItemResult, BatchBookingRequest
+
+        monkeypatch.setattr(settings, "walden_parallel_batch_booking", True)
+        calls: list[tuple[str, frozenset[time]]] = []
+
+        def one_session(
+            _date: date,
+            reqs: list[BatchBookingRequest],
+            _at: object,
+            reserved: frozenset[time],
+            **_kw: object,
+        ) -> object:
+            (req,) = reqs
+            calls.append((req.booking_id, reserved))
+            if req.booking_id == "late":
+                raise RuntimeError("chrome died")
+            return SimpleNamespace(
+                results=[BatchBookingItemResult(req.booking_id, BookingResult(success=True))],
+                total_succeeded=1,
+                total_failed=0,
+            )
+
+        monkeypatch.setattr(provider, "_book_multiple_tee_times_sync", one_session)
+
+        result = await provider.book_multiple_tee_times(
+            date(2026, 5, 1),
+            [
+                BatchBookingRequest(booking_id="late", target_time=time(9, 0), num_players=4),
+                BatchBookingRequest(booking_id="early", target_time=time(8, 0), num_players=4),
+            ],
+        )
+
+        assert sorted(calls) == [
+            ("early", frozenset({time(9, 0)})),
+            ("late", frozenset({time(8, 0)})),
+        ]
+        assert [r.booking_id for r in result.results] == ["early", "late"]
+        assert (result.total_succeeded, result.total_failed) == (1, 1)
+        assert "chrome died" in (result.results[1].result.error_message or "")
+
+    @pytest.mark.asyncio
+    async def test_batch_larger_than_pool_is_split_across_pooled_sessions(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Sessions never outnumber the pooled drivers; each takes a run of the requests."""
+        import app.providers.walden_provider as walden_module
+        from app.providers.base import BatchBookingItemResult, BatchBookingRequest
+
+        monkeypatch.setattr(settings, "walden_parallel_batch_booking", True)
+        monkeypatch.setattr(walden_module, "_DRIVER_POOL_SIZE", 2)
+        calls: list[tuple[list[str], frozenset[time]]] = []
+
+        def one_session(
+            _date: date,
+            reqs: list[BatchBookingRequest],
+            _at: object,
+            reserved: frozenset[time],
+            **_kw: object,
+        ) -> object:
+            calls.append(([r.booking_id for r in reqs], reserved))
+            if reqs[0].booking_id == "d":
+                raise RuntimeError("chrome died")
+            return SimpleNamespace(
+                results=[
+                    BatchBookingItemResult(r.booking_id, BookingResult(success=True)) for r in reqs
+                ],
+                total_succeeded=len(reqs),
+                total_failed=0,
+            )
+
+        monkeypatch.setattr(provider, "_book_multiple_tee_times_sync", one_session)
+
+        result = await provider.book_multiple_tee_times(
+            date(2026, 5, 1),
+            [
+                BatchBookingRequest(booking_id=name, target_time=time(8, 10 * n), num_players=4)
+                for n, name in enumerate("abcde")
+            ],
+        )
+
+        assert sorted(calls) == [
+            (["a", "b", "c"], frozenset({time(8, 30), time(8, 40)})),
+            (["d", "e"], frozenset({time(8, 0), time(8, 10), time(8, 20)})),
+        ]
+        assert [r.booking_id for r in result.results] == ["a", "b", "c", "d", "e"]
+        assert (result.total_succeeded, result.total_failed) == (3, 2)
+        assert "chrome died" in (result.results[4].result.error_message or "")
+
+    @pytest.mark.asyncio
+    async def test_parallel_fallback_stays_off_an_earlier_sessions_target(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A later session whose window covers an earlier target does not fall back onto it."""
+        import app.providers.walden_provider as walden_module
+        from app.providers.base import BatchBookingRequest
+
+        class DummyWait:
+            def __init__(self, *_args: object, **_kwargs: object) -> None:
+                pass
+
+            def until(self, *_args: object, **_kwargs: object) -> None:
+                return None
+
+        monkeypatch.setattr(settings, "walden_parallel_batch_booking", True)
+        monkeypatch.setattr(walden_module, "WebDriverWait", DummyWait)
+        monkeypatch.setattr(walden_module, "_BackoffWait", DummyWait)
+        monkeypatch.setattr(provider, "_create_driver", MagicMock)
+        monkeypatch.setattr(provider, "_release_driver_later", MagicMock())
+        monkeypatch.setattr(provider, "_perform_login", lambda *_a, **_kw: True)
+        monkeypatch.setattr(provider, "_select_course_sync", lambda *_: True)
+        monkeypatch.setattr(provider, "_select_date_sync", lambda *_: True)
+        monkeypatch.setattr(provider, "_scroll_to_load_all_slots", MagicMock())
+        excluded: dict[time, set[time]] = {}
+
+        def book(
+            _driver: object,
+            target_time: time,
+            *_a: object,
+            times_to_exclude: set[time],
+            **_kw: object,
+        ) -> BookingResult:
+            excluded[target_time] = set(times_to_exclude)
+            return BookingResult(success=True, booked_time=target_time)
+
+        monkeypatch.setattr(provider, "_find_and_book_time_slot_sync", book)
+
+        await provider.book_multiple_tee_times(
+            date(2026, 5, 1),
+            [
+                BatchBookingRequest(booking_id="a", target_time=time(8, 0), num_players=4),
+                BatchBookingRequest(
+                    booking_id="b",
+                    target_time=time(8, 16),
+                    num_players=4,
+                    fallback_window_minutes=32,
+                ),
+            ],
+        )
+
+        assert time(8, 0) in excluded[time(8, 16)]
+        assert time(8, 16) in excluded[time(8, 0)]
+
+    @pytest.mark.asyncio
+    async def test_each_parallel_session_logs_in_on_its_own(
+        self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """No parallel session replays the cached cookies another session is using."""
+        import app.providers.walden_provider as walden_module
+        from app.providers.base import BatchBookingRequest
+
+        class DummyWait:
+            def __init__(self, *_args: object, **_kwargs: object) -> None:
+                pass
+
+            def until(self, *_args: object, **_kwargs: object) -> None:
+                return None
+
+        monkeypatch.setattr(settings, "walden_parallel_batch_booking", True)
+        monkeypatch.setattr(walden_module, "WebDriverWait", DummyWait)
+        monkeypatch.setattr(walden_module, "_BackoffWait", DummyWait)
+        monkeypatch.setattr(provider, "_create_driver", MagicMock)
+        monkeypatch.setattr(provider, "_release_driver_later", MagicMock())
+        monkeypatch.setattr(provider, "_select_course_sync", lambda *_: True)
+        monkeypatch.setattr(provider, "_select_date_sync", lambda *_: True)
+        monkeypatch.setattr(provider, "_scroll_to_load_all_slots", MagicMock())
+        monkeypatch.setattr(
+            provider,
+            "_find_and_book_time_slot_sync",
+            lambda _d, target_time, *_a, **_kw: BookingResult(
+                success=True, booked_time=target_time
+            ),
+        )
+        logins: list[tuple[object, bool]] = []
+
+        def login(driver: object, reuse_session: bool = True) -> bool:
+            logins.append((driver, reuse_session))
+            return True
+
+        monkeypatch.setattr(provider, "_perform_login", login)
+
+        await provider.book_multiple_tee_times(
+            date(2026, 5, 1),
+            [
+                BatchBookingRequest(booking_id="a", target_time=time(8, 0), num_players=4),
+                BatchBookingRequest(booking_id="b", target_time=time(9, 0), num_players=4),
+            ],
+        )
+
+        assert len(logins) == 2
+        assert len({id(driver) for driver, _ in logins}) == 2
+        assert [reuse for _, reuse in logins] == [False, False]
+
     def test_batch_booking_no_page_refresh_at_execute_at(
         self, provider: WaldenGolfProvider, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -2640,6 +5024,7 @@ class TestBatchBookingPreparation:
                 return None
 
         monkeypatch.setattr(walden_module, "WebDriverWait", DummyWait)
+        monkeypatch.setattr(walden_module, "_BackoffWait", DummyWait)
         monkeypatch.setattr(
             walden_module,
             "expected_conditions",
@@ -2648,11 +5033,11 @@ class TestBatchBookingPreparation:
 
         driver = MagicMock()
         monkeypatch.setattr(provider, "_create_driver", lambda: driver)
-        monkeypatch.setattr(provider, "_perform_login", lambda *_: True)
+        monkeypatch.setattr(provider, "_perform_login", lambda *_a, **_kw: True)
         monkeypatch.setattr(provider, "_select_course_sync", lambda *_: True)
         monkeypatch.setattr(provider, "_select_date_sync", lambda *_: True)
         monkeypatch.setattr(provider, "_scroll_to_load_all_slots", MagicMock())
-        monkeypatch.setattr(provider, "_find_target_slot_js", lambda *_a, **_kw: None)
+        monkeypatch.setattr(provider, "_find_target_slots_js_batch", lambda *_a, **_kw: {})
         monkeypatch.setattr(provider, "_precision_wait_until", MagicMock())
         monkeypatch.setattr(
             provider,
@@ -3436,6 +5821,23 @@ class TestBrowserErrorMessageExtraction:
             "on Northgate per Day"
         )
 
+    def test_containers_are_read_in_one_script_call(self, provider: WaldenGolfProvider) -> None:
+        """Markup from the batched read is pruned the same way, with no per-element calls."""
+        driver = MagicMock()
+        driver.execute_script.return_value = [
+            {"html": self.RESTRICTION_MARKUP, "text": "ignored"},
+            {"html": "", "text": "  Tee time no longer available  "},
+            {"html": self.RESTRICTION_MARKUP, "text": "ignored"},
+        ]
+
+        message = provider._extract_booking_error_message(driver)
+
+        assert message == (
+            "Restriction: Member: Sample, Member is restricted for 1 round(s) "
+            "on Northgate per Day | Tee time no longer available"
+        )
+        driver.find_elements.assert_not_called()
+
     def test_unreadable_markup_falls_back_to_the_rendered_text(
         self, provider: WaldenGolfProvider
     ) -> None:
@@ -3525,6 +5927,34 @@ class TestReservationLookup:
 
         assert provider._reservation_exists(driver, date(2026, 8, 8), time(17, 8)) is False
 
+    def test_rows_are_read_in_one_script_call(self, provider: WaldenGolfProvider) -> None:
+        """Row texts come back from the scan script, not one .text read per row."""
+        driver = MagicMock()
+        driver.execute_script.return_value = {
+            "formFound": True,
+            "texts": ["08/08/2026\tTee Time\t12:08 PM", "08/08/2026\tTee Time\t5:08 PM"],
+        }
+
+        assert provider._reservation_exists(driver, date(2026, 8, 8), time(17, 8)) is True
+        driver.find_element.return_value.find_elements.assert_not_called()
+        driver.find_elements.assert_not_called()
+
+    def test_each_row_text_is_read_once(self, provider: WaldenGolfProvider) -> None:
+        """Matching and the found-row log share one .text read per row."""
+        reads = []
+
+        class Row:
+            @property
+            def text(self) -> str:
+                reads.append(1)
+                return "08/08/2026 - Tee Time - 5:08 PM - Northgate"
+
+        driver = MagicMock()
+        driver.find_element.return_value.find_elements.return_value = [Row()]
+
+        assert provider._reservation_exists(driver, date(2026, 8, 8), time(17, 8)) is True
+        assert len(reads) == 1
+
     def test_an_unreadable_page_answers_unknown(self, provider: WaldenGolfProvider) -> None:
         """False would mean 'not booked', which is more than the page said."""
         driver = MagicMock()
@@ -3569,6 +5999,17 @@ class TestBookingTextVerdict:
         assert provider._verify_booking_success_text("Northgate tee sheet", "test") is False
         assert provider._verify_booking_success_text("Booking confirmed", "test") is True
 
+    def test_detail_lists_each_phrase_once_in_list_order(
+        self, provider: WaldenGolfProvider
+    ) -> None:
+        """Repeats and mixed case collapse to the listed phrase, in list order."""
+        confirmed, detail = provider._booking_text_verdict(
+            "UNAVAILABLE. Error! Another ERROR occurred.", "test"
+        )
+
+        assert confirmed is False
+        assert detail == "the response reported: error, unavailable"
+
 
 class TestBookingPathDefaults:
     """The shipped defaults decide which chain books a real tee time.
@@ -3636,6 +6077,7 @@ class TestImmediateBookingFastPath:
                 return None
 
         monkeypatch.setattr(walden_module, "WebDriverWait", DummyWait)
+        monkeypatch.setattr(walden_module, "_BackoffWait", DummyWait)
 
         driver = driver or MagicMock()
         monkeypatch.setattr(provider, "_create_driver", lambda: driver)